@@ -0,0 +1,104 @@
+# compares adjacency_matrix against the previous builder, which listed the states
+# as python lists and found every successor state with a binary search.
+#
+# PYTHONPATH=. python benchmarks/adjacency_matrix.py
+from siteswap._helpers._helper_functions import adjacency_matrix
+from scipy.sparse import csr_matrix
+from math import comb
+import numpy as np
+import timeit
+
+# the previous builder is too slow for bigger graphs
+MAX_STATES_LISTS = 50000
+
+def adjacency_matrix_lists(balls: int, max_throw: int) -> np.ndarray:
+    states = list(_multiset_permutations([1] * balls + [0] * (max_throw - balls)))
+    rows = []
+    cols = []
+
+    for i, state in enumerate(states):
+        a = state[1:] + [state[0]]
+
+        j = _binary_search(a, states)
+
+        rows.append(i)
+        cols.append(j)
+
+        if state[0] == 1:
+            k = max_throw - 2
+            l = max_throw - 1
+
+            for _ in range(max_throw - balls):
+                while a[k] == a[l]:
+                    k -= 1
+
+                a[k], a[l] = a[l], a[k]
+                l = k
+
+                j = _binary_search(a, states)
+
+                rows.append(i)
+                cols.append(j)
+
+    data = np.ones(len(rows), dtype=int)
+
+    return csr_matrix((data, (rows, cols)))
+
+def _binary_search(x: int, a: list[list[int]]) -> int:
+    m = 0
+    n = len(a)
+
+    # check sort order
+    if len(a) > 1 and a[0] > a[1]:
+        m, n = n, m
+
+    while True:
+        i = (m+n) // 2
+
+        if a[i] == x:
+            return i
+        elif a[i] < x:
+            m = i
+        else:
+            n = i
+
+def _multiset_permutations(a: list[int]) -> list[list[int]]:
+    a = sorted(a, reverse=True)
+
+    yield(a.copy())
+
+    n = len(a)
+    i = n - 2
+
+    while True:
+        for i in range(len(a) - 2, -2, -1):
+            if a[i] > a[i+1]:
+                j = i + 1
+                break
+
+        if i < 0:
+            break
+
+        a[i], a[j] = a[j], a[i]
+        a[j+1:] = reversed(a[j+1:])
+
+        yield a.copy()
+
+def best_of(f, *args, repeat: int = 3) -> float:
+    return min(timeit.repeat(lambda: f(*args), number=1, repeat=repeat))
+
+if __name__ == '__main__':
+    print('balls\tmax_throw\tstates\tbitmasks (s)\tlists (s)')
+
+    for balls, max_throw in [(3, 9), (5, 15), (7, 15), (3, 35), (4, 35), (5, 35), (6, 35)]:
+        states = comb(max_throw, balls)
+        new = best_of(adjacency_matrix, balls, max_throw)
+
+        if states <= MAX_STATES_LISTS:
+            old = f'{best_of(adjacency_matrix_lists, balls, max_throw):.4f}'
+
+            assert (adjacency_matrix(balls, max_throw) != adjacency_matrix_lists(balls, max_throw)).nnz == 0
+        else:
+            old = '-'
+
+        print(f'{balls}\t{max_throw}\t\t{states}\t{new:.4f}\t\t{old}')
@@ -0,0 +1,29 @@
+# compares the two search engines of all_siteswaps on a single core.
+# 'composition' goes through every sum of throws, 'state' walks the juggling state graph.
+#
+# PYTHONPATH=. python benchmarks/engines.py
+from siteswap._helpers._siteswap_cython import all_siteswaps_between, state_siteswaps_between
+import timeit
+
+# the composition engine takes minutes on bigger configurations
+MAX_SITESWAPS_COMPOSITION = 100000
+
+def best_of(f, *args, repeat: int = 3) -> float:
+    return min(timeit.repeat(lambda: f(*args), number=1, repeat=repeat))
+
+if __name__ == '__main__':
+    print('balls\tperiod\tmax_throw\tsiteswaps\tstate (s)\tcomposition (s)')
+
+    for balls, period, max_throw in [(5, 7, 12), (4, 8, 10), (3, 10, 9), (2, 12, 8), (3, 14, 7)]:
+        args = (period, balls, max_throw, 0, max_throw+1)
+        siteswaps = state_siteswaps_between(*args)
+        new = best_of(state_siteswaps_between, *args)
+
+        if len(siteswaps) <= MAX_SITESWAPS_COMPOSITION:
+            old = f'{best_of(all_siteswaps_between, *args):.4f}'
+
+            assert all_siteswaps_between(*args) == siteswaps
+        else:
+            old = '-'
+
+        print(f'{balls}\t{period}\t{max_throw}\t\t{len(siteswaps)}\t\t{new:.4f}\t\t{old}')
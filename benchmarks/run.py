@@ -0,0 +1,242 @@
+# times the generator, the counter, the state graph and the database read paths
+# over a grid of (balls, period, max_throw) and stores the results as JSON,
+# so that the timings of two commits can be compared.
+#
+# PYTHONPATH=. python benchmarks/run.py --quick
+# PYTHONPATH=. python benchmarks/run.py -o before.json
+# PYTHONPATH=. python benchmarks/run.py --compare before.json
+# PYTHONPATH=. python benchmarks/run.py --only import --check-budgets
+from siteswap import all_siteswaps, analyze_siteswaps, number_of_juggling_patterns
+from siteswap._helpers import _counting
+from siteswap._helpers._helper_functions import adjacency_matrix
+from siteswap._helpers._siteswap_cython import all_siteswaps_between
+from siteswap.database import SiteswapDB
+
+from datetime import datetime, timezone
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import timeit
+
+# (balls, period, max_throw)
+QUICK_GRID = [(3, 6, 8), (4, 7, 9), (2, 10, 7)]
+FULL_GRID = [(3, 7, 9), (4, 8, 10), (3, 10, 9), (2, 12, 8), (5, 7, 12)]
+
+# (balls, max_throw) of the state graphs
+QUICK_GRAPHS = [(3, 9), (5, 15)]
+FULL_GRAPHS = [(3, 9), (5, 15), (7, 15), (4, 35), (5, 35)]
+
+# (balls, period, max_throw, version) of the databases. version 1 files are limited to throws up to 15
+QUICK_DATABASES = [(3, 6, 8, 1), (3, 6, 8, 2)]
+FULL_DATABASES = [(3, 8, 9, 1), (3, 8, 9, 2), (4, 7, 11, 2)]
+
+# the seconds every module may take to import in a fresh interpreter, including everything it
+# imports. the lightweight paths must stay free of numpy and scipy, see siteswap.lite
+IMPORT_BUDGETS = {
+    'siteswap': 0.05,
+    'siteswap.lite': 0.05,
+    'siteswap.database': 0.5,
+    'siteswap.siteswap': 0.5,
+}
+
+def best_of(f, setup=None, repeat: int = 3) -> float:
+    return min(timeit.repeat(f, setup=setup or (lambda: None), number=1, repeat=repeat))
+
+def bench_all_siteswaps(grid: list[tuple], repeat: int):
+    for balls, period, max_throw in grid:
+        for engine in ('composition', 'state'):
+            params = {'balls': balls, 'period': period, 'max_throw': max_throw, 'engine': engine}
+            yield 'all_siteswaps', params, best_of(
+                lambda: all_siteswaps(balls, period, max_throw, workers=1, engine=engine), repeat=repeat
+            )
+            yield 'all_siteswaps(as_array)', params, best_of(
+                lambda: all_siteswaps(balls, period, max_throw, workers=1, engine=engine, as_array=True),
+                repeat=repeat
+            )
+
+def bench_leading_throws(grid: list[tuple], repeat: int):
+    for balls, period, max_throw in grid:
+        for i in range(balls+1, max_throw+1):
+            params = {'balls': balls, 'period': period, 'max_throw': max_throw, 'leading_throw': i}
+            yield 'all_siteswaps_between', params, best_of(
+                lambda: all_siteswaps_between(period, balls, max_throw, i, i+1), repeat=repeat
+            )
+
+def bench_number_of_juggling_patterns(grid: list[tuple], repeat: int):
+    for balls, period, max_throw in grid:
+        params = {'balls': balls, 'period': period, 'max_throw': max_throw}
+
+        # the counts are cached, so time counting from scratch
+        yield 'number_of_juggling_patterns', params, best_of(
+            lambda: number_of_juggling_patterns(balls, period, max_throw),
+            setup=_counting._cache.clear, repeat=repeat
+        )
+
+def bench_analyze_siteswaps(grid: list[tuple], repeat: int):
+    for balls, period, max_throw in grid:
+        params = {'balls': balls, 'period': period, 'max_throw': max_throw}
+        siteswaps = all_siteswaps(balls, period, max_throw, workers=1)
+
+        # the same patterns in another rotation
+        rotated = [s[1:] + s[0] for s in siteswaps]
+
+        yield 'analyze_siteswaps', params, best_of(lambda: analyze_siteswaps(rotated), repeat=repeat)
+
+def bench_adjacency_matrix(graphs: list[tuple], repeat: int):
+    for balls, max_throw in graphs:
+        params = {'balls': balls, 'max_throw': max_throw}
+        yield 'adjacency_matrix', params, best_of(lambda: adjacency_matrix(balls, max_throw), repeat=repeat)
+
+def bench_database(databases: list[tuple], repeat: int):
+    for balls, period, max_throw, version in databases:
+        with tempfile.TemporaryDirectory() as path, SiteswapDB(path) as db:
+            db.build(balls, max_throw, periods=range(1, period+1), workers=1, version=version)
+            n = db.count(balls, period)
+            indices = random.Random(0).choices(range(n), k=10000)
+            params = {'balls': balls, 'period': period, 'max_throw': max_throw, 'version': version}
+
+            yield 'SiteswapDB.get_siteswaps', params, best_of(
+                lambda: list(db.get_siteswaps(balls, period)), repeat=repeat
+            )
+            yield 'SiteswapDB.get_siteswaps(max_throw)', params, best_of(
+                lambda: list(db.get_siteswaps(balls, period, max_throw-1)), repeat=repeat
+            )
+            yield 'SiteswapDB.get_siteswap', params, best_of(
+                lambda: [db.get_siteswap(i, balls, period) for i in range(0, n, max(1, n // 1000))], repeat=repeat
+            )
+            yield 'SiteswapDB.get_siteswaps_by_index', params, best_of(
+                lambda: db.get_siteswaps_by_index(balls, period, indices), repeat=repeat
+            )
+            yield 'SiteswapDB.sequence.throws', params, best_of(
+                lambda: db.get_sequence(balls, period).throws(), repeat=repeat
+            )
+
+            # the same reads from a compressed copy, with a cold cache
+            db.compress(balls)
+            os.remove(db._get_filename(balls))
+            db.close()
+
+            yield 'SiteswapDB.get_siteswap(compressed)', params, best_of(
+                lambda: [db.get_siteswap(i, balls, period) for i in range(0, n, max(1, n // 1000))],
+                setup=db.close, repeat=repeat
+            )
+            yield 'SiteswapDB.get_siteswaps(compressed)', params, best_of(
+                lambda: list(db.get_siteswaps(balls, period)), setup=db.close, repeat=repeat
+            )
+
+def bench_import_time(repeat: int):
+    for module in IMPORT_BUDGETS:
+        yield 'import', {'module': module}, min(import_time(module) for _ in range(repeat))
+
+# seconds it takes to import a module in a fresh interpreter, from the
+# cumulative time that python -X importtime reports for it
+def import_time(module: str) -> float:
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True).stderr
+
+    # import time: self [us] | cumulative | imported package
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split('|')
+
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+
+    raise ValueError(f'python -X importtime did not report {module}')
+
+# prints the imports that went over their budget, and returns True if there were none
+def check_budgets(results: dict) -> bool:
+    over = [r for r in results['results'] if r['name'] == 'import' and
+            r['seconds'] > IMPORT_BUDGETS[r['params']['module']]]
+
+    for r in over:
+        print(f'import {r["params"]["module"]} took {r["seconds"]:.3f}s, '
+              f'the budget is {IMPORT_BUDGETS[r["params"]["module"]]:.3f}s')
+
+    return not over
+
+def run(quick: bool = False, repeat: int = 3, only: str = None) -> dict:
+    grid = QUICK_GRID if quick else FULL_GRID
+    graphs = QUICK_GRAPHS if quick else FULL_GRAPHS
+    databases = QUICK_DATABASES if quick else FULL_DATABASES
+
+    benchmarks = {
+        'all_siteswaps': lambda: bench_all_siteswaps(grid, repeat),
+        'all_siteswaps_between': lambda: bench_leading_throws(grid, repeat),
+        'number_of_juggling_patterns': lambda: bench_number_of_juggling_patterns(grid, repeat),
+        'analyze_siteswaps': lambda: bench_analyze_siteswaps(grid, repeat),
+        'adjacency_matrix': lambda: bench_adjacency_matrix(graphs, repeat),
+        'SiteswapDB': lambda: bench_database(databases, repeat),
+        'import': lambda: bench_import_time(repeat),
+    }
+
+    results = []
+
+    for group, benchmark in benchmarks.items():
+        if only and only not in group:
+            continue
+
+        for name, params, seconds in benchmark():
+            results.append({'name': name, 'params': params, 'seconds': seconds})
+            print(f'{name:<40}{_format_params(params):<60}{seconds:.4f}', file=sys.stderr)
+
+    return {
+        'commit': _commit(),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'quick': quick,
+        'results': results,
+    }
+
+# prints how much slower (> 1) or faster (< 1) every benchmark got
+def compare(old: dict, new: dict) -> None:
+    before = {_key(r): r['seconds'] for r in old['results']}
+
+    print(f'{old["commit"]} => {new["commit"]}')
+
+    for r in new['results']:
+        if _key(r) in before:
+            ratio = r['seconds'] / before[_key(r)] if before[_key(r)] else float('inf')
+            print(f'{r["name"]:<40}{_format_params(r["params"]):<60}{ratio:.2f}x')
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _format_params(params: dict) -> str:
+    return ' '.join(f'{k}={v}' for k, v in params.items())
+
+def _key(result: dict) -> tuple:
+    return result['name'], tuple(sorted(result['params'].items()))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the siteswap package.')
+    parser.add_argument('--quick', action='store_true', help='run a smaller grid')
+    parser.add_argument('--repeat', type=int, default=3, help='take the best of this many runs')
+    parser.add_argument('--only', help='run only the groups of benchmarks whose name contains this, e.g. SiteswapDB')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    parser.add_argument('--compare', help='compare the results against this JSON file')
+    parser.add_argument('--check-budgets', action='store_true',
+                        help='exit with an error if an import takes longer than its budget')
+    args = parser.parse_args()
+
+    results = run(args.quick, args.repeat, args.only)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+    if args.check_budgets and not check_budgets(results):
+        sys.exit(1)
@@ -30,6 +30,11 @@ setup(
         'scipy',
     ],
     ext_modules=extensions,
+    entry_points={
+        'console_scripts': [
+            'siteswap = siteswap.cli:main',
+        ],
+    },
     packages=[
         'siteswap',
         'siteswap._helpers',
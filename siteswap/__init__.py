@@ -1,2 +1,26 @@
-from . import database
-from .siteswap import *
+from .progress import *
+
+import importlib
+
+# the rest of the package is imported on first use, so that e.g. a process that only
+# looks siteswaps up with siteswap.lite doesn't pay for numpy and the compiled search
+_SUBMODULES = ('aio', 'cli', 'database', 'lite', 'siteswap')
+
+# the names of siteswap.siteswap, see its __all__
+_SITESWAP = ('all_siteswaps', 'analyze_siteswaps', 'iter_number_of_juggling_patterns_table', 'iter_siteswaps',
+             'number_of_juggling_patterns', 'number_of_juggling_patterns_table', 'random_siteswap',
+             'random_siteswaps', 'transition_matrix', 'transitions')
+
+__all__ = progress.__all__ + list(_SITESWAP)
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in _SITESWAP:
+        return getattr(importlib.import_module('.siteswap', __name__), name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_SITESWAP))
@@ -0,0 +1,6 @@
+from .cli import main
+import sys
+
+# the guard keeps worker processes that import this module from running the command again
+if __name__ == '__main__':
+    sys.exit(main())
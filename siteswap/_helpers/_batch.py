@@ -0,0 +1,86 @@
+from ._helper_functions import divisors
+from ._util_functions import INVALID_SYMBOL
+import numpy as np
+
+__all__ = ['batch_balls_dont_collide', 'batch_minimal_periods', 'batch_sort_sequences']
+
+# throws are at most 35, so 6 bits are enough for one
+BITS_PER_THROW = 6
+
+# numpy versions of the helpers in _helper_functions for an (N, period) array
+# of throws, one siteswap per row. the whole batch is handled at once, with a
+# python loop over the period at most
+
+# see _balls_dont_collide. also False for rows with an INVALID_SYMBOL
+def batch_balls_dont_collide(throws: np.ndarray) -> np.ndarray:
+    n, period = throws.shape
+    landing = (throws.astype(np.int32) + np.arange(period, dtype=np.int32)) % period
+    symbols = (throws != INVALID_SYMBOL).all(axis=1)
+
+    if period > 63:
+        # every beat gets exactly one ball if the landing beats are a permutation
+        return symbols & (np.sort(landing, axis=1) == np.arange(period)).all(axis=1)
+
+    # same with a bit for every beat
+    beats = np.bitwise_or.reduce(np.left_shift(1, landing, dtype=np.int64), axis=1)
+
+    return symbols & (beats == (1 << period) - 1)
+
+# the length of the shortest repeating part of every row, e.g. 4 for '40404040' => '40'.
+# a row that doesn't repeat has the whole period. see _substring_is_periodic
+def batch_minimal_periods(throws: np.ndarray) -> np.ndarray:
+    n, period = throws.shape
+    periods = np.full(n, period, dtype=np.int64)
+
+    # go through the divisors from the biggest so that the smallest wins
+    for d in reversed(divisors(period)[:-1]):
+        repeats = (throws == np.roll(throws, -d, axis=1)).all(axis=1)
+        periods[repeats] = d
+
+    return periods
+
+# the biggest rotation of every row, e.g. '144' => '441'. see _sort_sequence
+def batch_sort_sequences(throws: np.ndarray) -> np.ndarray:
+    n, period = throws.shape
+
+    if period * BITS_PER_THROW > 64:
+        return _batch_sort_sequences_long(throws)
+
+    # every rotation as a number with BITS_PER_THROW bits per throw. the next rotation
+    # shifts the first throw out from the left and back in from the right
+    mask = np.uint64((1 << (period * BITS_PER_THROW)) - 1)
+    bits = np.uint64(BITS_PER_THROW)
+    values = np.where(throws == INVALID_SYMBOL, 0, throws).astype(np.uint64)
+
+    key = np.zeros(n, dtype=np.uint64)
+
+    for k in range(period):
+        key = (key << bits) | values[:, k]
+
+    best = key.copy()
+    best_rotation = np.zeros(n, dtype=np.int64)
+
+    for r in range(1, period):
+        key = ((key << bits) & mask) | values[:, r-1]
+        best_rotation = np.where(key > best, r, best_rotation)
+        best = np.maximum(best, key)
+
+    return np.take_along_axis(throws, (best_rotation[:, None] + np.arange(period)) % period, axis=1)
+
+# batch_sort_sequences for periods too long for the rotations to fit into 64 bits
+def _batch_sort_sequences_long(throws: np.ndarray) -> np.ndarray:
+    n, period = throws.shape
+    rows = np.arange(n)
+    best = throws.copy()
+
+    for r in range(1, period):
+        rotation = np.roll(throws, -r, axis=1)
+
+        # compare at the first throw where the rotations differ
+        differ = rotation != best
+        first = differ.argmax(axis=1)
+        bigger = differ.any(axis=1) & (rotation[rows, first] > best[rows, first])
+
+        best[bigger] = rotation[bigger]
+
+    return best
@@ -0,0 +1,188 @@
+from ._helper_functions import adjacency_matrix
+from collections import OrderedDict
+from math import prod
+import numpy as np
+
+__all__ = ['closed_walk_counts', 'closed_walk_diagonal']
+
+# number of state graphs whose closed walk counts are kept in memory
+CACHE_SIZE = 256
+
+# number of columns of the matrix powers computed at once. bounds the memory
+# use to states * BLOCK_SIZE numbers instead of states * states
+BLOCK_SIZE = 256
+
+_cache = OrderedDict()
+_primes = []
+
+# returns the number of closed walks of length 1..max_period in the juggling state graph,
+# i.e. the traces of M ** d where M = adjacency_matrix(balls, max_throw). the counts
+# are exact python ints, and they are cached so that asking again costs nothing.
+#
+# the walks can be limited to the ones that don't throw the throws in exclude, and
+# that don't go through the state in row avoid of the matrix (see state_rank)
+def closed_walk_counts(balls: int, max_throw: int, max_period: int,
+                       exclude: frozenset = frozenset(), avoid: int = None) -> list[int]:
+    key = (balls, max_throw, frozenset(exclude), avoid)
+
+    if key in _cache and len(_cache[key]) >= max_period:
+        _cache.move_to_end(key)
+        return _cache[key][:max_period]
+
+    M = adjacency_matrix(balls, max_throw, frozenset(exclude)).astype(np.int64)
+
+    if avoid is not None:
+        from scipy.sparse import diags
+
+        # drop the edges in and out of the state
+        keep = np.ones(M.shape[0], dtype=np.int64)
+        keep[avoid] = 0
+        M = (diags(keep, dtype=np.int64) @ M @ diags(keep, dtype=np.int64)).tocsr()
+        M.eliminate_zeros()
+
+    traces = _traces(M, max_period)
+
+    if traces is None:
+        # the counts don't fit into int64. count modulo primes that are small enough
+        # not to overflow, and put the results together with the chinese remainder theorem
+        moduli = _moduli(M, max_period)
+        traces = _chinese_remainder([_traces(M, max_period, m) for m in moduli], moduli)
+
+    _cache[key] = traces
+    _cache.move_to_end(key)
+
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+    return traces
+
+# the diagonal of M ** power as exact python ints, i.e. the number of closed walks of
+# that length from every state back to itself. counted like closed_walk_counts
+def closed_walk_diagonal(M: np.ndarray, power: int) -> list[int]:
+    diagonal = _diagonal(M, power)
+
+    if diagonal is None:
+        moduli = _moduli(M, power)
+        diagonal = _chinese_remainder([_diagonal(M, power, m) for m in moduli], moduli)
+
+    return diagonal
+
+# primes whose product is bigger than the sum of the diagonal of M ** max_period.
+# every entry of M ** d is at most degree ** d
+def _moduli(M: np.ndarray, max_period: int) -> list[int]:
+    degree = max(1, int(np.diff(M.indptr).max()))
+    bound = M.shape[0] * degree ** max_period
+    moduli = []
+
+    while prod(moduli) <= bound:
+        moduli.append(_prime(len(moduli)))
+
+    return moduli
+
+def _chinese_remainder(remainders: list[list[int]], moduli: list[int]) -> list[int]:
+    N = prod(moduli)
+    coefficients = [(N // m) * pow(N // m, -1, m) for m in moduli]
+
+    return [sum(r * c for r, c in zip(rs, coefficients)) % N for rs in zip(*remainders)]
+
+# the i:th biggest prime below 2**56. the sum of up to 36 numbers below 2**56 fits into int64
+def _prime(i: int) -> int:
+    n = _primes[-1] - 2 if _primes else 2**56 - 1
+
+    while len(_primes) <= i:
+        if _is_prime(n):
+            _primes.append(n)
+        n -= 2
+
+    return _primes[i]
+
+# miller-rabin with these bases is exact for n < 3 * 10**24
+def _is_prime(n: int) -> bool:
+    bases = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+    if n < 2:
+        return False
+
+    for p in bases:
+        if n % p == 0:
+            return n == p
+
+    d = n - 1
+    r = 0
+
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+
+    for a in bases:
+        x = pow(a, d, n)
+
+        if x in (1, n - 1):
+            continue
+
+        for _ in range(r - 1):
+            x = x * x % n
+
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+# traces of M ** 1 .. M ** max_period, optionally modulo a prime. without a modulus,
+# returns None if the powers would overflow int64. the diagonal of a block is summed
+# with python ints, as a sum of BLOCK_SIZE entries can overflow
+def _traces(M: np.ndarray, max_period: int, modulus: int = None) -> list[int]:
+    traces = [0] * max_period
+
+    for d, start, diagonal in _block_diagonals(M, max_period, modulus):
+        if diagonal is None:
+            return None
+
+        traces[d] += sum(diagonal.tolist())
+
+    if modulus:
+        traces = [x % modulus for x in traces]
+
+    return traces
+
+# the diagonal of M ** power, like _traces
+def _diagonal(M: np.ndarray, power: int, modulus: int = None) -> list[int]:
+    diagonal = [0] * M.shape[0]
+
+    for d, start, block in _block_diagonals(M, power, modulus):
+        if block is None:
+            return None
+
+        if d == power - 1:
+            diagonal[start:start+len(block)] = block.tolist()
+
+    return diagonal
+
+# yields (d, start, diagonal) with the part of the diagonal of M ** (d+1) that starts from row
+# start. the successive powers are computed a block of columns at a time. without a modulus,
+# the diagonal is None if the powers would overflow int64, and nothing is yielded after it
+def _block_diagonals(M: np.ndarray, max_period: int, modulus: int = None):
+    n = M.shape[0]
+    degree = max(1, int(np.diff(M.indptr).max()))
+
+    for start in range(0, n, BLOCK_SIZE):
+        stop = min(n, start + BLOCK_SIZE)
+        rows = np.arange(start, stop)
+        cols = rows - start
+
+        V = np.zeros((n, stop - start), dtype=np.int64)
+        V[rows, cols] = 1
+
+        for d in range(max_period):
+            if not modulus and int(V.max()) * degree >= 2**63:
+                yield d, start, None
+                return
+
+            V = M @ V
+
+            if modulus:
+                V %= modulus
+
+            yield d, start, V[rows, cols]
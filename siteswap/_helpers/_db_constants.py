@@ -1,5 +1,17 @@
-__all__ = ['BYTES_PER_PATTERN', 'CHUNK_SIZE', 'HEADER_SIZE']
+__all__ = ['BLOCK_SIZE', 'BYTES_PER_PATTERN', 'CACHE_BLOCKS', 'CHUNK_SIZE', 'END_OF_HEADER_SIZE',
+           'HEADER_SIZE', 'HEADER_V2_FIXED_SIZE', 'MAX_THROW_V2']
 
 BYTES_PER_PATTERN = 8
 CHUNK_SIZE = 8192
 HEADER_SIZE = 160
+
+# version 2 headers have a variable size: HEADER_V2_FIXED_SIZE bytes,
+# 8 bytes per period and END_OF_HEADER_SIZE bytes
+END_OF_HEADER_SIZE = 16
+HEADER_V2_FIXED_SIZE = 32
+MAX_THROW_V2 = 35
+
+# version 3 files compress the patterns in blocks of BLOCK_SIZE patterns,
+# and SiteswapDB keeps the CACHE_BLOCKS most recently used blocks decompressed
+BLOCK_SIZE = 4096
+CACHE_BLOCKS = 64
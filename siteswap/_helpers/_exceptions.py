@@ -0,0 +1,6 @@
+__all__ = ['SiteswapFileException']
+
+# raised when a siteswap file is not valid. lives here instead of in siteswap.database so
+# that siteswap.lite can raise it too without importing numpy
+class SiteswapFileException(Exception):
+    pass
@@ -1,75 +1,61 @@
-from scipy.sparse import csr_matrix
+from ._notation import _balls_dont_collide, _canonical_siteswap, _sort_sequence, _substring_is_periodic, divisors
+from math import comb
 import numpy as np
 
-__all__ = ['adjacency_matrix', 'divisors', 'mobius']
+__all__ = ['adjacency_matrix', 'divisors', 'juggling_states', 'mobius', 'state_rank']
 
-# returns a sparse scipy matrix instead of the usual numpy array
-def adjacency_matrix(balls: int, max_throw: int) -> np.ndarray:
-    states = list(_multiset_permutations([1] * balls + [0] * (max_throw - balls)))
-    rows = []
-    cols = []
+# returns a sparse scipy matrix instead of the usual numpy array.
+#
+# the states are bitmasks (see juggling_states) and the row of every state is its
+# rank in the combinatorial number system, so the edges are built without searching.
+# the edges of the throws in exclude are left out
+def adjacency_matrix(balls: int, max_throw: int, exclude: frozenset = frozenset()) -> np.ndarray:
+    states = juggling_states(balls, max_throw)
+    mask = np.uint64((1 << max_throw) - 1)
+    landing = (states >> np.uint64(max_throw - 1)).astype(bool)
 
-    for i, state in enumerate(states):
-        a = state[1:] + [state[0]]
+    # every state moves one beat forward
+    shifted = (states << np.uint64(1)) & mask
 
-        j = _binary_search(a, states)
+    # no ball lands now, so the only throw is a 0
+    rows = [np.flatnonzero(~landing) if 0 not in exclude else np.array([], dtype=np.int64)]
+    cols = [shifted[rows[0]]]
 
-        rows.append(i)
-        cols.append(j)
+    # a ball lands now. it can be thrown to any beat where no other ball lands
+    throwing = np.flatnonzero(landing)
 
-        if state[0] == 1:
-            k = max_throw - 2
-            l = max_throw - 1
+    for throw in range(1, max_throw + 1):
+        if throw in exclude:
+            continue
 
-            for _ in range(max_throw - balls):
-                while a[k] == a[l]:
-                    k -= 1
-                    
-                a[k], a[l] = a[l], a[k]
-                l = k
+        bit = np.uint64(1 << (max_throw - throw))
+        free = throwing[(shifted[throwing] & bit) == 0]
 
-                j = _binary_search(a, states)
-
-                rows.append(i)
-                cols.append(j)
+        rows.append(free)
+        cols.append(shifted[free] | bit)
 
+    rows = np.concatenate(rows)
+    cols = _rank_states(np.concatenate(cols), balls, max_throw)
     data = np.ones(len(rows), dtype=int)
 
-    return csr_matrix((data, (rows, cols)))
-
-# based on the remainder check in
-# https://en.wikipedia.org/wiki/Siteswap#Validity
-def _balls_dont_collide(sequence: list[int]) -> bool:
-    period = len(sequence)
-    taken = [False] * period
-
-    for i, x in enumerate(sequence):
-        check = (x+i) % period
-        if taken[check]:
-            return False
-        taken[check] = True
-    return True
+    # scipy takes longer to import than the rest of the package, so only when it is needed
+    from scipy.sparse import csr_matrix
 
-def _binary_search(x: int, a: list[list[int]]) -> int:
-    m = 0
-    n = len(a)
+    return csr_matrix((data, (rows, cols)), shape=(len(states), len(states)))
 
-    # check sort order
-    if len(a) > 1 and a[0] > a[1]:
-        m, n = n, m
+# states of the juggling state graph as bitmasks, in the same order as the rows of
+# adjacency_matrix. bit max_throw-1-k is set if a ball lands k+1 beats from now,
+# and the states are sorted from the biggest bitmask to the smallest
+def juggling_states(balls: int, max_throw: int) -> np.ndarray:
+    # states[b] has all bitmasks of t bits with b bits set in increasing order
+    states = [np.array([0], dtype=np.uint64)] + [np.array([], dtype=np.uint64)] * balls
 
-    while True:
-        i = (m+n) // 2
+    for t in range(max_throw):
+        # the new bitmasks with the highest bit set are bigger than the old ones
+        top = np.uint64(1 << t)
+        states = [states[0]] + [np.concatenate((states[b], states[b-1] | top)) for b in range(1, balls+1)]
 
-        if a[i] == x:
-            return i
-        elif a[i] < x:
-            m = i
-        else:
-            n = i
-
-def divisors(n: int) -> list[int]:
-    return [x for x in range(1, n+1) if n % x == 0]
+    return states[balls][::-1].copy()
 
 # https://en.wikipedia.org/wiki/M%C3%B6bius_function
 def mobius(n: int) -> int:
@@ -87,27 +73,33 @@ def mobius(n: int) -> int:
     else:
         return -1
 
-def _multiset_permutations(a: list[int]) -> list[list[int]]:
-    a = sorted(a, reverse=True)
+# returns the row of every state in adjacency_matrix. the combinatorial number system
+# gives the position of a bitmask among all bitmasks with as many bits set
+def _rank_states(states: np.ndarray, balls: int, max_throw: int) -> np.ndarray:
+    ranks = np.zeros(len(states), dtype=np.int64)
+    bits_set = np.zeros(len(states), dtype=np.int64)
 
-    yield(a.copy())
+    for bit in range(max_throw):
+        is_set = ((states >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        bits_set += is_set
+        ranks += np.where(is_set, _binomials(bit, bits_set), 0)
 
-    n = len(a)
-    i = n - 2
+    # the states are sorted from the biggest to the smallest
+    return comb(max_throw, balls) - 1 - ranks
 
-    while True:
-        for i in range(len(a) - 2, -2, -1):
-            if a[i] > a[i+1]:
-                j = i + 1
-                break
+# the row in adjacency_matrix of a state given as a bitmask where bit m is set if a ball lands
+# m beats from now (the bits of juggling_states the other way around), or None if it isn't a state
+def state_rank(state: int, balls: int, max_throw: int) -> int:
+    if bin(state).count('1') != balls or state >> max_throw:
+        return None
 
-        if i < 0:
-            break
+    bitmask = sum(1 << (max_throw - 1 - m) for m in range(max_throw) if state >> m & 1)
 
-        a[i], a[j] = a[j], a[i]
-        a[j+1:] = reversed(a[j+1:])
+    return int(_rank_states(np.array([bitmask], dtype=np.uint64), balls, max_throw)[0])
 
-        yield a.copy()
+# comb(n, k) for every k
+def _binomials(n: int, k: np.ndarray) -> np.ndarray:
+    return np.array([comb(n, i) for i in range(n+2)], dtype=np.int64)[np.minimum(k, n+1)]
 
 def _prime_factors(n: int) -> list[int]:
     i = 2
@@ -121,16 +113,3 @@ def _prime_factors(n: int) -> list[int]:
     if n > 1:
         factors.append(n)
     return factors
-
-# 441 is the same siteswap as 414 and 144
-# prefer the notation with the biggest number
-def _sort_sequence(sequence: list[int]) -> list[int]:
-    permutations = [sequence[i:] + sequence[:i] for i in range(len(sequence))]
-    return max(permutations)
-
-# amazing algorithm
-# https://stackoverflow.com/a/29489919
-def _substring_is_periodic(s: str) -> bool:
-    if len(s) == 1:
-        return False
-    return (s+s).find(s, 1, -1) != -1
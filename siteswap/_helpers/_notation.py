@@ -0,0 +1,65 @@
+# the siteswap notation helpers that need nothing but the standard library, so that
+# the lightweight reader in siteswap.lite can use them without importing numpy
+
+__all__ = ['divisors', 'int_to_siteswap', 'siteswap_to_int']
+
+# jugglinglab.org siteswap notation
+# numbers 0-9 are mapped to their string representations
+# numbers 10-35 are mapped to a-z
+def int_to_siteswap(n: int) -> str:
+    if n < 0 or n > 35:
+        raise ValueError('Cannot convert to siteswap notation! Number must be between [0, 35]')
+    return '0123456789abcdefghijklmnopqrstuvwxyz'[n]
+
+def siteswap_to_int(s: str) -> int:
+    return int(s, 36)
+
+# based on the remainder check in
+# https://en.wikipedia.org/wiki/Siteswap#Validity
+def _balls_dont_collide(sequence: list[int]) -> bool:
+    period = len(sequence)
+    taken = [False] * period
+
+    for i, x in enumerate(sequence):
+        check = (x+i) % period
+        if taken[check]:
+            return False
+        taken[check] = True
+    return True
+
+def divisors(n: int) -> list[int]:
+    return [x for x in range(1, n+1) if n % x == 0]
+
+# 441 is the same siteswap as 414 and 144
+# prefer the notation with the biggest number
+def _sort_sequence(sequence: list[int]) -> list[int]:
+    permutations = [sequence[i:] + sequence[:i] for i in range(len(sequence))]
+    return max(permutations)
+
+# the form a siteswap has in all_siteswaps and in the database: the shortest repeating part,
+# rotated so that it is the biggest, e.g. '144144' => '441'. returns (siteswap, balls),
+# or None if the string is not a valid siteswap
+def _canonical_siteswap(siteswap: str) -> tuple[str, int]:
+    siteswap = siteswap.lower()
+
+    if not siteswap or not all(c in '0123456789abcdefghijklmnopqrstuvwxyz' for c in siteswap):
+        return None
+
+    throws = [siteswap_to_int(c) for c in siteswap]
+    balls, remainder = divmod(sum(throws), len(throws))
+
+    if remainder or not _balls_dont_collide(throws):
+        return None
+
+    if _substring_is_periodic(siteswap):
+        period = next(d for d in divisors(len(siteswap)) if siteswap == siteswap[:d] * (len(siteswap) // d))
+        throws = throws[:period]
+
+    return ''.join(int_to_siteswap(x) for x in _sort_sequence(throws)), balls
+
+# amazing algorithm
+# https://stackoverflow.com/a/29489919
+def _substring_is_periodic(s: str) -> bool:
+    if len(s) == 1:
+        return False
+    return (s+s).find(s, 1, -1) != -1
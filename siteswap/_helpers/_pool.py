@@ -0,0 +1,220 @@
+from collections import deque
+from contextlib import contextmanager
+from queue import Empty
+import atexit
+import os
+import threading
+import weakref
+
+__all__ = ['add_close_callback', 'check_pool', 'close_pool', 'get_events', 'get_pool', 'iter_results',
+           'pool_workers', 'private_pool', 'receive', 'remove_close_callback', 'report', 'shared_pool',
+           'subscribe', 'unsubscribe', 'wait']
+
+# how often (in seconds) a caller waiting for the results of a pool checks that it still runs
+WAIT_INTERVAL = 0.1
+
+_pool = None
+_pool_workers = 0
+
+# the workers can report back to the parent process through this queue
+# while they are still running a task, see report
+_events = None
+
+# pools that were replaced by a pool of a different size. they take no new
+# tasks, but the tasks already in them still finish, see get_pool
+_retired = []
+
+# the queue of the events of every pool, shared or private
+_pool_events = weakref.WeakKeyDictionary()
+
+# pools that have been terminated, see check_pool
+_terminated = weakref.WeakSet()
+
+# the events of the searches that are following their tasks, by search id. the workers of
+# a pool report to a single queue, so a search that reads an event of another search
+# hands it over instead of dropping it, see receive
+_inboxes = {}
+
+# get_pool and close_pool can be called from several threads
+_lock = threading.RLock()
+
+# called without arguments when the shared pool is shut down. the tasks that are still in
+# the pool never finish, so whoever is waiting for them can give up instead of hanging
+_close_callbacks = []
+
+# creating a Pool is expensive, so one pool is kept alive and shared between calls.
+# it is only recreated if a different number of workers is asked for. the old pool is
+# closed instead of terminated, so the tasks that other callers are still waiting for
+# finish in it. multiprocessing is imported with the first pool, so that importing the
+# package stays cheap
+def get_pool(workers: int = None) -> 'Pool':
+    global _events, _pool, _pool_workers
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError('number of workers must be at least 1!')
+
+    with _lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.close()
+            _retired.append(_pool)
+            _pool = None
+
+        if _pool is None:
+            from multiprocessing import Pool, Queue
+
+            _events = Queue()
+            _pool = Pool(workers, initializer=_init_worker, initargs=(_events,))
+            _pool_workers = workers
+            _pool_events[_pool] = _events
+
+        return _pool
+
+# the current pool, whatever its size. callers that run at the same time use this
+# instead of get_pool, so that they can't replace the pool under each other
+def shared_pool() -> 'Pool':
+    with _lock:
+        return _pool if _pool is not None else get_pool()
+
+def pool_workers() -> int:
+    return _pool_workers
+
+# the queue of the events reported by the workers of the pool, by default the current one
+def get_events(pool: 'Pool' = None) -> 'Queue':
+    with _lock:
+        return _pool_events.get(pool) if pool is not None else _events
+
+# a pool of its own and the queue of its events, for a search that may have to stop its
+# workers half way through a task. the pool is terminated on the way out, so stopping the
+# search early doesn't take down the shared pool and the searches running in it
+@contextmanager
+def private_pool(workers: int = None):
+    from multiprocessing import Pool, Queue
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError('number of workers must be at least 1!')
+
+    events = Queue()
+    pool = Pool(workers, initializer=_init_worker, initargs=(events,))
+    _pool_events[pool] = events
+
+    try:
+        yield pool, events
+    finally:
+        _terminated.add(pool)
+        pool.terminate()
+        pool.join()
+        events.close()
+
+# terminates the shared pool and the pools it replaced. the tasks that are still
+# in them never finish, see wait and add_close_callback
+def close_pool() -> None:
+    global _events, _pool, _pool_workers
+
+    with _lock:
+        pools = _retired + ([_pool] if _pool is not None else [])
+        _retired.clear()
+
+        for pool in pools:
+            _terminated.add(pool)
+            pool.terminate()
+            pool.join()
+
+        if _events is not None:
+            _events.close()
+
+        _events = None
+        _pool = None
+        _pool_workers = 0
+
+        callbacks = _close_callbacks[:]
+        _close_callbacks.clear()
+
+    for f in callbacks:
+        f()
+
+def add_close_callback(f) -> None:
+    with _lock:
+        _close_callbacks.append(f)
+
+def remove_close_callback(f) -> None:
+    with _lock:
+        if f in _close_callbacks:
+            _close_callbacks.remove(f)
+
+def check_pool(pool: 'Pool') -> None:
+    if pool in _terminated:
+        raise RuntimeError('The process pool was shut down')
+
+# AsyncResult.get, but raises instead of waiting forever if the pool is terminated
+def wait(pool: 'Pool', result):
+    from multiprocessing import TimeoutError
+
+    while True:
+        try:
+            return result.get(WAIT_INTERVAL)
+        except TimeoutError:
+            check_pool(pool)
+
+# the results of Pool.imap as they come, but raises instead of waiting forever if the pool is terminated
+def iter_results(pool: 'Pool', results):
+    from multiprocessing import TimeoutError
+
+    while True:
+        try:
+            yield results.next(WAIT_INTERVAL)
+        except StopIteration:
+            return
+        except TimeoutError:
+            check_pool(pool)
+
+# starts keeping the events of a search, before its tasks are submitted
+def subscribe(search_id: int) -> None:
+    _inboxes[search_id] = deque()
+
+def unsubscribe(search_id: int) -> None:
+    _inboxes.pop(search_id, None)
+
+# waits at most timeout seconds for events from the queue and returns the ones of the search,
+# without the search id. the events of the other searches are kept for them
+def receive(events: 'Queue', search_id: int, timeout: float) -> list[tuple]:
+    inbox = _inboxes[search_id]
+
+    try:
+        # don't wait if another search has already read events of this one
+        event = events.get_nowait() if inbox else events.get(timeout=timeout)
+
+        while True:
+            # the events of the searches that have finished are dropped
+            receiver = _inboxes.get(event[0])
+
+            if receiver is not None:
+                receiver.append(event[1:])
+
+            event = events.get_nowait()
+    except Empty:
+        pass
+
+    received = []
+
+    while inbox:
+        received.append(inbox.popleft())
+
+    return received
+
+# sends an event from a worker to the parent process
+def report(*event) -> None:
+    if _events is not None:
+        _events.put(event)
+
+def _init_worker(events: 'Queue') -> None:
+    global _events
+
+    _events = events
+
+atexit.register(close_pool)
@@ -2,41 +2,199 @@
 #cython: language_level=3
 import cython
 cimport cython
+from libc.string cimport memset
 
 # increase this if generating siteswaps for periods > 32
 DEF ASIZE = 32
 
+cdef char* SYMBOLS = b'0123456789abcdefghijklmnopqrstuvwxyz'
+
+# based on the remainder check in
+# https://en.wikipedia.org/wiki/Siteswap#Validity
 @cython.boundscheck(False)
-cpdef list all_siteswaps_between(int period, int balls, int max_throw, int start, int stop):
+@cython.cdivision(True)
+cdef inline bint _balls_dont_collide(int* a, int period, int* taken) noexcept nogil:
+    cdef int k
+    cdef int check
+
+    memset(taken, 0, period * sizeof(int))
+
+    for k in range(period):
+        check = (a[k] + k) % period
+        if taken[check]:
+            return False
+        taken[check] = 1
+
+    return True
+
+# a siteswap is wanted only if it is the biggest of its rotations, e.g. '441' but not '144',
+# and if it doesn't repeat a shorter pattern, e.g. '4040'. together this means that it is
+# bigger than all of its other rotations, which is checked in linear time with
+# the prenecklace test of duval's algorithm (with the order of the throws reversed)
+@cython.boundscheck(False)
+cdef inline bint _is_canonical(int* a, int period) noexcept nogil:
+    cdef int j
+    cdef int p = 1
+
+    for j in range(1, period):
+        if a[j] > a[j-p]:
+            return False
+        if a[j] < a[j-p]:
+            p = j + 1
+
+    return p == period
+
+cdef inline int _popcount(unsigned long long x) noexcept nogil:
+    cdef int n = 0
+
+    while x:
+        x &= x - 1
+        n += 1
+
+    return n
+
+# the state before the first throw of a siteswap. bit m is set if a ball
+# thrown in an earlier repetition of the pattern lands m beats from now
+@cython.boundscheck(False)
+cdef inline unsigned long long _start_state(int* a, int period) noexcept nogil:
+    cdef unsigned long long u = 0
+    cdef int j
+    cdef int land
+
+    for j in range(period):
+        land = j + a[j] - period
+
+        while land >= 0:
+            u |= 1ULL << land
+            land -= period
+
+    return u
+
+# the constraints of all_siteswaps. exclude and required are bitmasks of throws,
+# and state is a state the siteswap must go through, or -1 for any
+@cython.boundscheck(False)
+cdef inline bint _satisfies(int* a, int period, unsigned long long exclude,
+                            unsigned long long required, long long state) noexcept nogil:
+    cdef unsigned long long seen = 0
+    cdef unsigned long long u
+    cdef int k
+
+    for k in range(period):
+        seen |= 1ULL << a[k]
+
+    if seen & exclude or required & ~seen:
+        return False
+
+    if state < 0:
+        return True
+
+    u = _start_state(a, period)
+
+    for k in range(period):
+        if u == <unsigned long long>state:
+            return True
+
+        u >>= 1
+        if a[k]:
+            u |= 1ULL << (a[k] - 1)
+
+    return False
+
+# adds the siteswap in 'a' either as a string or as one byte per throw
+@cython.boundscheck(False)
+cdef inline void _add(int* a, int period, list siteswaps, bytearray packed, bint as_bytes):
+    cdef char buf[ASIZE]
+    cdef int k
+
+    if as_bytes:
+        for k in range(period):
+            buf[k] = a[k]
+        packed.extend(buf[:period])
+    else:
+        for k in range(period):
+            buf[k] = SYMBOLS[a[k]]
+        siteswaps.append(buf[:period].decode('ascii'))
+
+@cython.boundscheck(False)
+cpdef object all_siteswaps_between(int period, int balls, int max_throw, int start, int stop,
+                                   int second_start = 0, int second_stop = -1, bint packed = False,
+                                   unsigned long long exclude = 0, unsigned long long required = 0,
+                                   long long state = -1):
+    # second_start and second_stop optionally limit the second throw of the
+    # siteswaps to [second_start, second_stop). this splits the search for a
+    # single leading throw into smaller pieces.
+    #
+    # if packed is True, the siteswaps are returned as bytes with one byte per
+    # throw, e.g. b'\x04\x04\x01\x05\x03\x01', instead of as a list of strings.
+    #
+    # exclude and required are bitmasks of the throws the siteswaps can't have and must have,
+    # and state is a bitmask of a state the siteswaps must go through (bit m is set if a ball
+    # lands m beats from now), or -1 for any. they are checked before a siteswap is added
+    cdef bint split = second_start > 0 or second_stop >= 0
+
+    if split and stop - start != 1:
+        raise ValueError('second throw can only be limited for a single leading throw!')
+
+    if period > ASIZE:
+        raise ValueError(f'period must be at most {ASIZE}!')
+
+    if second_stop < 0:
+        second_stop = max_throw + 1
+
     start = max(0, start)
     stop = min(period * balls + 1, max_throw + 1, stop)
 
     if period == 1 and start <= balls and stop > balls:
-        # when period is 1, return just number of balls
-        return list('0123456789abcdefghijklmnopqrstuvwxyz'[balls])
+        # when period is 1, return just number of balls. it goes through the ground state only
+        if (exclude >> balls) & 1 or required & ~(1ULL << balls) or state >= 0 and state != (1LL << balls) - 1:
+            return b'' if packed else []
+
+        return bytes([balls]) if packed else list('0123456789abcdefghijklmnopqrstuvwxyz'[balls])
 
     if stop <= start or stop < balls + 2:
         # start / stop wrong. return an empty list
-        return []
+        return b'' if packed else []
 
-    cdef list a
-    cdef list b
+    cdef int a[ASIZE]
     cdef int i
     cdef int j
+    cdef int k
     cdef int s
     cdef int d
+    cdef int tmp
 
-    cdef bint balls_dont_collide
-    cdef int k
-    cdef int x
-    cdef int check
     cdef int taken[ASIZE]
 
-    cdef str siteswap
-
     cdef list siteswaps = []
+    cdef bytearray packed_siteswaps = bytearray()
+
+    if split:
+        # start from the smallest pattern with a second throw of second_start.
+        # same as below, but the sum is redistributed after the second throw
+        start = max(start, balls+1)
+        a[0] = start
+        a[1] = second_start
+        for k in range(2, period):
+            a[k] = 0
+        j = period - 1
 
-    if start <= balls:
+        s = period * balls - start - second_start
+
+        if s < 0:
+            return b'' if packed else []
+
+        while s != 0 and j > 1:
+            d = min(s, start-1)
+            s -= d
+            a[j] = d
+            j -= 1
+
+        # the rest goes to the second throw
+        a[1] += s
+
+        if a[1] > start or a[1] >= second_stop:
+            return b'' if packed else []
+    elif start <= balls:
         # due to cyclicity of siteswaps e.g. '144' == '414' == '441'
         # and us preferring the bigger ordering '441',
         # we don't have to check all patterns
@@ -46,10 +204,15 @@ cpdef list all_siteswaps_between(int period, int balls, int max_throw, int start
         #
         # for example if period=3 and balls=3, average is '333'.
         # then => start from '423'
-        a = [balls+1] + [balls-1] + [balls] * (period-2)
+        a[0] = balls + 1
+        a[1] = balls - 1
+        for k in range(2, period):
+            a[k] = balls
     else:
         # a more complicated case. 'start' is the first number
-        a = [start] + [0] * (period-1)
+        a[0] = start
+        for k in range(1, period):
+            a[k] = 0
         j = period - 1
 
         # the rest of the sum
@@ -68,56 +231,24 @@ cpdef list all_siteswaps_between(int period, int balls, int max_throw, int start
     j = period - 1
 
     while True:
-        # siteswap collision check
-        balls_dont_collide = True
-        taken[:] = [0] * ASIZE
-
-        for k, x in enumerate(a):
-            check = (x+k) % period
-            if taken[check] == 1:
-                balls_dont_collide = False
-                break
-            taken[check] = 1
-
-        if balls_dont_collide:
-            # cycle the siteswap until we have the biggest ordering. e.g. '144' => '441'
-            b = max([a[k:] + a[:k] for k in range(period)])
-            if a == b:
-                # it's fastest to do the next test with a string here.
-                # also we want to ultimately return the siteswap as a string
-                siteswap = ''.join(['0123456789abcdefghijklmnopqrstuvwxyz'[x] for x in a])
-                # test if this siteswap has periodic sub-patterns
-                if (siteswap+siteswap).find(siteswap, 1, -1) == -1:
-                    # all good, add
-                    siteswaps.append(siteswap)
+        if a[1] >= second_stop:
+            break
+
+        if (_balls_dont_collide(a, period, taken) and _is_canonical(a, period)
+                and _satisfies(a, period, exclude, required, state)):
+            _add(a, period, siteswaps, packed_siteswaps, packed)
 
         while a[j] > 0 and a[i] < a[0]:
             # add to i, subtract from j. e.g. '3122' => '3131'
             a[i] += 1
             a[j] -= 1
 
-            # siteswap collision check
-            balls_dont_collide = True
-            taken[:] = [0] * ASIZE
-
-            for k, x in enumerate(a):
-                check = (x+k) % period
-                if taken[check] == 1:
-                    balls_dont_collide = False
-                    break
-                taken[check] = 1
-            
-            if balls_dont_collide:
-                # cycle the siteswap until we have the biggest ordering. e.g. '144' => '441'
-                b = max([a[k:] + a[:k] for k in range(period)])
-                if a == b:
-                    # it's fastest to do the next test with a string here.
-                    # also we want to ultimately return the siteswap as a string
-                    siteswap = ''.join(['0123456789abcdefghijklmnopqrstuvwxyz'[x] for x in a])
-                    # test if this siteswap has periodic sub-patterns
-                    if (siteswap+siteswap).find(siteswap, 1, -1) == -1:
-                        # all good, add
-                        siteswaps.append(siteswap)
+            if a[1] >= second_stop:
+                return bytes(packed_siteswaps) if packed else siteswaps
+
+            if (_balls_dont_collide(a, period, taken) and _is_canonical(a, period)
+                    and _satisfies(a, period, exclude, required, state)):
+                _add(a, period, siteswaps, packed_siteswaps, packed)
 
             # if (i, j) are not the two rightmost indexes,
             # we might have to move i and j here
@@ -126,7 +257,7 @@ cpdef list all_siteswaps_between(int period, int balls, int max_throw, int start
                 j += 1
 
         # move i until we are in a spot we can increase
-        while (
+        while i >= 0 and (
             i != 0 and a[i] + 1 > a[0]
             or a[i] == max_throw
             or a[i+1] == 0
@@ -149,17 +280,337 @@ cpdef list all_siteswaps_between(int period, int balls, int max_throw, int start
         # decrease a[j] and move j back to rightmost
         a[j] -= 1
         j = period - 1
-        
+
         while i < j:
             i += 1
             # swap a[i] and a[j]
-            a[i], a[j] = a[j], a[i]
+            tmp = a[i]
+            a[i] = a[j]
+            a[j] = tmp
+            j -= 1
+
+        # move i until we are in a spot we can increase. with period 2
+        # the swap above can leave i at the last throw
+        i = min(i, period - 2)
+
+        while a[i+1] != max_throw and i != period - 2:
+            i += 1
+        # move j
+        j = i + 1
+
+    return bytes(packed_siteswaps) if packed else siteswaps
+
+@cython.boundscheck(False)
+def iter_siteswaps_between(int period, int balls, int max_throw, int start, int stop,
+                           int chunk_size = 65536, cursor = None):
+    """
+    Same search as all_siteswaps_between, but yields the results in chunks
+    of at most chunk_size siteswaps instead of building one big list.
+
+    Every chunk is yielded as a tuple (siteswaps, cursor). The cursor is the
+    (a, i, j) state of the search right after the chunk was produced and can be
+    passed back in to continue the search from there. The last chunk has a cursor of None.
+    """
+    start = max(0, start)
+    stop = min(period * balls + 1, max_throw + 1, stop)
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1!')
+
+    if period > ASIZE:
+        raise ValueError(f'period must be at most {ASIZE}!')
+
+    if period == 1:
+        if cursor is None and start <= balls and stop > balls:
+            yield ['0123456789abcdefghijklmnopqrstuvwxyz'[balls]], None
+        else:
+            yield [], None
+        return
+
+    if stop <= start or stop < balls + 2:
+        yield [], None
+        return
+
+    cdef int a[ASIZE]
+    cdef int i
+    cdef int j
+    cdef int k
+    cdef int s
+    cdef int d
+    cdef int tmp
+
+    cdef bint resume = False
+    cdef int taken[ASIZE]
+
+    cdef list siteswaps = []
+
+    if cursor is not None:
+        # continue from a saved state. the siteswap in 'a' has already been checked
+        i = cursor[1]
+        j = cursor[2]
+
+        if len(cursor[0]) != period or not 0 <= i < j < period:
+            raise ValueError('cursor does not match the period!')
+
+        for k in range(period):
+            a[k] = cursor[0][k]
+
+        resume = True
+    elif start <= balls:
+        # see all_siteswaps_between
+        a[0] = balls + 1
+        a[1] = balls - 1
+        for k in range(2, period):
+            a[k] = balls
+    else:
+        a[0] = start
+        for k in range(1, period):
+            a[k] = 0
+        j = period - 1
+        s = period * balls - start
+
+        while s != 0:
+            d = min(s, start-1)
+            s -= d
+            a[j] = d
             j -= 1
 
+    if not resume:
+        i = period - 2
+        j = period - 1
+
+    while True:
+        if not resume:
+            if _balls_dont_collide(a, period, taken) and _is_canonical(a, period):
+                _add(a, period, siteswaps, None, False)
+
+                if len(siteswaps) == chunk_size:
+                    yield siteswaps, (tuple([a[k] for k in range(period)]), i, j)
+                    siteswaps = []
+
+        resume = False
+
+        while a[j] > 0 and a[i] < a[0]:
+            # add to i, subtract from j. e.g. '3122' => '3131'
+            a[i] += 1
+            a[j] -= 1
+
+            if j != period - 1:
+                i += 1
+                j += 1
+
+            if _balls_dont_collide(a, period, taken) and _is_canonical(a, period):
+                _add(a, period, siteswaps, None, False)
+
+                if len(siteswaps) == chunk_size:
+                    # i and j have already been moved, so the
+                    # cursor continues from the inner loop condition
+                    yield siteswaps, (tuple([a[k] for k in range(period)]), i, j)
+                    siteswaps = []
+
         # move i until we are in a spot we can increase
+        while i >= 0 and (
+            i != 0 and a[i] + 1 > a[0]
+            or a[i] == max_throw
+            or a[i+1] == 0
+        ):
+            i -= 1
+
+        if i == -1:
+            break
+
+        # increase a[i]
+        a[i] += 1
+
+        if a[0] == stop:
+            break
+
+        # move j until we are in a spot we can decrease from
+        while a[j] == 0:
+            j -= 1
+
+        # decrease a[j] and move j back to rightmost
+        a[j] -= 1
+        j = period - 1
+
+        while i < j:
+            i += 1
+            # swap a[i] and a[j]
+            tmp = a[i]
+            a[i] = a[j]
+            a[j] = tmp
+            j -= 1
+
+        # move i until we are in a spot we can increase. with period 2
+        # the swap above can leave i at the last throw
+        i = min(i, period - 2)
+
         while a[i+1] != max_throw and i != period - 2:
             i += 1
         # move j
         j = i + 1
 
-    return siteswaps
+    yield siteswaps, None
+
+# whether the states before the throws of a walk include the given state
+@cython.boundscheck(False)
+cdef inline bint _visits(unsigned long long* u, int period, long long state) noexcept nogil:
+    cdef int k
+
+    for k in range(period):
+        if u[k] == <unsigned long long>state:
+            return True
+
+    return False
+
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cpdef object state_siteswaps_between(int period, int balls, int max_throw, int start, int stop,
+                                     int second_start = 0, int second_stop = -1, bint packed = False,
+                                     unsigned long long exclude = 0, unsigned long long required = 0,
+                                     long long state = -1):
+    # finds the same siteswaps as all_siteswaps_between, in the same order, but by
+    # walking the juggling state graph instead of going through every sum of throws.
+    #
+    # here a state is a bitmask where bit m is set if a ball lands m beats from now.
+    # a siteswap of period n with the leading throw i is a closed walk of length n that
+    # starts from a state where a ball lands now and no ball lands i-1 or more beats from now.
+    # the walks from each such state are searched depth first, and a walk is cut short as soon as
+    # it can't be the biggest rotation of a siteswap (the prenecklace test of _is_canonical)
+    # or can't get back to the state it started from in the beats that are left.
+    #
+    # the constraints are the same as in all_siteswaps_between. excluded throws are never tried,
+    # and a walk is cut short as soon as there are fewer beats left than throws it still must have
+    cdef bint split = second_start > 0 or second_stop >= 0
+
+    if split and stop - start != 1:
+        raise ValueError('second throw can only be limited for a single leading throw!')
+
+    if period > ASIZE:
+        raise ValueError(f'period must be at most {ASIZE}!')
+
+    if second_stop < 0:
+        second_stop = max_throw + 1
+
+    start = max(0, start)
+    stop = min(period * balls + 1, max_throw + 1, stop)
+
+    if period == 1 and start <= balls and stop > balls:
+        # when period is 1, return just number of balls. it goes through the ground state only
+        if (exclude >> balls) & 1 or required & ~(1ULL << balls) or state >= 0 and state != (1LL << balls) - 1:
+            return b'' if packed else []
+
+        return bytes([balls]) if packed else list('0123456789abcdefghijklmnopqrstuvwxyz'[balls])
+
+    if stop <= start or stop < balls + 2:
+        # start / stop wrong. return an empty list
+        return b'' if packed else []
+
+    # throws of the walk, prenecklace periods, the states before every throw
+    # and the throws seen before every throw as a bitmask
+    cdef int a[ASIZE]
+    cdef int p[ASIZE+1]
+    cdef unsigned long long u[ASIZE+1]
+    cdef unsigned long long m[ASIZE+1]
+
+    cdef int i
+    cdef int j
+    cdef int k
+    cdef int x
+    cdef int limit
+    cdef unsigned long long s
+    cdef unsigned long long last
+    cdef unsigned long long low
+    cdef unsigned long long nxt
+    cdef unsigned long long seen
+
+    cdef char buf[ASIZE]
+    cdef list siteswaps = []
+
+    for i in range(max(start, balls+1), stop):
+        # go through the start states in which the other balls land 1..i-2 beats from now,
+        # i.e. every bitmask of balls-1 bits among i-2 bits (gosper's hack)
+        if balls - 1 > i - 2 or (exclude >> i) & 1:
+            continue
+
+        s = (1ULL << (balls - 1)) - 1
+        last = s << (i - 2 - (balls - 1))
+
+        while True:
+            # throw the leading throw
+            a[0] = i
+            u[0] = (s << 1) | 1
+            u[1] = (u[0] >> 1) | (1ULL << (i - 1))
+            p[1] = 1
+            m[1] = 1ULL << i
+
+            k = 1
+            a[1] = second_start - 1
+
+            while k >= 1:
+                # the next throw to try. throws can't be bigger than
+                # the throw one prenecklace period back
+                limit = a[k - p[k]]
+                if k == 1:
+                    limit = min(limit, second_stop - 1)
+
+                x = a[k] + 1
+
+                if not u[k] & 1:
+                    # no ball lands now
+                    if x > 0 or exclude & 1:
+                        x = limit + 1
+                else:
+                    x = max(x, 1)
+                    while x <= limit and ((u[k] >> x) & 1 or (exclude >> x) & 1):
+                        x += 1
+
+                if x > limit:
+                    k -= 1
+                    continue
+
+                a[k] = x
+
+                if x == 0:
+                    nxt = u[k] >> 1
+                else:
+                    nxt = (u[k] >> 1) | (1ULL << (x - 1))
+
+                # the balls that land after the walk is over must
+                # land in the same beats as in the start state
+                if (nxt >> (period - k - 1)) & ~u[0]:
+                    continue
+
+                # every throw that is still missing takes a beat of its own
+                seen = m[k] | (1ULL << x)
+
+                if required & ~seen and _popcount(required & ~seen) > period - k - 1:
+                    continue
+
+                if k == period - 1:
+                    if (nxt == u[0] and (p[k] if x == a[k - p[k]] else k + 1) == period
+                            and (state < 0 or _visits(u, period, state))):
+                        for j in range(period):
+                            buf[j] = a[j] if packed else SYMBOLS[a[j]]
+                        siteswaps.append(buf[:period])
+                    continue
+
+                p[k+1] = p[k] if x == a[k - p[k]] else k + 1
+                u[k+1] = nxt
+                m[k+1] = seen
+                k += 1
+                a[k] = -1
+
+            if s == last:
+                break
+
+            low = s & -s
+            s = (s + low) | (((s ^ (s + low)) >> 2) // low)
+
+    # every start state gives its siteswaps in order, sort them all together
+    siteswaps.sort()
+
+    if packed:
+        return b''.join(siteswaps)
+
+    return [siteswap.decode('ascii') for siteswap in siteswaps]
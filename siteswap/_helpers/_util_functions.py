@@ -1,8 +1,22 @@
 from ._db_constants import BYTES_PER_PATTERN, HEADER_SIZE
+from ._notation import int_to_siteswap, siteswap_to_int
+import numpy as np
 
-__all__ = ['decode_hex', 'decode_int', 'encode_hex',
-           'encode_int32', 'encode_int64', 'int_to_siteswap'
-           'siteswap_to_int', 'patterns_to_printable_filesize']
+__all__ = ['bytes_to_printable_filesize', 'decode_hex', 'decode_int', 'delta_decode_throws',
+           'delta_encode_throws', 'encode_hex',
+           'encode_int32', 'encode_int64', 'int_to_siteswap',
+           'siteswap_to_int', 'patterns_to_printable_filesize',
+           'pack_hex', 'pack_throws', 'record_size', 'siteswaps_to_throws',
+           'throws_to_siteswaps', 'unpack_hex', 'unpack_throws']
+
+SYMBOLS = np.frombuffer(b'0123456789abcdefghijklmnopqrstuvwxyz', dtype=np.uint8)
+
+# maps ascii codes back to throws, e.g. ord('a') => 10. the codes that
+# are not symbols map to INVALID_SYMBOL
+INVALID_SYMBOL = 255
+SYMBOL_VALUES = np.full(256, INVALID_SYMBOL, dtype=np.uint8)
+SYMBOL_VALUES[SYMBOLS] = np.arange(36)
+SYMBOL_VALUES[SYMBOLS[10:] - 32] = np.arange(10, 36)
 
 def decode_hex(b: bytes) -> str:
     return b.hex().lstrip('0')
@@ -19,31 +33,81 @@ def encode_int32(i: int) -> bytes:
 def encode_int64(i: int) -> bytes:
     return (i).to_bytes(8, byteorder='big', signed=False)
 
-# jugglinglab.org siteswap notation
-# numbers 0-9 are mapped to their string representations
-# numbers 10-35 are mapped to a-z
-def int_to_siteswap(n: int) -> str:
-    if n < 0 or n > 35:
-        raise ValueError('Cannot convert to siteswap notation! Number must be between [0, 35]')
-    return '0123456789abcdefghijklmnopqrstuvwxyz'[n]
+def patterns_to_printable_filesize(patterns: int) -> str:
+    # Add the size of the header
+    return bytes_to_printable_filesize(HEADER_SIZE + patterns * BYTES_PER_PATTERN)
+
+def bytes_to_printable_filesize(size: int) -> str:
+    if size >= 1e12:
+        return f'{size / 1e12:.1f}'.rstrip('0').rstrip('.') + ' TB'
+    elif size >= 1e9:
+        return f'{size / 1e9:.1f}'.rstrip('0').rstrip('.') + ' GB'
+    elif size >= 1e6:
+        return f'{size / 1e6:.1f}'.rstrip('0').rstrip('.') + ' MB'
+    elif size >= 1e3:
+        return f'{size / 1e3:.1f}'.rstrip('0').rstrip('.') + ' KB'
+    return f'{size} bytes'
 
-def siteswap_to_int(s: str) -> int:
-    return int(s, 36)
+# number of bytes taken by a single bit-packed pattern
+def record_size(period: int, width: int) -> int:
+    return (period * width + 7) // 8
 
-def patterns_to_printable_filesize(patterns: int) -> float:
-    # Add the size of the header
-    patterns += HEADER_SIZE // BYTES_PER_PATTERN
-
-    if patterns >= 1e12 // BYTES_PER_PATTERN:
-        patterns /= 1e12 // BYTES_PER_PATTERN
-        return f'{patterns:.1f}'.rstrip('0').rstrip('.') + ' TB'
-    elif patterns >= 1e9 // BYTES_PER_PATTERN:
-        patterns /= 1e9 // BYTES_PER_PATTERN
-        return f'{patterns:.1f}'.rstrip('0').rstrip('.') + ' GB'
-    elif patterns >= 1e6 // BYTES_PER_PATTERN:
-        patterns /= 1e6 // BYTES_PER_PATTERN
-        return f'{patterns:.1f}'.rstrip('0').rstrip('.') + ' MB'
-    elif patterns >= 1e3 // BYTES_PER_PATTERN:
-        patterns /= 1e3 // BYTES_PER_PATTERN
-        return f'{patterns:.1f}'.rstrip('0').rstrip('.') + ' KB'
-    return f'{patterns*BYTES_PER_PATTERN} bytes'
+# packs an (N, period) array of throws into an (N, record_size) array of bytes.
+# every throw takes width bits, most significant bit first
+def pack_throws(throws: np.ndarray, width: int) -> np.ndarray:
+    n, period = throws.shape
+    shifts = np.arange(width-1, -1, -1, dtype=np.uint8)
+
+    bits = ((throws[:, :, None] >> shifts) & 1).astype(np.uint8).reshape(n, period * width)
+
+    return np.packbits(bits, axis=1)
+
+# the opposite of pack_throws
+def unpack_throws(records: np.ndarray, period: int, width: int) -> np.ndarray:
+    n = len(records)
+    weights = (1 << np.arange(width-1, -1, -1)).astype(np.uint8)
+
+    bits = np.unpackbits(records, axis=1, count=period * width).reshape(n, period, width)
+
+    return bits @ weights
+
+# the opposite of unpack_hex
+def pack_hex(throws: np.ndarray) -> np.ndarray:
+    period = throws.shape[1]
+    shifts = np.arange(4 * (period-1), -1, -4, dtype=np.uint64)
+
+    return (throws.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64).astype('>u8')
+
+# turns an array of hex encoded patterns (see encode_hex) into an (N, period) array of throws
+def unpack_hex(array: np.ndarray, period: int) -> np.ndarray:
+    shifts = np.arange(4 * (period-1), -1, -4, dtype=np.uint64)
+
+    return ((array.astype(np.uint64)[:, None] >> shifts) & 0xf).astype(np.uint8)
+
+# turns an (N, period) array of sorted throws into bytes that compress well. neighbouring
+# siteswaps share long prefixes, so the differences between them are mostly zeros, and
+# they are stored throw by throw so that the zeros of every throw end up next to each other
+def delta_encode_throws(throws: np.ndarray) -> bytes:
+    deltas = np.diff(throws, axis=0, prepend=np.zeros((1, throws.shape[1]), dtype=np.uint8))
+
+    return deltas.T.tobytes()
+
+# the opposite of delta_encode_throws. the differences wrap around
+# in uint8, so adding them up gives back the throws exactly
+def delta_decode_throws(b: bytes, period: int) -> np.ndarray:
+    deltas = np.frombuffer(b, dtype=np.uint8).reshape(period, -1).T
+
+    return np.ascontiguousarray(np.cumsum(deltas, axis=0, dtype=np.uint8))
+
+# all the siteswaps must have the given period. the characters that are
+# not symbols (upper or lower case) become INVALID_SYMBOL
+def siteswaps_to_throws(siteswaps: list[str], period: int) -> np.ndarray:
+    b = ''.join(siteswaps).encode('latin-1', errors='replace')
+
+    return SYMBOL_VALUES[np.frombuffer(b, dtype=np.uint8)].reshape(len(siteswaps), period)
+
+def throws_to_siteswaps(throws: np.ndarray) -> list[str]:
+    period = throws.shape[1]
+    s = SYMBOLS[throws].tobytes().decode('ascii')
+
+    return [s[i:i+period] for i in range(0, len(s), period)]
@@ -0,0 +1,206 @@
+from ._helpers._pool import add_close_callback, pool_workers, remove_close_callback, shared_pool
+from .database import SiteswapDB
+from .siteswap import ENGINES, _partition_search, _submit_tasks, _validate_siteswap
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+
+__all__ = ['AsyncSiteswapDB', 'aiter_siteswaps', 'all_siteswaps_async']
+
+# number of threads reading siteswap files by default
+READ_THREADS = 4
+
+class AsyncSiteswapDB():
+    def __init__(self, path: str = None, max_workers: int = READ_THREADS) -> None:
+        """
+        Awaitable queries of a SiteswapDB. The file reads run on a thread pool of
+        at most max_workers threads, so they don't block the event loop.
+
+        Reads are coalesced. get_siteswap calls for the same balls and period that are made
+        during the same iteration of the event loop are read in one go, and identical
+        get_siteswaps and get_header calls that are still running are shared.
+
+        :param path:        directory of the siteswap files, see SiteswapDB
+        :param max_workers: maximum number of threads reading the files
+        """
+        self.db = SiteswapDB(path)
+
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='siteswap-db')
+
+        # get_siteswap calls waiting to be read, by (balls, period)
+        self._batches = {}
+
+        # reads that are still running, by their arguments
+        self._running = {}
+
+    async def __aenter__(self) -> 'AsyncSiteswapDB':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Waits for the reads that are still running and unmaps the siteswap files.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.db.close()
+
+    async def get_header(self, balls: int) -> tuple[int, int, dict[int, int]]:
+        """
+        See SiteswapDB.get_header.
+        """
+        return await self._shared(('get_header', balls), self.db.get_header, balls)
+
+    async def get_siteswap(self, i: int, balls: int, period: int) -> str:
+        """
+        See SiteswapDB.get_siteswap.
+
+        :raises IndexError: if index is not in db
+        """
+        loop = asyncio.get_running_loop()
+        key = (balls, period)
+
+        if key not in self._batches:
+            # read everything asked for before the event loop gets back here
+            self._batches[key] = []
+            loop.call_soon(self._read_batch, loop, key)
+
+        future = loop.create_future()
+        self._batches[key].append((i, future))
+
+        return await future
+
+    async def get_siteswaps(self, balls: int, period: int, max_throw: int = None) -> list[str]:
+        """
+        See SiteswapDB.get_siteswaps.
+        """
+        siteswaps = await self._shared(('get_siteswaps', balls, period, max_throw),
+                                       self.db.get_siteswaps, balls, period, max_throw)
+
+        # every caller gets a list of their own
+        return list(siteswaps) if siteswaps is not None else None
+
+    def _read_batch(self, loop: asyncio.AbstractEventLoop, key: tuple[int, int]) -> None:
+        batch = [(i, future) for i, future in self._batches.pop(key) if not future.cancelled()]
+
+        if not batch:
+            return
+
+        read = loop.run_in_executor(self._executor, self._get_siteswaps_at, [i for i, _ in batch], *key)
+        read.add_done_callback(lambda read: self._resolve(batch, read))
+
+    def _get_siteswaps_at(self, indices: list[int], balls: int, period: int) -> list[tuple[str, Exception]]:
+        try:
+            siteswaps = self.db.get_siteswaps_by_index(balls, period, indices)
+
+            if siteswaps is None:
+                # the file couldn't be read, same as get_siteswap
+                siteswaps = [None] * len(indices)
+
+            return [(siteswap, None) for siteswap in siteswaps]
+        except (IndexError, TypeError, ValueError):
+            # one of the indices is bad. read them one by one, so that
+            # only the callers who asked for the bad ones get the error
+            pass
+
+        results = []
+
+        for i in indices:
+            try:
+                results.append((self.db.get_siteswap(i, balls, period), None))
+            except Exception as e:
+                results.append((None, e))
+
+        return results
+
+    def _resolve(self, batch: list[tuple[int, asyncio.Future]], read: asyncio.Future) -> None:
+        if read.cancelled() or read.exception() is not None:
+            results = [(None, read.exception() if not read.cancelled() else asyncio.CancelledError())] * len(batch)
+        else:
+            results = read.result()
+
+        for (_, future), (siteswap, e) in zip(batch, results):
+            if future.done():
+                continue
+
+            if e is not None:
+                future.set_exception(e)
+            else:
+                future.set_result(siteswap)
+
+    async def _shared(self, key: tuple, f, *args):
+        if key not in self._running:
+            loop = asyncio.get_running_loop()
+            self._running[key] = loop.run_in_executor(self._executor, f, *args)
+            self._running[key].add_done_callback(lambda _: self._running.pop(key, None))
+
+        # one caller giving up doesn't cancel the read for the others
+        return await asyncio.shield(self._running[key])
+
+# same as iter_siteswaps, but yields the siteswaps of all_siteswaps task by task, in order,
+# while the event loop keeps running. the searches run in the shared process pool, so
+# searches that run at the same time share its workers instead of starting pools of their own
+async def aiter_siteswaps(balls: int, period: int, max_throw: int = None, engine: str = 'composition'):
+    if (not max_throw or max_throw > balls * period):
+        max_throw = balls * period
+
+    _validate_siteswap(balls, period, max_throw)
+
+    if engine not in ENGINES:
+        raise ValueError(f'engine must be one of {", ".join(ENGINES)}!')
+
+    loop = asyncio.get_running_loop()
+    pool = shared_pool()
+    tasks = _partition_search(balls, period, max_throw, pool_workers())
+    futures = [loop.create_future() for _ in tasks]
+
+    def on_result(k: int, siteswaps: list[str]) -> None:
+        _call_soon(loop, _set_result, futures[k], siteswaps)
+
+    def on_error(k: int, e: BaseException) -> None:
+        _call_soon(loop, _set_exception, futures[k], e)
+
+    def on_close() -> None:
+        # the tasks that are left went down with the pool
+        for future in futures:
+            _call_soon(loop, _set_exception, future, RuntimeError('The process pool was shut down'))
+
+    add_close_callback(on_close)
+
+    try:
+        # the tasks that are still running when the caller stops iterating
+        # can't be taken back, their results are just dropped
+        _submit_tasks(pool, tasks, balls, period, max_throw, engine, on_result, on_error)
+
+        for future in futures:
+            siteswaps = await future
+
+            if siteswaps:
+                yield siteswaps
+    finally:
+        remove_close_callback(on_close)
+
+        # nobody waits for the rest of the tasks any more, not even for their errors
+        for future in futures:
+            if not future.cancel() and not future.cancelled():
+                future.exception()
+
+async def all_siteswaps_async(balls: int, period: int, max_throw: int = None,
+                              engine: str = 'composition') -> list[str]:
+    return [x async for siteswaps in aiter_siteswaps(balls, period, max_throw, engine) for x in siteswaps]
+
+# the pool calls back from its own thread, and the loop may have been closed by then
+def _call_soon(loop: asyncio.AbstractEventLoop, f, *args) -> None:
+    try:
+        loop.call_soon_threadsafe(f, *args)
+    except RuntimeError:
+        pass
+
+def _set_result(future: asyncio.Future, result) -> None:
+    if not future.done():
+        future.set_result(result)
+
+def _set_exception(future: asyncio.Future, e: BaseException) -> None:
+    if not future.done():
+        future.set_exception(e)
@@ -0,0 +1,257 @@
+from ._helpers._exceptions import SiteswapFileException
+
+from contextlib import contextmanager, redirect_stdout
+import argparse
+import csv
+import json
+import os
+import sys
+
+__all__ = ['main']
+
+# the command line interface, i.e. python -m siteswap or the siteswap console script.
+# every command imports what it needs only when it runs, so that --help stays fast
+
+FORMATS = ('text', 'csv', 'json')
+
+# the siteswaps of generate are written in chunks of this many
+CHUNK_SIZE = 65536
+
+# the tables of stats, see stats/README.md
+STATS_BALLS = range(1, 10)
+STATS_PERIODS = range(1, 21)
+STATS_MAX_THROW = 15
+
+def main(argv: list[str] = None) -> int:
+    args = _parser().parse_args(argv)
+
+    try:
+        with _output(args.output) as out:
+            args.command(args, out)
+    except BrokenPipeError:
+        # e.g. piped into head. stdout is pointed at devnull so that
+        # python doesn't complain about the pipe again when it exits
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except (OSError, SiteswapFileException, ValueError) as e:
+        print(f'siteswap: error: {e}', file=sys.stderr)
+        return 1
+
+    return 0
+
+def _generate(args, out) -> None:
+    writer = _Writer(out, args.format, ['siteswap'])
+
+    for chunk in _siteswap_chunks(args.balls, args.period, args.max_throw, args.workers, args.chunk_size):
+        writer.write(chunk)
+
+    writer.close()
+
+def _build_db(args, out) -> None:
+    from .database import SiteswapDB
+
+    with SiteswapDB(args.path) as db:
+        db.build(args.balls, args.max_throw, args.periods, args.workers, args.version)
+        _write_info(db, args.balls, None, args.format, out)
+
+def _info(args, out) -> None:
+    from .database import SiteswapDB
+
+    with SiteswapDB(args.path) as db:
+        _write_info(db, args.balls, args.max_throw, args.format, out)
+
+def _stats(args, out) -> None:
+    from ._helpers._db_constants import BYTES_PER_PATTERN
+    from ._helpers._util_functions import bytes_to_printable_filesize
+    from .siteswap import iter_number_of_juggling_patterns_table
+
+    max_throws = range(1, (args.max_throw or STATS_MAX_THROW) + 1)
+    writer = _Writer(out, args.format, ['balls', 'period'] + [f't={t}' for t in max_throws])
+    counts = iter_number_of_juggling_patterns_table(args.balls, args.periods, max_throws, args.workers)
+
+    # the rows of every number of balls are written as soon as they are counted
+    for b, table in counts:
+        rows = []
+
+        for p in args.periods:
+            values = [table[b, p, t] for t in max_throws]
+
+            if args.table == 'disk-usage':
+                values = [n * BYTES_PER_PATTERN for n in values]
+
+            if args.format == 'json':
+                rows.append([b, p] + values)
+            elif args.table == 'disk-usage':
+                rows.append([f'b={b}', f'p={p}'] + [bytes_to_printable_filesize(x) for x in values])
+            else:
+                rows.append([f'b={b}', f'p={p}'] + values)
+
+        writer.write(rows)
+
+    writer.close()
+
+# the siteswaps of all_siteswaps in order, in chunks of at most chunk_size. one worker
+# streams them with iter_siteswaps, more run the tasks of all_siteswaps in the process
+# pool and hand out the siteswaps of every task as soon as the tasks before it are done
+def _siteswap_chunks(balls: int, period: int, max_throw: int, workers: int, chunk_size: int):
+    from ._helpers._pool import get_pool, wait
+    from .siteswap import _partition_search, _submit_tasks, _validate_siteswap, iter_siteswaps
+
+    if workers == 1:
+        for chunk, _ in iter_siteswaps(balls, period, max_throw, chunk_size):
+            yield chunk
+
+        return
+
+    if (not max_throw or max_throw > balls * period):
+        max_throw = balls * period
+
+    _validate_siteswap(balls, period, max_throw)
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    tasks = _partition_search(balls, period, max_throw, workers)
+    pool = get_pool(workers)
+    results = _submit_tasks(pool, tasks, balls, period, max_throw, 'composition')
+
+    for k in range(len(results)):
+        siteswaps = wait(pool, results[k])
+
+        # don't keep the siteswaps that have already been written
+        results[k] = None
+
+        for i in range(0, len(siteswaps), chunk_size):
+            yield siteswaps[i:i+chunk_size]
+
+# the number of patterns of every period, see SiteswapDB.print_info
+def _write_info(db, balls: int, max_throw: int, fmt: str, out) -> None:
+    if not db._exists(balls):
+        raise FileNotFoundError(f"No siteswap database for {balls} balls in '{db.path}'")
+
+    filename = next((f for f in (db._get_filename(balls), db._get_compressed_filename(balls))
+                     if os.path.exists(f)), None)
+
+    if fmt == 'text' and max_throw is None and filename is not None:
+        with redirect_stdout(out):
+            db.print_info(filename)
+
+        return
+
+    _, _, patterns = db.get_header(balls)
+    writer = _Writer(out, fmt, ['period', 'patterns'])
+    writer.write([[period, db.count(balls, period, max_throw)] for period in patterns])
+    writer.close()
+
+class _Writer():
+    """
+    Writes rows in one of FORMATS as they come, and flushes after every write.
+
+    text is tab separated with a header, except that a single column is written
+    one value per line without one. csv has a header, and json is a list of objects,
+    or of values for a single column. Rows of a single column are plain values.
+    """
+    def __init__(self, out, fmt: str, columns: list[str]) -> None:
+        self.out = out
+        self.format = fmt
+        self.columns = columns
+        self.rows = 0
+
+        if fmt == 'csv':
+            self.csv = csv.writer(out, lineterminator='\n')
+            self.csv.writerow(columns)
+        elif fmt == 'text' and len(columns) > 1:
+            out.write('\t'.join(columns) + '\n')
+        elif fmt == 'json':
+            out.write('[')
+
+    def write(self, rows: list) -> None:
+        single = len(self.columns) == 1
+
+        if self.format == 'csv':
+            self.csv.writerows(([row] for row in rows) if single else rows)
+        elif self.format == 'text':
+            if rows:
+                lines = rows if single else ('\t'.join(map(str, row)) for row in rows)
+                self.out.write('\n'.join(lines) + '\n')
+        else:
+            for row in rows:
+                item = row if single else dict(zip(self.columns, row))
+                self.out.write((',\n' if self.rows else '\n') + json.dumps(item))
+                self.rows += 1
+
+        self.out.flush()
+
+    def close(self) -> None:
+        if self.format == 'json':
+            self.out.write('\n]\n' if self.rows else ']\n')
+            self.out.flush()
+
+@contextmanager
+def _output(filename: str):
+    if filename is None or filename == '-':
+        yield sys.stdout
+    else:
+        with open(filename, 'w', newline='') as f:
+            yield f
+
+# a list of integers from e.g. '1-10' or '1,3,5-7'
+def _int_range(s: str) -> list[int]:
+    numbers = []
+
+    try:
+        for part in s.split(','):
+            start, _, stop = part.partition('-')
+            numbers.extend(range(int(start), int(stop or start) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid range {s!r}, expecting e.g. '1-10' or '1,3,5-7'")
+
+    return sorted(set(numbers))
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='siteswap', description='Generate, store and count juggling patterns.')
+    commands = parser.add_subparsers(title='commands', required=True, metavar='command')
+
+    def command(name: str, f, description: str, workers: str, max_throw: str, **max_throw_kwargs):
+        p = commands.add_parser(name, help=description, description=description)
+        p.set_defaults(command=f)
+        p.add_argument('-w', '--workers', type=int, help=workers)
+        p.add_argument('-t', '--max-throw', type=int, help=max_throw, **max_throw_kwargs)
+        p.add_argument('-f', '--format', choices=FORMATS, default='text', help='output format (default: text)')
+        p.add_argument('-o', '--output', help='write into this file instead of stdout')
+
+        return p
+
+    processes = 'number of worker processes, defaults to the number of CPUs'
+
+    p = command('generate', _generate, 'Write all siteswaps with the given balls and period, in order.',
+                processes + '. with 1 the siteswaps are streamed in a single process',
+                'maximum throw, defaults to balls * period')
+    p.add_argument('balls', type=int, help='number of balls')
+    p.add_argument('period', type=int, help='period of the siteswaps')
+    p.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='write this many siteswaps at a time')
+
+    p = command('build-db', _build_db, 'Build a siteswap database file and print its info.',
+                processes, 'maximum throw of the siteswaps', required=True)
+    p.add_argument('balls', type=int, help='number of balls')
+    p.add_argument('-p', '--periods', type=_int_range, help="periods to build, e.g. '1-10', defaults to 1-16")
+    p.add_argument('--version', type=int, choices=(1, 2), default=1, help='version of the file format')
+    p.add_argument('--path', help='directory of the database, defaults to the db directory of the package')
+
+    p = command('info', _info, 'Print the number of patterns of every period in a siteswap database.',
+                'not used, the header is read in this process', 'count only the patterns up to this throw')
+    p.add_argument('balls', type=int, help='number of balls')
+    p.add_argument('--path', help='directory of the database, defaults to the db directory of the package')
+
+    p = command('stats', _stats, 'Count the patterns by balls, period and maximum throw, like in stats/.',
+                processes, f'biggest maximum throw of the table, defaults to {STATS_MAX_THROW}')
+    p.add_argument('-b', '--balls', type=_int_range, default=list(STATS_BALLS),
+                   help=f'numbers of balls, defaults to {STATS_BALLS.start}-{STATS_BALLS.stop-1}')
+    p.add_argument('-p', '--periods', type=_int_range, default=list(STATS_PERIODS),
+                   help=f'periods, defaults to {STATS_PERIODS.start}-{STATS_PERIODS.stop-1}')
+    p.add_argument('--table', choices=('patterns', 'disk-usage'), default='patterns',
+                   help='number of patterns, or the size of a version 1 file holding them')
+
+    return parser
@@ -1,51 +1,585 @@
 from ._helpers._db_constants import (
+    BLOCK_SIZE,
     BYTES_PER_PATTERN,
+    CACHE_BLOCKS,
     CHUNK_SIZE,
+    END_OF_HEADER_SIZE,
     HEADER_SIZE,
+    HEADER_V2_FIXED_SIZE,
+    MAX_THROW_V2,
 )
+from ._helpers._exceptions import SiteswapFileException
 from ._helpers._util_functions import (
+    bytes_to_printable_filesize,
     decode_hex,
     decode_int,
+    delta_decode_throws,
+    delta_encode_throws,
     encode_hex,
     encode_int32,
     encode_int64,
-    patterns_to_printable_filesize,
+    pack_hex,
+    pack_throws,
+    record_size,
+    siteswaps_to_throws,
+    throws_to_siteswaps,
+    unpack_hex,
+    unpack_throws,
 )
+from ._helpers._helper_functions import _canonical_siteswap
+from ._helpers._pool import get_pool, iter_results
+from ._helpers._siteswap_cython import all_siteswaps_between
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import partial
+from itertools import accumulate
+import hashlib
 import json
+import lzma
+import mmap
+import numpy as np
 import os
+import threading
+import zlib
 
 __all__ = ['SiteswapDB']
 
-class SiteswapFileException(Exception):
-    pass
+# the codecs of version 3 files by their id in the file: (name, compress, decompress)
+CODECS = {
+    1: ('zlib', partial(zlib.compress, level=9), zlib.decompress),
+    2: ('lzma', lzma.compress, lzma.decompress),
+}
+
+# runs in a worker process. encodes the siteswaps right away,
+# so that only bytes are sent back to the parent process
+def _encoded_siteswaps_between(args: tuple[int, ...]) -> bytes:
+    version, width, *args = args
+    period = args[0]
+
+    throws = np.frombuffer(all_siteswaps_between(*args, packed=True), dtype=np.uint8).reshape(-1, period)
+
+    if version == 1:
+        return pack_hex(throws).tobytes()
+
+    return pack_throws(throws, width).tobytes()
+
+class SiteswapSequence(Sequence):
+    """
+    A read-only sequence of the siteswaps with a single period.
+
+    The siteswaps are kept as a numpy view over the memory mapped file, and they
+    are decoded into strings only when accessed. Slicing returns another
+    SiteswapSequence without copying anything.
+
+    In version 1 files array is a uint64 array with one hex encoded pattern per item.
+    In version 2 files it is a 2d uint8 array with one bit-packed pattern per row.
+    """
+    def __init__(self, array: np.ndarray, period: int, width: int = None) -> None:
+        self.array = array
+        self.period = period
+        self.width = width
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return SiteswapSequence(self.array[i], self.period, self.width)
+
+        if self.width is None:
+            # same as decode_hex
+            return f'{self.array[i]:x}'
+
+        return throws_to_siteswaps(unpack_throws(self.array[i][None], self.period, self.width))[0]
+
+    def __iter__(self):
+        for i in range(0, len(self), CHUNK_SIZE):
+            yield from throws_to_siteswaps(self.throws(i, i+CHUNK_SIZE))
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __repr__(self) -> str:
+        return f'SiteswapSequence({len(self)} patterns)'
+
+    def throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        """
+        Decodes the siteswaps between start and stop at once.
+
+        :returns an (N, period) uint8 array of throws
+        """
+        return self._decode(self.array[start:stop])
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Decodes the siteswaps at the given indices at once.
+
+        :returns an (N, period) uint8 array of throws
+        """
+        return self._decode(self.array[indices])
+
+    def leading_throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        """
+        Decodes only the first throw of the siteswaps between start and stop.
+
+        :returns a uint8 array of throws
+        """
+        array = self.array[start:stop]
+
+        if self.width is None:
+            return ((array >> np.uint64(4 * (self.period-1))) & np.uint64(0xf)).astype(np.uint8)
+
+        return unpack_throws(array[:, :record_size(1, self.width)], 1, self.width)[:, 0]
+
+    def _decode(self, array: np.ndarray) -> np.ndarray:
+        if self.width is None:
+            return unpack_hex(array, self.period)
+
+        return unpack_throws(array, self.period, self.width)
+
+    def _search(self, throws: np.ndarray) -> int:
+        # binary searches for a (1, period) array of throws, see SiteswapDB._find.
+        # the records are sorted and their big endian encodings sort in the same order as
+        # the throws. version 2 records are compared byte by byte as numpy void items
+        array = self.array
+
+        if self.width is None:
+            target = pack_hex(throws)
+        else:
+            array = array.view(f'V{array.shape[1]}').ravel()
+            target = pack_throws(throws, self.width).view(array.dtype).ravel()
+
+        i = int(np.searchsorted(array, target[0]))
+
+        if i < len(array) and array[i] == target[0]:
+            return i
+
+        return None
+
+class _MappedFile():
+    """
+    A siteswap file mapped into memory. The header is parsed only once.
+    """
+    def __init__(self, mm: mmap.mmap, version: int, width: int, header_size: int,
+                 balls: int, max_throw: int, patterns: dict[int, int]) -> None:
+        self.mmap = mm
+        self.version = version
+        self.width = width
+        self.balls = balls
+        self.max_throw = max_throw
+        self.patterns = patterns
+
+        # loaded on first use, see SiteswapDB._get_index
+        self.index = None
+
+        # byte offset and record size of every period
+        self.offsets = {}
+        self.record_sizes = {}
+        offset = header_size
+
+        for period, n in patterns.items():
+            self.offsets[period] = offset
+            self.record_sizes[period] = BYTES_PER_PATTERN if version == 1 else record_size(period, width)
+            offset += n * self.record_sizes[period]
+
+        self.size = offset
+
+    def sequence(self, period: int) -> SiteswapSequence:
+        # a period that is not in the file has no siteswaps
+        n = self.patterns.get(period, 0)
+        offset = self.offsets.get(period, 0)
+
+        if self.version == 1:
+            array = np.frombuffer(self.mmap, dtype='>u8', count=n, offset=offset)
+
+            return SiteswapSequence(array, period)
+
+        size = self.record_sizes.get(period, record_size(period, self.width))
+        array = np.frombuffer(self.mmap, dtype=np.uint8, count=n * size, offset=offset)
+
+        return SiteswapSequence(array.reshape(n, size), period, self.width)
+
+    def close(self) -> None:
+        try:
+            self.mmap.close()
+        except BufferError:
+            # a SiteswapSequence still uses the mapping. it is
+            # unmapped once the last one is garbage collected
+            pass
+
+class _BlockCache():
+    """
+    The most recently used decompressed blocks of version 3 files, shared by all the files of a SiteswapDB.
+    Keys start with the _CompressedFile the block belongs to.
+    """
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def get(self, key: tuple, load) -> np.ndarray:
+        with self._lock:
+            if key in self._blocks:
+                self.hits += 1
+                self._blocks.move_to_end(key)
+                return self._blocks[key]
+
+            self.misses += 1
+
+        # decompress outside the lock, two threads may decompress the same block at worst
+        block = load()
+
+        with self._lock:
+            self._blocks[key] = block
+            self._blocks.move_to_end(key)
+
+            while len(self._blocks) > self.maxsize:
+                self._blocks.popitem(last=False)
+
+        return block
+
+    def discard(self, owner: '_CompressedFile') -> None:
+        with self._lock:
+            for key in [key for key in self._blocks if key[0] is owner]:
+                del self._blocks[key]
+
+class _CompressedSequence(Sequence):
+    """
+    A read-only sequence of the siteswaps with a single period in a version 3 file,
+    with the same methods as a SiteswapSequence. Only the blocks that hold the
+    siteswaps accessed are decompressed. Slicing returns another _CompressedSequence.
+    """
+    def __init__(self, f: '_CompressedFile', period: int, start: int, stop: int) -> None:
+        self.file = f
+        self.period = period
+        self.start = start
+        self.stop = stop
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+
+            if step != 1:
+                raise ValueError('slices of a compressed sequence must have a step of 1!')
+
+            return _CompressedSequence(self.file, self.period, self.start + start, self.start + max(start, stop))
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError('Index out of range')
+
+        return throws_to_siteswaps(self.throws(i, i+1))[0]
+
+    def __iter__(self):
+        for i in range(0, len(self), CHUNK_SIZE):
+            yield from throws_to_siteswaps(self.throws(i, i+CHUNK_SIZE))
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __repr__(self) -> str:
+        return f'_CompressedSequence({len(self)} patterns)'
+
+    def throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        start, stop = self.start + start, self.start + max(start, stop)
+        size = self.file.block_size
+
+        blocks = [self.file.block(self.period, k)[max(0, start - k*size):stop - k*size]
+                  for k in range(start // size, (stop - 1) // size + 1)] if start < stop else []
+
+        return np.concatenate(blocks) if blocks else np.zeros((0, self.period), dtype=np.uint8)
+
+    def leading_throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        return self.throws(start, stop)[:, 0]
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        indices = np.asarray(indices, dtype=np.int64) + self.start
+        blocks = indices // self.file.block_size
+        throws = np.zeros((len(indices), self.period), dtype=np.uint8)
+
+        # every block is decompressed once
+        for k in np.unique(blocks):
+            here = blocks == k
+            throws[here] = self.file.block(self.period, int(k))[indices[here] - k * self.file.block_size]
+
+        return throws
+
+    def _search(self, throws: np.ndarray) -> int:
+        # the first siteswap of every block is in the block index, so
+        # only the block that could have the siteswap is decompressed
+        firsts = self.file.firsts[self.period]
+
+        if not len(firsts):
+            return None
+
+        view = f'V{self.period}'
+        target = np.ascontiguousarray(throws, dtype=np.uint8).view(view).ravel()
+        k = max(0, int(np.searchsorted(firsts.view(view).ravel(), target[0], side='right')) - 1)
+
+        block = self.file.block(self.period, k)
+        j = int(np.searchsorted(block.view(view).ravel(), target[0]))
+
+        if j < len(block) and (block[j] == throws[0]).all():
+            i = k * self.file.block_size + j
+
+            if self.start <= i < self.stop:
+                return i - self.start
+
+        return None
+
+class _ShardedSequence(Sequence):
+    """
+    The siteswaps with a single period spread over several shards, as one sequence.
+    Every part is a SiteswapSequence, and the parts are in order, so the
+    siteswaps are sorted the same way as in a single file.
+    """
+    def __init__(self, parts: list[SiteswapSequence], period: int) -> None:
+        self.parts = parts
+        self.period = period
+
+        # index of the first siteswap of every part
+        self.offsets = [0] + list(accumulate(len(part) for part in parts))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+
+            if step != 1:
+                raise ValueError('slices of a sharded sequence must have a step of 1!')
+
+            return _ShardedSequence([part[max(0, start-k):max(0, stop-k)]
+                                     for part, k in zip(self.parts, self.offsets)], self.period)
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError('Index out of range')
+
+        k = bisect_right(self.offsets, i) - 1
+
+        return self.parts[k][i - self.offsets[k]]
+
+    def __iter__(self):
+        for part in self.parts:
+            yield from part
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def __repr__(self) -> str:
+        return f'_ShardedSequence({len(self)} patterns in {len(self.parts)} shards)'
+
+    def throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        return self._concatenate('throws', start, stop, (0, self.period))
+
+    def leading_throws(self, start: int = None, stop: int = None) -> np.ndarray:
+        return self._concatenate('leading_throws', start, stop, (0,))
+
+    def take(self, indices: np.ndarray) -> np.ndarray:
+        indices = np.asarray(indices, dtype=np.int64)
+        throws = np.zeros((len(indices), self.period), dtype=np.uint8)
+
+        for part, k in zip(self.parts, self.offsets):
+            here = (indices >= k) & (indices < k + len(part))
+            throws[here] = part.take(indices[here] - k)
+
+        return throws
+
+    def _concatenate(self, method: str, start: int, stop: int, empty_shape: tuple) -> np.ndarray:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        arrays = [getattr(part, method)(max(0, start-k), max(0, stop-k))
+                  for part, k in zip(self.parts, self.offsets) if start < k + len(part) and k < stop]
+
+        return np.concatenate(arrays) if arrays else np.zeros(empty_shape, dtype=np.uint8)
+
+    def _search(self, throws: np.ndarray) -> int:
+        for part, k in zip(self.parts, self.offsets):
+            i = part._search(throws)
+
+            if i is not None:
+                return k + i
+
+        return None
+
+class _ShardedFile():
+    """
+    The shards of a sharded database with the same number of balls, mapped into memory.
+    Has the same attributes as a _MappedFile.
+    """
+    def __init__(self, manifest: dict, shards: list[_MappedFile]) -> None:
+        self.version = manifest['version']
+        self.width = manifest['max_throw'].bit_length() if self.version == 2 else None
+        self.balls = manifest['balls']
+        self.max_throw = manifest['max_throw']
+
+        # loaded on first use, see SiteswapDB._get_index
+        self.index = None
+
+        # the mapped shards of every period, sorted by their leading throws
+        self.shards = {}
+        self.patterns = {}
+
+        for entry, shard in sorted(zip(manifest['shards'], shards), key=lambda x: (x[0]['period'], x[0]['start'])):
+            self.shards.setdefault(entry['period'], []).append(shard)
+            self.patterns[entry['period']] = self.patterns.get(entry['period'], 0) + entry['patterns']
+
+    def sequence(self, period: int) -> _ShardedSequence:
+        return _ShardedSequence([shard.sequence(period) for shard in self.shards.get(period, [])], period)
+
+    def close(self) -> None:
+        for shards in self.shards.values():
+            for shard in shards:
+                shard.close()
+
+class _CompressedFile():
+    """
+    A version 3 siteswap file mapped into memory. Has the same attributes as a _MappedFile.
+
+    After the header come the codec and the block size, then the block index of every period,
+    and then the compressed blocks. The block index of a period has the offsets of its blocks
+    in the file (and where the last one ends) and the throws of the first siteswap of every block.
+    """
+    def __init__(self, mm: mmap.mmap, width: int, header_size: int, balls: int,
+                 max_throw: int, patterns: dict[int, int], cache: _BlockCache) -> None:
+        self.mmap = mm
+        self.version = 3
+        self.width = width
+        self.balls = balls
+        self.max_throw = max_throw
+        self.patterns = patterns
+        self.cache = cache
+
+        # loaded on first use, see SiteswapDB._get_index
+        self.index = None
+
+        codec = decode_int(mm[header_size:header_size+4])
+
+        if codec not in CODECS:
+            raise SiteswapFileException(f'Unsupported codec {codec}!')
+
+        self.codec = CODECS[codec][0]
+        self.decompress = CODECS[codec][2]
+        self.block_size = decode_int(mm[header_size+4:header_size+8])
+
+        # block offsets and the first siteswaps of the blocks of every period
+        self.blocks = {}
+        self.firsts = {}
+        offset = header_size + 8
+
+        for period, n in patterns.items():
+            k = -(-n // self.block_size)
+
+            if offset + (k+1) * 8 + k * period > len(mm):
+                raise SiteswapFileException('File is smaller than the header says. Header and data mismatch.')
+
+            self.blocks[period] = np.frombuffer(mm, dtype='>i8', count=k+1, offset=offset)
+            offset += (k+1) * 8
+
+            self.firsts[period] = np.frombuffer(mm, dtype=np.uint8, count=k*period, offset=offset).reshape(k, period)
+            offset += k * period
+
+        # where the last block ends
+        self.size = max([offset] + [int(offsets[-1]) for offsets in self.blocks.values()])
+
+    def block(self, period: int, k: int) -> np.ndarray:
+        """
+        Decompresses the k'th block of a period, or gets it from the cache.
+
+        :returns an (N, period) uint8 array of throws
+        """
+        def load() -> np.ndarray:
+            start, stop = int(self.blocks[period][k]), int(self.blocks[period][k+1])
+
+            return delta_decode_throws(self.decompress(self.mmap[start:stop]), period)
+
+        return self.cache.get((self, period, k), load)
+
+    def sequence(self, period: int) -> _CompressedSequence:
+        return _CompressedSequence(self, period, 0, self.patterns.get(period, 0))
+
+    def close(self) -> None:
+        self.cache.discard(self)
+
+        try:
+            self.mmap.close()
+        except BufferError:
+            # the block index is a view of the mapping
+            pass
 
 class SiteswapDB():
-    # def __getitem__(self, i) -> dict[int, list[str]]:
-    #     return None
-    #     # return self.read_file(f'db/{i}balls.bin')
+    def __init__(self, path: str = None, cache_blocks: int = CACHE_BLOCKS) -> None:
+        """
+        :param path:         directory of the siteswap files, defaults to the 'db' directory of this package
+        :param cache_blocks: number of decompressed blocks of version 3 files to keep in memory
+        """
+        if path is None:
+            path = os.path.join(os.path.dirname(__file__), 'db')
+
+        self.path = path
+
+        # siteswap files that have been mapped into memory, by number of balls
+        self._files = {}
+
+        # makes sure that reads from several threads map a file only once
+        self._lock = threading.Lock()
+
+        # the most recently used blocks of compressed files, see compress
+        self._cache = _BlockCache(cache_blocks)
+
+    def __enter__(self) -> 'SiteswapDB':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
-    def _create_header(self, balls: int, max_throw: int, patterns: dict[int, int] = None) -> bytes:
+    def __contains__(self, siteswap: str) -> bool:
+        canonical = _canonical_siteswap(siteswap) if isinstance(siteswap, str) else None
+
+        if canonical is None or not self._exists(canonical[1]):
+            return False
+
+        return self._find(*canonical) is not None
+
+    def __getitem__(self, balls: int) -> dict[int, SiteswapSequence]:
+        return self.patterns[balls]
+
+    def _create_header(self, balls: int, max_throw: int, patterns: dict[int, int] = None, version: int = 1) -> bytes:
         """
         Creates a header for a siteswap file.
 
+        Version 1 headers have room for the number of patterns of periods 1-16.
+        Version 2 headers have room for as many periods as there are keys in patterns,
+        and also store how many bits a single throw takes. Version 3 headers are the
+        same as version 2 headers.
+
         :param   balls:      how many juggling balls
         :param   max_throw:  maximum throw of a siteswap
         :param   patterns:   dictionary with period as key, number of patterns as value
+        :param   version:    version of the file format, 1, 2 or 3
         :raises  ValueError: if arguments are not valid
         :returns a bytearray
         """
         if not patterns:
-            patterns = {i: 0 for i in range(1, 17)}
+            patterns = {}
 
-        # fill in missing patterns
-        for i in range(1, 17):
-            try:
-                patterns[i]
-            except KeyError:
-                patterns[i] = 0
+        if version not in (1, 2, 3):
+            raise ValueError('version must be 1, 2 or 3!')
 
-        if len(patterns) > 16:
-            raise ValueError('patterns supports only keys between 1-16!')
+        periods = 16 if version == 1 else max(patterns, default=1)
+
+        if any(i not in range(1, periods+1) for i in patterns):
+            raise ValueError(f'patterns supports only keys between 1-{periods}!')
+
+        # fill in missing patterns
+        patterns = {i: patterns.get(i, 0) for i in range(1, periods+1)}
 
         if balls < 1:
             raise ValueError('number of balls must be greater than 0!')
@@ -53,57 +587,324 @@ class SiteswapDB():
         if max_throw < 1:
             raise ValueError('maximum throw must be greater than 0!')
 
+        if version != 1 and max_throw > MAX_THROW_V2:
+            raise ValueError(f'maximum throw must be at most {MAX_THROW_V2}!')
+
         # 8 bytes for file signature
         header = bytearray(b'SITESWAP')
 
+        if version != 1:
+            # 4 zero bytes (never a valid number of balls in version 1)
+            # and 4 bytes for the version
+            header += encode_int32(0)
+            header += encode_int32(version)
+
         # 4 bytes for number of balls
         header += encode_int32(balls)
 
         # 4 bytes for max_throw
         header += encode_int32(max_throw)
 
-        # 16 x 8 bytes = 128 bytes for number of patterns per period
-        for i in range(1, 17):
+        if version != 1:
+            # 4 bytes for number of periods and 4 bytes for bits per throw
+            header += encode_int32(periods)
+            header += encode_int32(max_throw.bit_length())
+
+        # 8 bytes for number of patterns per period
+        for i in range(1, periods+1):
             header += encode_int64(patterns[i])
 
         # 16 bytes of only 'f'
         header += encode_hex('f' * 32)
 
-        # a total of HEADER_SIZE=160 bytes
+        # a total of HEADER_SIZE=160 bytes in version 1
         return header
 
-    def _read_header(self, b: bytes) -> tuple[int, int, dict[int, int]]:
+    def _find(self, siteswap: str, balls: int) -> int:
         """
-        Reads the header of a siteswap file.
+        Binary searches for a canonical siteswap among the sorted siteswaps of its period.
+        Only the O(log n) siteswaps compared against are read from the file.
+
+        :param   siteswap: a siteswap in its canonical form, see _canonical_siteswap
+        :param   balls:    number of balls in the siteswap pattern
+        :returns index of the siteswap, or None if it is not in db
+        """
+        f = self._open(balls)
+        period = len(siteswap)
+
+        if period not in f.patterns:
+            return None
+
+        return f.sequence(period)._search(siteswaps_to_throws([siteswap], period))
+
+    def _checksum(self, filename: str) -> str:
+        """
+        Calculates the SHA-256 checksum of a file.
+
+        :param   filename: a filename
+        :raises  Error:    if file could not be read
+        :returns the checksum as a hex string
+        """
+        h = hashlib.sha256()
+
+        with open(filename, 'rb') as f:
+            for b in iter(lambda: f.read(1 << 20), b''):
+                h.update(b)
+
+        return h.hexdigest()
+
+    def _exists(self, balls: int) -> bool:
+        # a siteswap file, a compressed one or the manifest of a sharded database
+        return any(os.path.exists(filename) for filename in (
+            self._get_filename(balls),
+            self._get_compressed_filename(balls),
+            self._get_manifest_filename(balls),
+        ))
+
+    def _get_compressed_filename(self, balls: int) -> str:
+        return os.path.join(self.path, f'{balls}balls.binz')
+
+    def _get_filename(self, balls: int) -> str:
+        return os.path.join(self.path, f'{balls}balls.bin')
+
+    def _get_index(self, balls: int) -> dict[int, list[int]]:
+        """
+        Gets the max throw index of a siteswap file. The index is read from '{balls}balls.idx.json'
+        and kept in memory. If the index is missing or does not match the max throw, format version
+        and numbers of patterns in the header, it is rebuilt.
+
+        :param   balls:                 number of balls
+        :raises  SiteswapFileException: if header is not valid
+        :raises  Error:                 if file could not be read
+        :returns a dictionary with period as key, list of offsets as value (see build_index)
+        """
+        f = self._open(balls)
+
+        if f.index is not None:
+            return f.index
+
+        try:
+            with open(self._get_index_filename(balls), 'r') as g:
+                saved = json.load(g)
+
+            # an index of a file built with another max throw or format version can have
+            # the same number of patterns, but its offsets don't match the file
+            if ((saved['max_throw'], saved['version'], {int(k): v for k, v in saved['patterns'].items()}) ==
+                    (f.max_throw, f.version, f.patterns)):
+                f.index = {int(k): v for k, v in saved['offsets'].items()}
+                return f.index
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+        return self.build_index(balls)
+
+    def _get_manifest_filename(self, balls: int) -> str:
+        return os.path.join(self._get_shard_path(balls), 'manifest.json')
+
+    def _get_shard_path(self, balls: int) -> str:
+        return os.path.join(self.path, f'{balls}balls')
+
+    def _get_index_filename(self, balls: int) -> str:
+        return os.path.join(self.path, f'{balls}balls.idx.json')
+
+    def _open(self, balls: int) -> _MappedFile:
+        """
+        Maps a siteswap file into memory, or returns the already mapped file.
+
+        :param   balls:                 number of balls
+        :raises  SiteswapFileException: if header is not valid or the file is too small for the header
+        :raises  Error:                 if file could not be read
+        :returns a _MappedFile
+        """
+        try:
+            return self._files[balls]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if balls not in self._files:
+                if os.path.exists(self._get_filename(balls)) or not self._exists(balls):
+                    self._files[balls] = self._map_file(self._get_filename(balls))
+                elif os.path.exists(self._get_compressed_filename(balls)):
+                    self._files[balls] = self._map_file(self._get_compressed_filename(balls))
+                else:
+                    self._files[balls] = self._map_shards(balls)
+
+            return self._files[balls]
+
+    def _map_file(self, filename: str) -> _MappedFile:
+        """
+        Maps a siteswap file of any version into memory.
+
+        :param   filename:              a filename
+        :raises  SiteswapFileException: if header is not valid or the file is too small for the header
+        :raises  Error:                 if file could not be read
+        :returns a _MappedFile, or a _CompressedFile for version 3 files
+        """
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            header_size = self._header_size(mm[:HEADER_V2_FIXED_SIZE])
+            b = mm[:header_size]
+            balls, max_throw, patterns = self._read_header(b)
+            version, width = self._read_format(b)
+
+            if version == 3:
+                f = _CompressedFile(mm, width, header_size, balls, max_throw, patterns, self._cache)
+            else:
+                f = _MappedFile(mm, version, width, header_size, balls, max_throw, patterns)
+
+            if len(mm) < f.size:
+                raise SiteswapFileException('File is smaller than the header says. Header and data mismatch.')
+        except:
+            mm.close()
+            raise
+
+        return f
+
+    def _map_shards(self, balls: int) -> _ShardedFile:
+        """
+        Maps the shards of a sharded database into memory, see register_shards.
+
+        :param   balls:                 number of balls
+        :raises  SiteswapFileException: if a shard does not match the manifest
+        :raises  Error:                 if file could not be read
+        :returns a _ShardedFile
+        """
+        with open(self._get_manifest_filename(balls), 'r') as f:
+            manifest = json.load(f)
+
+        shards = []
+
+        try:
+            for entry in manifest['shards']:
+                shard = self._map_file(os.path.join(self._get_shard_path(balls), entry['file']))
+                shards.append(shard)
+
+                if ((shard.balls, shard.max_throw, shard.version, shard.patterns.get(entry['period'])) !=
+                        (balls, manifest['max_throw'], manifest['version'], entry['patterns'])):
+                    raise SiteswapFileException(f'Shard {entry["file"]} does not match the manifest!')
+        except:
+            for shard in shards:
+                shard.close()
+            raise
+
+        return _ShardedFile(manifest, shards)
+
+    def _header_size(self, b: bytes) -> int:
+        """
+        Calculates the size of a header from its first HEADER_V2_FIXED_SIZE bytes.
+
+        :param   b:                     bytes from the start of the header
+        :raises  SiteswapFileException: if the version is not supported
+        :returns size of the header in bytes
+        """
+        version = self._read_version(b)
+
+        if version == 1:
+            return HEADER_SIZE
+
+        return HEADER_V2_FIXED_SIZE + decode_int(b[24:28]) * 8 + END_OF_HEADER_SIZE
+
+    def _read_format(self, b: bytes) -> tuple[int, int]:
+        """
+        Reads the format of the patterns from a header.
 
         :param   b:                     bytes making up the header
+        :raises  SiteswapFileException: if the version is not supported
+        :returns a tuple of (version, bits per throw). Version 1 files store hex nibbles, 4 bits per throw
+        """
+        version = self._read_version(b)
+
+        if version == 1:
+            return version, 4
+
+        return version, decode_int(b[28:32])
+
+    def _read_header(self, b: bytes) -> tuple[int, int, dict[int, int]]:
+        """
+        Reads the header of a siteswap file. Works with both versions.
+
+        :param   b:                     bytes starting with the header
         :raises  SiteswapFileException: if header is not valid
         :returns a tuple of (balls, max_throw, patterns)
         """
+        b = b[:self._header_size(b)]
+
         self._validate_header(b)
 
-        balls = decode_int(b[8:12])
-        max_throw = decode_int(b[12:16])
-        patterns = {i: decode_int(b[8+i*8:16+i*8]) for i in range(1, 17)}
+        if self._read_version(b) == 1:
+            balls = decode_int(b[8:12])
+            max_throw = decode_int(b[12:16])
+            patterns = {i: decode_int(b[8+i*8:16+i*8]) for i in range(1, 17)}
+        else:
+            balls = decode_int(b[16:20])
+            max_throw = decode_int(b[20:24])
+            periods = decode_int(b[24:28])
+            patterns = {i: decode_int(b[24+i*8:32+i*8]) for i in range(1, periods+1)}
 
         return balls, max_throw, patterns
 
+    def _read_header_from_file(self, f) -> bytes:
+        """
+        Reads the bytes making up the header from the start of an open file.
+
+        :param   f:                     a file opened in binary mode
+        :raises  SiteswapFileException: if the version is not supported
+        :returns the header
+        """
+        f.seek(0)
+        b = f.read(HEADER_V2_FIXED_SIZE)
+
+        if len(b) != HEADER_V2_FIXED_SIZE:
+            raise SiteswapFileException(f'Expecting {HEADER_V2_FIXED_SIZE} bytes when reading header!')
+
+        return b + f.read(self._header_size(b) - len(b))
+
+    def _read_version(self, b: bytes) -> int:
+        """
+        Reads the version of the file format from a header.
+
+        :param   b:                     bytes from the start of the header
+        :raises  SiteswapFileException: if the version is not supported
+        :returns 1, 2 or 3
+        """
+        if b[:8] != b'SITESWAP':
+            raise SiteswapFileException('File signature missing from header!')
+
+        if decode_int(b[8:12]) != 0:
+            # version 1 stores the number of balls here
+            return 1
+
+        version = decode_int(b[12:16])
+
+        if version not in (2, 3):
+            raise SiteswapFileException(f'Unsupported file version {version}!')
+
+        return version
+
     def _update_header(self, filename: str, new_patterns: dict[int, int]) -> None:
         """
         Updates the header of a siteswap file.
 
         :param filename:     a filename
         :param new_patterns: dictionary with period as key, number of patterns as value
+        :raises ValueError:  if new_patterns has periods that don't fit into the header
         :raises Error:       if file could not be read
         """
         try:
             with open(filename, 'r+b') as f:
                 # get the old header
-                balls, max_throw, patterns = self._read_header(f.read(HEADER_SIZE))
+                b = self._read_header_from_file(f)
+                balls, max_throw, patterns = self._read_header(b)
+
+                if any(i not in patterns for i in new_patterns):
+                    raise ValueError('new_patterns has periods that do not fit into the header!')
 
                 patterns.update(new_patterns)
 
-                new_header = _create_header(balls, max_throw, patterns)
+                new_header = self._create_header(balls, max_throw, patterns, self._read_version(b))
 
                 f.seek(0)
                 f.write(new_header)
@@ -114,26 +915,623 @@ class SiteswapDB():
         """
         Validates a header. Performs the following tests:
         
-        1) header size is HEADER_SIZE
+        1) header size is HEADER_SIZE, or the size given in a version 2 or 3 header
         2) file signature exists
         3) end of header exists
 
         :param b:                      bytes making up the header
         :raises SiteswapFileException: if header is not valid
         """
-        if len(b) != HEADER_SIZE:
-            raise SiteswapFileException(f'Expecting {HEADER_SIZE} bytes when reading header!')
+        if len(b) < HEADER_V2_FIXED_SIZE or len(b) != self._header_size(b):
+            raise SiteswapFileException('Wrong number of bytes when reading header!')
 
         signature = b[:8]
 
         if signature != b'SITESWAP':
             raise SiteswapFileException('File signature missing from header!')
 
-        end_of_header = b[-16:]
+        end_of_header = b[-END_OF_HEADER_SIZE:]
 
         if decode_hex(end_of_header) != 'f' * 32:
             raise SiteswapFileException('End of header missing from header!')
 
+    def _validate_build(self, balls: int, max_throw: int, periods: list[int], version: int) -> None:
+        """
+        Checks the arguments of build and build_shard.
+
+        :param balls:       number of balls
+        :param max_throw:   maximum throw of the siteswaps
+        :param periods:     sorted periods to generate
+        :param version:     version of the file format, 1 or 2
+        :raises ValueError: if arguments are not valid
+        """
+        if version not in (1, 2):
+            raise ValueError('version must be 1 or 2!')
+
+        # the generator supports periods up to 32
+        max_period, max_max_throw = (16, 15) if version == 1 else (32, MAX_THROW_V2)
+
+        if periods[0] < 1 or periods[-1] > max_period:
+            raise ValueError(f'periods must be between 1-{max_period}!')
+
+        if max_throw > max_max_throw:
+            raise ValueError(f'maximum throw must be at most {max_max_throw}!')
+
+        if balls < 1:
+            raise ValueError('number of balls must be greater than 0!')
+
+        if max_throw < balls:
+            raise ValueError('maximum throw must be at least the number of balls!')
+
+    def _write_json(self, filename: str, d: dict) -> None:
+        """
+        Atomically writes a dictionary to a JSON file, e.g. the checkpoint of a build.
+
+        :param filename: a filename
+        :param d:        a JSON serializable dictionary
+        """
+        with open(f'{filename}.tmp', 'w') as f:
+            json.dump(d, f)
+
+        os.replace(f'{filename}.tmp', filename)
+
+    def build(self, balls: int, max_throw: int, periods: list[int] = None, workers: int = None, version: int = 1) -> None:
+        """
+        Generates all siteswaps with the given number of balls into a siteswap file.
+
+        The siteswaps are generated in parallel and written to the file in (period, pattern) order
+        as they come in. The build is written to '{filename}.part' and checkpointed after every task to
+        '{filename}.part.json', so that calling build again with the same arguments resumes an interrupted build.
+
+        Version 1 files store every pattern in 8 bytes of hex, which limits them to periods 1-16 and
+        throws up to 15. Version 2 files bit-pack the throws with as few bits as max_throw needs and
+        support throws up to 35 and periods up to 32.
+
+        :param balls:                  number of balls
+        :param max_throw:              maximum throw of the siteswaps, at most 15 in version 1 and 35 in version 2
+        :param periods:                periods to generate, defaults to all periods between 1-16
+        :param workers:                number of worker processes, defaults to the number of CPUs
+        :param version:                version of the file format, 1 or 2
+        :raises ValueError:            if arguments are not valid
+        :raises SiteswapFileException: if the number of generated siteswaps is wrong
+        :raises Error:                 if file could not be written
+        """
+        # siteswap.py imports this module
+        from .siteswap import _partition_search, number_of_juggling_patterns
+
+        periods = sorted(set(periods or range(1, 17)))
+
+        self._validate_build(balls, max_throw, periods, version)
+
+        if not workers:
+            workers = os.cpu_count() or 1
+
+        width = max_throw.bit_length()
+        header = self._create_header(balls, max_throw, {p: 0 for p in range(1, periods[-1]+1)}, version)
+
+        filename = self._get_filename(balls)
+        part_filename = f'{filename}.part'
+        checkpoint_filename = f'{part_filename}.json'
+
+        checkpoint = {
+            'balls': balls,
+            'max_throw': max_throw,
+            'periods': periods,
+            'version': version,
+            'patterns': {},
+            'period': periods[0],
+            'tasks': None,
+            'task': 0,
+            'offset': len(header),
+        }
+
+        try:
+            os.makedirs(self.path, exist_ok=True)
+
+            resume = False
+
+            try:
+                with open(checkpoint_filename, 'r') as f:
+                    saved = json.load(f)
+
+                if (saved['balls'], saved['max_throw'], saved['periods'], saved['version']) == (balls, max_throw, periods, version):
+                    checkpoint = saved
+                    resume = os.path.exists(part_filename)
+            except (FileNotFoundError, ValueError, KeyError):
+                pass
+
+            if not resume:
+                # start from scratch with an empty header
+                with open(part_filename, 'wb') as f:
+                    f.write(header)
+
+            patterns = {int(k): v for k, v in checkpoint['patterns'].items()}
+            pool = get_pool(workers)
+
+            with open(part_filename, 'r+b') as f:
+                # throw away anything written after the last checkpoint
+                f.truncate(checkpoint['offset'])
+                f.seek(checkpoint['offset'])
+
+                for period in (p for p in periods if p >= checkpoint['period']):
+                    t = min(max_throw, balls * period)
+
+                    if checkpoint['tasks'] is None:
+                        checkpoint['tasks'] = [task[:3] for task in _partition_search(balls, period, t, workers)]
+
+                    tasks = checkpoint['tasks']
+                    size = BYTES_PER_PATTERN if version == 1 else record_size(period, width)
+                    patterns.setdefault(period, 0)
+
+                    results = iter_results(pool, pool.imap(
+                        _encoded_siteswaps_between,
+                        [(version, width, period, balls, t, i, i+1, x0, x1) for i, x0, x1 in tasks[checkpoint['task']:]]
+                    ))
+
+                    for chunk in results:
+                        f.write(chunk)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                        patterns[period] += len(chunk) // size
+
+                        checkpoint['patterns'] = patterns
+                        checkpoint['task'] += 1
+                        checkpoint['offset'] = f.tell()
+                        self._write_json(checkpoint_filename, checkpoint)
+
+                    N = number_of_juggling_patterns(balls, period, t)
+
+                    if patterns[period] != N:
+                        raise SiteswapFileException(f'Generated {patterns[period]} patterns with period {period}, expected {N}!')
+
+                    checkpoint['period'] = period + 1
+                    checkpoint['tasks'] = None
+                    checkpoint['task'] = 0
+                    self._write_json(checkpoint_filename, checkpoint)
+
+            self._update_header(part_filename, patterns)
+
+            self.close(balls)
+            os.replace(part_filename, filename)
+            os.remove(checkpoint_filename)
+
+            self.build_index(balls)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def extend(self, balls: int, new_max_throw: int, periods: list[int] = None, workers: int = None) -> None:
+        """
+        Raises the maximum throw of a siteswap file without generating the old siteswaps again.
+
+        The siteswaps of every period are sorted by their first throw, which is also their maximum
+        throw, so the new siteswaps all come after the old ones. Only the siteswaps with a leading throw
+        above the old max_throw are generated, and the file is rewritten period by period by copying the
+        old siteswaps in chunks and appending the new ones. The new file is written to '{filename}.part'
+        and replaces the old one only when it is complete, so the header and the data change at once.
+
+        In version 2 files the throws are packed again if new_max_throw needs more bits per throw.
+
+        :param balls:                  number of balls
+        :param new_max_throw:          the new maximum throw, at most 15 in version 1 and 35 in version 2
+        :param periods:                periods to extend besides the ones that have siteswaps,
+                                       e.g. periods that had none with the old max_throw
+        :param workers:                number of worker processes, defaults to the number of CPUs
+        :raises ValueError:            if arguments are not valid
+        :raises SiteswapFileException: if a period is not complete, or the number of siteswaps is wrong
+        :raises Error:                 if file could not be read or written
+        """
+        # siteswap.py imports this module
+        from .siteswap import _partition_search, number_of_juggling_patterns
+
+        filename = self._get_filename(balls)
+        part_filename = f'{filename}.part'
+
+        if not workers:
+            workers = os.cpu_count() or 1
+
+        try:
+            f = self._map_file(filename)
+
+            try:
+                max_throw = f.max_throw
+                periods = sorted(set(periods or []) | {period for period, n in f.patterns.items() if n})
+
+                if new_max_throw < max_throw:
+                    raise ValueError('new maximum throw must be at least the old one!')
+
+                self._validate_build(balls, new_max_throw, periods, f.version)
+
+                for period in periods:
+                    N = number_of_juggling_patterns(balls, period, min(max_throw, balls * period))
+
+                    if f.patterns.get(period, 0) != N:
+                        raise SiteswapFileException(f'Period {period} has {f.patterns.get(period, 0)} patterns, expected {N}!')
+
+                width = new_max_throw.bit_length()
+                patterns = {period: f.patterns.get(period, 0) for period in range(1, periods[-1]+1)}
+                pool = get_pool(workers)
+
+                with open(part_filename, 'wb') as g:
+                    g.write(self._create_header(balls, new_max_throw, {p: 0 for p in patterns}, f.version))
+
+                    for period in patterns:
+                        siteswaps = f.sequence(period)
+
+                        # the old siteswaps, packed again if a throw takes more bits now
+                        for i in range(0, len(siteswaps), CHUNK_SIZE):
+                            if f.version == 1 or width == f.width:
+                                g.write(siteswaps.array[i:i+CHUNK_SIZE].tobytes())
+                            else:
+                                g.write(pack_throws(siteswaps.throws(i, i+CHUNK_SIZE), width).tobytes())
+
+                        if period not in periods:
+                            continue
+
+                        # the new siteswaps have leading throws between the old and the new max_throw
+                        old, new = min(max_throw, balls * period), min(new_max_throw, balls * period)
+                        tasks = [task[:3] for task in _partition_search(balls, period, new, workers) if task[0] > old]
+                        size = BYTES_PER_PATTERN if f.version == 1 else record_size(period, width)
+
+                        results = iter_results(pool, pool.imap(
+                            _encoded_siteswaps_between,
+                            [(f.version, width, period, balls, new, i, i+1, x0, x1) for i, x0, x1 in tasks]
+                        ))
+
+                        for chunk in results:
+                            g.write(chunk)
+                            patterns[period] += len(chunk) // size
+
+                        N = number_of_juggling_patterns(balls, period, new)
+
+                        if patterns[period] != N:
+                            raise SiteswapFileException(f'Extended period {period} to {patterns[period]} patterns, expected {N}!')
+
+                    # the header goes in last, when all the counts are known
+                    g.seek(0)
+                    g.write(self._create_header(balls, new_max_throw, patterns, f.version))
+                    g.flush()
+                    os.fsync(g.fileno())
+            finally:
+                f.close()
+
+            self.close(balls)
+            os.replace(part_filename, filename)
+
+            self.build_index(balls)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def build_shard(self, balls: int, max_throw: int, period: int, start: int = None, stop: int = None,
+                    workers: int = None, version: int = 2) -> dict:
+        """
+        Generates the siteswaps with a single period and leading throws between start and stop
+        into a shard of a sharded database, e.g. on one of many machines sharing a filesystem.
+
+        The shard is written to '{balls}balls/p{period}_t{start}-{stop}.bin' and has the same format as
+        a whole siteswap file. Its number of patterns and checksum are written next to it to
+        '{shard}.json', and register_shards adds it to the manifest of the database.
+
+        The leading throw of a siteswap is also its maximum throw, and the ranges are the same as the
+        start and stop of all_siteswaps_between. For example, the shards (3, 9, 10, 4, 7) and
+        (3, 9, 10, 7, 10) together have all siteswaps with 3 balls, period 10 and a maximum throw up to 9.
+
+        :param balls:                  number of balls
+        :param max_throw:              maximum throw of the database, the same for all shards
+        :param period:                 period of the siteswaps
+        :param start:                  smallest leading throw, defaults to the smallest possible one
+        :param stop:                   leading throws are less than stop, defaults to max_throw+1
+        :param workers:                number of worker processes, defaults to the number of CPUs
+        :param version:                version of the file format, 1 or 2
+        :raises ValueError:            if arguments are not valid
+        :raises SiteswapFileException: if the number of generated siteswaps is wrong
+        :raises Error:                 if file could not be written
+        :returns the manifest entry of the shard
+        """
+        # siteswap.py imports this module
+        from .siteswap import _partition_search, number_of_juggling_patterns
+
+        self._validate_build(balls, max_throw, [period], version)
+
+        t = min(max_throw, balls * period)
+        first = balls if period == 1 else balls + 1
+
+        start = first if start is None else max(start, first)
+        stop = t + 1 if stop is None else min(stop, t + 1)
+
+        if stop <= start:
+            raise ValueError('there are no leading throws between start and stop!')
+
+        if not workers:
+            workers = os.cpu_count() or 1
+
+        width = max_throw.bit_length()
+        size = BYTES_PER_PATTERN if version == 1 else record_size(period, width)
+
+        name = f'p{period}_t{start}-{stop}.bin'
+        filename = os.path.join(self._get_shard_path(balls), name)
+        part_filename = f'{filename}.part'
+
+        tasks = [task[:3] for task in _partition_search(balls, period, t, workers) if start <= task[0] < stop]
+
+        # siteswaps with a maximum throw of at most x, minus the ones below start
+        def count(x: int) -> int:
+            return number_of_juggling_patterns(balls, period, x) if x >= balls else 0
+
+        expected = count(stop - 1) - count(start - 1)
+
+        try:
+            os.makedirs(self._get_shard_path(balls), exist_ok=True)
+
+            with open(part_filename, 'wb') as f:
+                f.write(self._create_header(balls, max_throw, {p: 0 for p in range(1, period+1)}, version))
+
+                n = 0
+                pool = get_pool(workers)
+                results = iter_results(pool, pool.imap(
+                    _encoded_siteswaps_between,
+                    [(version, width, period, balls, t, i, i+1, x0, x1) for i, x0, x1 in tasks]
+                ))
+
+                for chunk in results:
+                    f.write(chunk)
+                    n += len(chunk) // size
+
+                f.flush()
+                os.fsync(f.fileno())
+
+            if n != expected:
+                raise SiteswapFileException(f'Generated {n} patterns with period {period}, expected {expected}!')
+
+            self._update_header(part_filename, {period: n})
+            os.replace(part_filename, filename)
+
+            entry = {
+                'file': name,
+                'balls': balls,
+                'max_throw': max_throw,
+                'version': version,
+                'period': period,
+                'start': start,
+                'stop': stop,
+                'patterns': n,
+                'sha256': self._checksum(filename),
+            }
+
+            self._write_json(f'{filename}.json', entry)
+
+            return entry
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def register_shards(self, balls: int, verify: bool = True) -> dict:
+        """
+        Writes the manifest of a sharded database from the shards built with build_shard,
+        after which the shards are queried as one database. Shards can be registered
+        again at any time, e.g. after more of them have been built.
+
+        The manifest '{balls}balls/manifest.json' lists the shards with their periods, leading throw
+        ranges, numbers of patterns and checksums. It also tells for every period how many patterns
+        the shards have and whether that is all of them.
+
+        A sharded database is used only if there is no '{balls}balls.bin' file.
+
+        :param balls:                  number of balls
+        :param verify:                 check the checksums of the shards
+        :raises SiteswapFileException: if there are no shards, they don't have the same max_throw and version,
+                                       their leading throws overlap or their checksums don't match
+        :raises Error:                 if file could not be read or written
+        :returns the manifest
+        """
+        # siteswap.py imports this module
+        from .siteswap import number_of_juggling_patterns
+
+        path = self._get_shard_path(balls)
+        entries = []
+
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.bin.json'):
+                with open(os.path.join(path, name), 'r') as f:
+                    entries.append(json.load(f))
+
+        if not entries:
+            raise SiteswapFileException(f'No shards in {path}!')
+
+        max_throw = entries[0]['max_throw']
+        version = entries[0]['version']
+        entries.sort(key=lambda entry: (entry['period'], entry['start']))
+
+        for previous, entry in zip([None] + entries, entries):
+            if (entry['balls'], entry['max_throw'], entry['version']) != (balls, max_throw, version):
+                raise SiteswapFileException(f'Shard {entry["file"]} does not match the other shards!')
+
+            if previous and previous['period'] == entry['period'] and previous['stop'] > entry['start']:
+                raise SiteswapFileException(f'Shards {previous["file"]} and {entry["file"]} overlap!')
+
+            if verify and self._checksum(os.path.join(path, entry['file'])) != entry['sha256']:
+                raise SiteswapFileException(f'Checksum of shard {entry["file"]} does not match!')
+
+        periods = {}
+
+        for entry in entries:
+            periods[entry['period']] = periods.get(entry['period'], 0) + entry['patterns']
+
+        manifest = {
+            'balls': balls,
+            'max_throw': max_throw,
+            'version': version,
+            'periods': {
+                period: {
+                    'patterns': n,
+                    'complete': n == number_of_juggling_patterns(balls, period, min(max_throw, balls * period)),
+                }
+                for period, n in periods.items()
+            },
+            'shards': entries,
+        }
+
+        self._write_json(self._get_manifest_filename(balls), manifest)
+
+        # the next query maps the registered shards and indexes them again
+        self.close(balls)
+
+        if os.path.exists(self._get_index_filename(balls)):
+            os.remove(self._get_index_filename(balls))
+
+        return manifest
+
+    def compress(self, balls: int, codec: str = 'zlib', block_size: int = BLOCK_SIZE) -> None:
+        """
+        Writes a compressed copy of a siteswap file to '{balls}balls.binz' for cold storage.
+        It is used instead of '{balls}balls.bin' when that file doesn't exist, so remove
+        the original to use the compressed one.
+
+        The compressed file is a version 3 file. The sorted siteswaps of every period are cut into
+        blocks of block_size patterns, and every block is delta encoded (see delta_encode_throws) and
+        compressed on its own. A block index of where every block starts and the first siteswap of
+        every block lets get_siteswap, index_of and range reads decompress only the blocks they
+        need. The most recently used blocks are kept decompressed, see cache_blocks.
+
+        :param balls:       number of balls
+        :param codec:       'zlib', or 'lzma' for smaller files that are slower to read
+        :param block_size:  number of patterns per block
+        :raises ValueError: if arguments are not valid
+        :raises Error:      if file could not be read or written
+        """
+        codecs = {name: i for i, (name, _, _) in CODECS.items()}
+
+        if codec not in codecs:
+            raise ValueError(f'codec must be one of {", ".join(codecs)}!')
+
+        if block_size < 1:
+            raise ValueError('block size must be at least 1!')
+
+        try:
+            f = self._open(balls)
+            compress = CODECS[codecs[codec]][1]
+            patterns = {period: f.patterns.get(period, 0) for period in range(1, max(f.patterns)+1)}
+
+            filename = self._get_compressed_filename(balls)
+            part_filename = f'{filename}.part'
+
+            with open(part_filename, 'wb') as g:
+                g.write(self._create_header(balls, f.max_throw, patterns, 3))
+                g.write(encode_int32(codecs[codec]) + encode_int32(block_size))
+
+                # leave room for the block indices, they are filled in once the blocks are written
+                index_offsets = {}
+
+                for period, n in patterns.items():
+                    k = -(-n // block_size)
+                    index_offsets[period] = g.tell()
+                    g.write(bytes((k+1) * 8 + k * period))
+
+                for period, n in patterns.items():
+                    siteswaps = f.sequence(period) if n else None
+                    offsets = [g.tell()]
+                    firsts = []
+
+                    for i in range(0, n, block_size):
+                        throws = siteswaps.throws(i, i+block_size)
+                        firsts.append(throws[0])
+
+                        g.write(compress(delta_encode_throws(throws)))
+                        offsets.append(g.tell())
+
+                    g.seek(index_offsets[period])
+                    g.write(np.array(offsets, dtype='>i8').tobytes() + np.array(firsts, dtype=np.uint8).tobytes())
+                    g.seek(0, os.SEEK_END)
+
+                g.flush()
+                os.fsync(g.fileno())
+
+            if os.path.exists(filename):
+                self.close(balls)
+
+            os.replace(part_filename, filename)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def build_index(self, balls: int) -> dict[int, list[int]]:
+        """
+        Builds the max throw index of a siteswap file in a single sequential pass
+        and writes it to '{balls}balls.idx.json'.
+
+        The patterns of every period are sorted by their first throw, which is also their
+        maximum throw. For every period, the index holds a list of offsets where offsets[t] is
+        the number of patterns with a maximum throw less than t, for t between 0 and max_throw+1.
+        So the patterns with a maximum throw of at most t are the first offsets[t+1] patterns.
+
+        :param   balls:                 number of balls
+        :raises  SiteswapFileException: if the patterns are not sorted by their first throw
+        :raises  Error:                 if file could not be read
+        :returns a dictionary with period as key, list of offsets as value
+        """
+        f = self._open(balls)
+        index = {}
+
+        for period in f.patterns:
+            siteswaps = f.sequence(period)
+            counts = np.zeros(f.max_throw+1, dtype=np.int64)
+            previous = 0
+
+            for i in range(0, len(siteswaps), CHUNK_SIZE):
+                leading_throws = siteswaps.leading_throws(i, i+CHUNK_SIZE)
+
+                if leading_throws[0] < previous or np.any(np.diff(leading_throws.astype(np.int64)) < 0):
+                    raise SiteswapFileException(f'Patterns with period {period} are not sorted by their first throw!')
+
+                previous = leading_throws[-1]
+                counts += np.bincount(leading_throws, minlength=f.max_throw+1)[:f.max_throw+1]
+
+            index[period] = [0] + np.cumsum(counts).tolist()
+
+        f.index = index
+
+        try:
+            self._write_json(self._get_index_filename(balls), {
+                'max_throw': f.max_throw,
+                'version': f.version,
+                'patterns': f.patterns,
+                'offsets': index,
+            })
+        except (IsADirectoryError, PermissionError, OSError):
+            # a read-only database still works, the index is just kept in memory
+            pass
+
+        return index
+
+    def count(self, balls: int, period: int, max_throw: int = None) -> int:
+        """
+        Counts the siteswaps with balls b and period n in a siteswap file.
+        A period that is not in the file has no siteswaps.
+
+        For example:
+            count(3, 3)    => 12
+            count(3, 3, 5) => 10
+            count(3, 20)   => 0
+
+        :param   balls:                 number of balls in the siteswap pattern
+        :param   period:                the period of the siteswap pattern
+        :param   max_throw:             count only siteswaps with a maximum throw of at most max_throw
+        :raises  SiteswapFileException: if header is not valid
+        :raises  Error:                 if file could not be read
+        :returns number of siteswaps
+        """
+        f = self._open(balls)
+
+        if period not in f.patterns:
+            # don't have it in database
+            return 0
+
+        if max_throw is None or max_throw >= f.max_throw:
+            return f.patterns[period]
+
+        if max_throw < 0:
+            return 0
+
+        return self._get_index(balls)[period][max_throw+1]
+
     def get_header(self, balls: int) -> tuple[int, int, dict[int, int]]:
         """
         Gets the header of a siteswap file.
@@ -143,12 +1541,9 @@ class SiteswapDB():
         :returns a tuple of (balls, max_throw, patterns)
         """
         try:
-            filename = os.path.join(os.path.dirname(__file__), 'db', f'{balls}balls.bin')
-
-            with open(filename, 'rb') as f:
-                balls, max_throw, patterns = self._read_header(f.read(HEADER_SIZE))
+            f = self._open(balls)
 
-            return balls, max_throw, patterns
+            return f.balls, f.max_throw, dict(f.patterns)
         except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
             print(e)
 
@@ -171,76 +1566,167 @@ class SiteswapDB():
         :raises SiteswapFileException: if period of fetched siteswap is wrong, meaning that header and data don't match
         """
         try:
-            filename = os.path.join(os.path.dirname(__file__), 'db', f'{balls}balls.bin')
-
-            with open(filename, 'rb') as f:
-                _, _, patterns = self._read_header(f.read(HEADER_SIZE))
-
-                period_start = sum(list(patterns.values())[:period-1])
-                period_end = sum(list(patterns.values())[:period])
+            siteswaps = self.get_sequence(balls, period)
 
-                if (i > patterns[period] or
-                    i + period_start >= period_end):
-                    # don't have it in database
-                    raise IndexError('Index out of range')
+            if not 0 <= i < len(siteswaps):
+                # don't have it in database
+                raise IndexError('Index out of range')
 
-                # calculate the offset where to read data from
-                offset = HEADER_SIZE + (period_start + i) * BYTES_PER_PATTERN
+            siteswap = siteswaps[i]
 
-                f.seek(offset)
+            if len(siteswap) != period:
+                raise SiteswapFileException('Period of fetched siteswap is wrong. Header and data mismatch.')
 
-                siteswap = decode_hex(f.read(8))
-
-                if len(siteswap) != period:
-                    raise SiteswapFileException('Period of fetched siteswap is wrong. Header and data mismatch.')
-
-                return siteswap
+            return siteswap
         except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
             print(e)
 
-    def get_siteswaps(self, balls: int, period: int) -> list[str]:
+    def get_siteswaps(self, balls: int, period: int, max_throw: int = None) -> list[str]:
         """
         Fetches all siteswaps with balls b and period n from a siteswap file.
+        A period that is not in the file has no siteswaps.
         
         For example:
-            get_siteswaps(2, 2) => ['31', '40']
+            get_siteswaps(2, 2)    => ['31', '40']
+            get_siteswaps(2, 2, 3) => ['31']
+            get_siteswaps(2, 20)   => []
+
+        :param balls:     number of balls in the siteswap pattern
+        :param period:    the period of the siteswap pattern
+        :param max_throw: fetch only siteswaps with a maximum throw of at most max_throw
+        :returns          a list of siteswaps
+        :raises Error:    if file could not be read
+        """
+        try:
+            siteswaps = self.get_sequence(balls, period, max_throw)
 
-        :param balls:  number of balls in the siteswap pattern
-        :param period: the period of the siteswap pattern
-        :returns       a list of siteswaps
-        :raises Error: if file could not be read
+            if siteswaps and (len(siteswaps[0]) != period or
+                              len(siteswaps[-1]) != period):
+                # raise an exception
+                raise SiteswapFileException('Period of fetched siteswaps is wrong. Header and data mismatch.')
+
+            return list(siteswaps)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def index_of(self, siteswap: str) -> int:
+        """
+        Finds the index of a siteswap, i.e. the i for which get_siteswap(i, balls, period) returns it.
+
+        The siteswap can be given in any rotation and repeated any number of times. Balls and
+        period are those of its shortest repeating part, for example '144144' is found as '441'
+        with balls=3, period=3. The sorted patterns of the period are binary searched, so only
+        a few patterns are read from the file.
+
+        For example:
+            index_of('40') => 1
+            index_of('04') => 1
+            index_of('42') => ValueError
+
+        :param siteswap:    a siteswap
+        :returns            index of the siteswap
+        :raises ValueError: if the siteswap is not valid or not in db
+        :raises Error:      if file could not be read
         """
+        canonical = _canonical_siteswap(siteswap)
+
+        if canonical is None:
+            raise ValueError(f'{siteswap!r} is not a valid siteswap')
+
         try:
-            filename = os.path.join(os.path.dirname(__file__), 'db', f'{balls}balls.bin')
+            i = self._find(*canonical)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+            return None
 
-            with open(filename, 'rb') as f:
-                _, _, patterns = self._read_header(f.read(HEADER_SIZE))
+        if i is None:
+            raise ValueError(f'{siteswap!r} is not in db')
+
+        return i
 
-                period_start = sum(list(patterns.values())[:period-1])
-                period_end = sum(list(patterns.values())[:period])
+    def get_siteswaps_by_index(self, balls: int, period: int, indices: list[int],
+                               as_array: bool = False) -> list[str]:
+        """
+        Fetches many siteswaps with balls b and period n by their indices at once,
+        e.g. for random draws or pagination. Indices are the same as in get_siteswap.
 
-                offset = HEADER_SIZE + period_start * BYTES_PER_PATTERN
+        The indices are sorted and deduplicated first, so the file is read
+        from start to end and every pattern is decoded only once.
 
-                f.seek(offset)
+        For example:
+            get_siteswaps_by_index(2, 2, [1, 0, 1])                => ['40', '31', '40']
+            get_siteswaps_by_index(2, 2, [1, 0, 1], as_array=True) => array([[4, 0], [3, 1], [4, 0]], dtype=uint8)
+
+        :param balls:       number of balls in the siteswap pattern
+        :param period:      the period of the siteswap pattern
+        :param indices:     indices of the siteswap patterns
+        :param as_array:    return an (N, period) uint8 array of throws instead of strings
+        :returns            the siteswaps in the same order as indices
+        :raises IndexError: if an index is not in db
+        :raises Error:      if file could not be read
+        """
+        try:
+            siteswaps = self.get_sequence(balls, period)
+            indices = np.asarray(indices, dtype=np.int64).reshape(-1)
 
-                chunk = f.read((period_end - period_start) * BYTES_PER_PATTERN)
+            if len(indices) and (indices.min() < 0 or indices.max() >= len(siteswaps)):
+                # don't have it in database
+                raise IndexError('Index out of range')
 
-                first_siteswap = decode_hex(chunk[:8])
-                last_siteswap = decode_hex(chunk[-8:])
+            unique, inverse = np.unique(indices, return_inverse=True)
+            throws = siteswaps.take(unique)[inverse]
 
-                if (len(first_siteswap) != period or
-                    len(last_siteswap) != period):
-                    # raise an exception
-                    raise SiteswapFileException('Period of fetched siteswaps is wrong. Header and data mismatch.')
+            if as_array:
+                return throws
 
-                return [decode_hex(chunk[i:i+8]) for i in range(0, len(chunk), 8)]
+            return throws_to_siteswaps(throws)
         except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
             print(e)
 
-    # # TO-DO: patterns to key db.patterns[b][p]
-    # @property
-    # def patterns(self, i) -> dict[dict[int, list[str]]]:
-    #     return self.read_file(f'db/{i}balls.bin')
+    def get_sequence(self, balls: int, period: int, max_throw: int = None) -> SiteswapSequence:
+        """
+        Gets all siteswaps with balls b and period n from a siteswap file as a lazy sequence.
+        Nothing is read from the file until the siteswaps are accessed. A period that is
+        not in the file gives an empty sequence.
+
+        For example:
+            get_sequence(2, 2)[1]     => '40'
+            get_sequence(2, 2).array  => array([49, 64], dtype='>u8')
+
+        :param   balls:                 number of balls in the siteswap pattern
+        :param   period:                the period of the siteswap pattern
+        :param   max_throw:             get only siteswaps with a maximum throw of at most max_throw
+        :raises  SiteswapFileException: if header is not valid
+        :raises  Error:                 if file could not be read
+        :returns a SiteswapSequence
+        """
+        siteswaps = self._open(balls).sequence(period)
+
+        if max_throw is None:
+            return siteswaps
+
+        # the siteswaps with a maximum throw of at most max_throw come first
+        return siteswaps[:self.count(balls, period, max_throw)]
+
+    @property
+    def patterns(self) -> '_Patterns':
+        """
+        All siteswap files as lazy sequences, keyed by balls and period. For example:
+            db.patterns[2][2] => SiteswapSequence(2 patterns)
+        """
+        return _Patterns(self)
+
+    def close(self, balls: int = None) -> None:
+        """
+        Unmaps the siteswap files mapped into memory. The next query maps them again.
+
+        :param balls: number of balls of the file to close, defaults to all files
+        """
+        for b in list(self._files) if balls is None else [balls]:
+            f = self._files.pop(b, None)
+
+            if f is not None:
+                f.close()
 
     def print_info(self, filename: str) -> None:
         """
@@ -251,9 +1737,12 @@ class SiteswapDB():
         """
         try:
             with open(filename, 'rb') as f:
-                balls, max_throw, patterns = self._read_header(f.read(HEADER_SIZE))
+                b = self._read_header_from_file(f)
+                balls, max_throw, patterns = self._read_header(b)
+                version, _ = self._read_format(b)
+                size = os.fstat(f.fileno()).st_size
 
-            print(f"\nSiteswap database file '{filename}'")
+            print(f"\nSiteswap database file '{filename}' (version {version})")
             print(f"{balls} ball{'' if balls == 1 else 's'} with max_throw {max_throw}\n")
 
             p = 0
@@ -261,7 +1750,7 @@ class SiteswapDB():
                 p += v
                 print(f"Period {k}:\t{v} pattern{'' if v == 1 else 's'}")
 
-            print(f"\nTotal: {p} pattern{'' if p == 1 else 's'}. File size on disk: {patterns_to_printable_filesize(p)}")
+            print(f"\nTotal: {p} pattern{'' if p == 1 else 's'}. File size on disk: {bytes_to_printable_filesize(size)}")
         except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
             print(e)
 
@@ -273,18 +1762,18 @@ class SiteswapDB():
         :returns       a dictionary with period as key, list of patterns as value
         :raises Error: if file could not be read
         """
-        d = {i: [] for i in range(1, 17)}
-
         try:
-            with open(filename, 'rb') as f:
-                # check that the header is all right
-                self._validate_header(f.read(HEADER_SIZE))
-
-                while chunk := f.read(CHUNK_SIZE):
-                    mem_view = memoryview(chunk)
-                    gen = (decode_hex(mem_view[i:i+8]) for i in range(0, len(mem_view), 8))
-                    for s in gen:
-                        d[len(s)].append(s)
-            return d
+            f = self._map_file(filename)
+
+            return {period: list(f.sequence(period)) for period in f.patterns}
         except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
             print(e)
+
+class _Patterns():
+    def __init__(self, db: SiteswapDB) -> None:
+        self._db = db
+
+    def __getitem__(self, balls: int) -> dict[int, SiteswapSequence]:
+        f = self._db._open(balls)
+
+        return {period: f.sequence(period) for period in f.patterns}
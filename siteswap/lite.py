@@ -0,0 +1,320 @@
+from ._helpers._db_constants import (
+    BYTES_PER_PATTERN,
+    END_OF_HEADER_SIZE,
+    HEADER_SIZE,
+    HEADER_V2_FIXED_SIZE,
+)
+from ._helpers._exceptions import SiteswapFileException
+from ._helpers._notation import _canonical_siteswap, int_to_siteswap, siteswap_to_int
+from bisect import bisect_left
+import mmap
+import os
+import threading
+
+__all__ = ['LiteSiteswapDB']
+
+class _Records():
+    """
+    The raw records of a single period of a siteswap file, for bisect. The records are
+    sorted, and their big endian encodings sort in the same order as the throws.
+    """
+    def __init__(self, mm: mmap.mmap, offset: int, size: int, n: int) -> None:
+        self.mmap = mm
+        self.offset = offset
+        self.size = size
+        self.n = n
+
+    def __getitem__(self, i: int) -> bytes:
+        start = self.offset + i * self.size
+
+        return self.mmap[start:start + self.size]
+
+    def __len__(self) -> int:
+        return self.n
+
+class _LiteFile():
+    """
+    A version 1 or 2 siteswap file mapped into memory, see SiteswapDB._map_file.
+    """
+    def __init__(self, mm: mmap.mmap, version: int, width: int, header_size: int,
+                 balls: int, max_throw: int, patterns: dict[int, int]) -> None:
+        self.mmap = mm
+        self.version = version
+        self.width = width
+        self.balls = balls
+        self.max_throw = max_throw
+        self.patterns = patterns
+
+        # byte offset and record size of every period
+        self.offsets = {}
+        self.record_sizes = {}
+        offset = header_size
+
+        for period, n in patterns.items():
+            self.offsets[period] = offset
+            self.record_sizes[period] = BYTES_PER_PATTERN if version == 1 else (period * width + 7) // 8
+            offset += n * self.record_sizes[period]
+
+        self.size = offset
+
+    def records(self, period: int) -> _Records:
+        # a period that is not in the file has no records
+        return _Records(self.mmap, self.offsets.get(period, 0), self.record_sizes.get(period, 0),
+                        self.patterns.get(period, 0))
+
+    def decode(self, b: bytes, period: int) -> str:
+        if self.version == 1:
+            # hex nibbles, see encode_hex
+            return b.hex()[-period:]
+
+        # throws of width bits, most significant bit first, see pack_throws
+        bits = int.from_bytes(b, byteorder='big') >> (len(b) * 8 - period * self.width)
+        mask = (1 << self.width) - 1
+
+        return ''.join(int_to_siteswap(bits >> (self.width * (period-1-k)) & mask) for k in range(period))
+
+    def encode(self, throws: list[int]) -> bytes:
+        period = len(throws)
+
+        if self.version == 1:
+            return bytes.fromhex(''.join(int_to_siteswap(x) for x in throws).rjust(16, '0'))
+
+        size = self.record_sizes[period]
+        bits = 0
+
+        for x in throws:
+            bits = bits << self.width | x
+
+        return (bits << (size * 8 - period * self.width)).to_bytes(size, byteorder='big')
+
+    def close(self) -> None:
+        self.mmap.close()
+
+class LiteSiteswapDB():
+    def __init__(self, path: str = None) -> None:
+        """
+        Read-only queries of the version 1 and 2 siteswap files of a SiteswapDB, with nothing
+        but the standard library. Importing siteswap.lite doesn't import numpy, scipy or the
+        compiled search, so short-lived processes that only look siteswaps up start quickly.
+
+        Compressed (.binz) and sharded databases are read with SiteswapDB.
+
+        :param path: directory of the siteswap files, defaults to the 'db' directory of this package
+        """
+        if path is None:
+            path = os.path.join(os.path.dirname(__file__), 'db')
+
+        self.path = path
+
+        # siteswap files that have been mapped into memory, by number of balls
+        self._files = {}
+
+        # makes sure that reads from several threads map a file only once
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'LiteSiteswapDB':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, siteswap: str) -> bool:
+        canonical = _canonical_siteswap(siteswap) if isinstance(siteswap, str) else None
+
+        if canonical is None or not os.path.exists(self._get_filename(canonical[1])):
+            return False
+
+        return self._find(*canonical) is not None
+
+    def close(self) -> None:
+        """
+        Unmaps the siteswap files. They are mapped again on the next query.
+        """
+        with self._lock:
+            for f in self._files.values():
+                f.close()
+
+            self._files.clear()
+
+    def count(self, balls: int, period: int, max_throw: int = None) -> int:
+        """
+        See SiteswapDB.count. The siteswaps are sorted by their first throw, which is their
+        biggest throw, so the count for a max_throw is binary searched without an index.
+
+        :raises SiteswapFileException: if header is not valid
+        :raises Error:                 if file could not be read
+        """
+        f = self._open(balls)
+
+        if period not in f.patterns:
+            # don't have it in database
+            return 0
+
+        if max_throw is None or max_throw >= f.max_throw:
+            return f.patterns[period]
+
+        if max_throw < 0:
+            return 0
+
+        # the smallest siteswap that starts with a bigger throw
+        return bisect_left(f.records(period), f.encode([max_throw+1] + [0] * (period-1)))
+
+    def get_header(self, balls: int) -> tuple[int, int, dict[int, int]]:
+        """
+        See SiteswapDB.get_header.
+
+        :raises SiteswapFileException: if header is not valid
+        """
+        try:
+            f = self._open(balls)
+
+            return f.balls, f.max_throw, dict(f.patterns)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def get_siteswap(self, i: int, balls: int, period: int) -> str:
+        """
+        See SiteswapDB.get_siteswap.
+
+        :raises IndexError: if index is not in db
+        :raises Error:      if file could not be read
+        """
+        try:
+            f = self._open(balls)
+
+            if not 0 <= i < f.patterns.get(period, 0):
+                # don't have it in database
+                raise IndexError('Index out of range')
+
+            return f.decode(f.records(period)[i], period)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def get_siteswaps(self, balls: int, period: int, max_throw: int = None) -> list[str]:
+        """
+        See SiteswapDB.get_siteswaps.
+
+        :raises Error: if file could not be read
+        """
+        try:
+            f = self._open(balls)
+            records = f.records(period)
+            n = self.count(balls, period, max_throw)
+
+            return [f.decode(records[i], period) for i in range(n)]
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+
+    def index_of(self, siteswap: str) -> int:
+        """
+        See SiteswapDB.index_of.
+
+        :raises ValueError: if the siteswap is not valid or not in db
+        :raises Error:      if file could not be read
+        """
+        canonical = _canonical_siteswap(siteswap)
+
+        if canonical is None:
+            raise ValueError(f'{siteswap!r} is not a valid siteswap')
+
+        try:
+            i = self._find(*canonical)
+        except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
+            print(e)
+            return None
+
+        if i is None:
+            raise ValueError(f'{siteswap!r} is not in db')
+
+        return i
+
+    def _find(self, siteswap: str, balls: int) -> int:
+        # binary searches for a canonical siteswap, see SiteswapDB._find
+        f = self._open(balls)
+        period = len(siteswap)
+        throws = [siteswap_to_int(c) for c in siteswap]
+
+        if period not in f.patterns or max(throws) > f.max_throw:
+            return None
+
+        records = f.records(period)
+        target = f.encode(throws)
+        i = bisect_left(records, target)
+
+        if i < len(records) and records[i] == target:
+            return i
+
+        return None
+
+    def _get_filename(self, balls: int) -> str:
+        return os.path.join(self.path, f'{balls}balls.bin')
+
+    def _open(self, balls: int) -> _LiteFile:
+        try:
+            return self._files[balls]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if balls not in self._files:
+                self._files[balls] = self._map_file(self._get_filename(balls))
+
+            return self._files[balls]
+
+    def _map_file(self, filename: str) -> _LiteFile:
+        """
+        Maps a version 1 or 2 siteswap file into memory and reads its header,
+        see SiteswapDB._read_header.
+
+        :param   filename:              a filename
+        :raises  SiteswapFileException: if header is not valid or the file is too small for the header
+        :raises  Error:                 if file could not be read
+        :returns a _LiteFile
+        """
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            f = _LiteFile(mm, *self._read_header(mm))
+
+            if len(mm) < f.size:
+                raise SiteswapFileException('File is smaller than the header says. Header and data mismatch.')
+        except:
+            mm.close()
+            raise
+
+        return f
+
+    def _read_header(self, mm: mmap.mmap) -> tuple:
+        """
+        :raises  SiteswapFileException: if header is not valid or the version is not supported
+        :returns a tuple of (version, width, header_size, balls, max_throw, patterns)
+        """
+        def decode_int(start: int, stop: int) -> int:
+            return int.from_bytes(mm[start:stop], byteorder='big')
+
+        if len(mm) < HEADER_V2_FIXED_SIZE or mm[:8] != b'SITESWAP':
+            raise SiteswapFileException('File signature missing from header!')
+
+        if decode_int(8, 12) != 0:
+            # version 1 stores the number of balls here
+            version, width, header_size = 1, 4, HEADER_SIZE
+            balls, max_throw = decode_int(8, 12), decode_int(12, 16)
+            patterns = {i: decode_int(8+i*8, 16+i*8) for i in range(1, 17)}
+        else:
+            version = decode_int(12, 16)
+
+            if version != 2:
+                raise SiteswapFileException(f'Unsupported file version {version}! '
+                                            'Compressed files can only be read with SiteswapDB.')
+
+            periods = decode_int(24, 28)
+            width = decode_int(28, 32)
+            header_size = HEADER_V2_FIXED_SIZE + periods * 8 + END_OF_HEADER_SIZE
+            balls, max_throw = decode_int(16, 20), decode_int(20, 24)
+            patterns = {i: decode_int(24+i*8, 32+i*8) for i in range(1, periods+1)}
+
+        if mm[header_size-END_OF_HEADER_SIZE:header_size] != b'\xff' * END_OF_HEADER_SIZE:
+            raise SiteswapFileException('End of header missing from header!')
+
+        return version, width, header_size, balls, max_throw, patterns
@@ -0,0 +1,56 @@
+import threading
+
+__all__ = ['CancellationToken', 'ProgressEvent']
+
+# can be cancelled from any thread, e.g. from a progress callback or a signal handler.
+# a search that is given the token stops as soon as possible after cancel is called
+class CancellationToken():
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+# passed to the progress callback of all_siteswaps when a task starts or finishes.
+#
+# task is (leading_throw, second_start, second_stop), see _partition_search.
+# patterns is the number of siteswaps the task found, and wall_time and cpu_time are the
+# seconds it took in its worker. they are None for 'start' events
+class ProgressEvent():
+    def __init__(self, kind: str, task: tuple[int, int, int], tasks_done: int, tasks_total: int,
+                 patterns_done: int, patterns_total: int, elapsed: float, patterns: int = None,
+                 wall_time: float = None, cpu_time: float = None) -> None:
+        self.kind = kind
+        self.task = task
+        self.tasks_done = tasks_done
+        self.tasks_total = tasks_total
+        self.patterns_done = patterns_done
+        self.patterns_total = patterns_total
+        self.elapsed = elapsed
+        self.patterns = patterns
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+
+    def __repr__(self) -> str:
+        return (f'ProgressEvent({self.kind!r}, task={self.task}, tasks={self.tasks_done}/{self.tasks_total}, '
+                f'patterns={self.patterns_done}/{self.patterns_total}, elapsed={self.elapsed:.2f})')
+
+    # estimated seconds until all the patterns have been found, or None if nothing has been found yet
+    @property
+    def eta(self) -> float:
+        if not self.patterns_done:
+            return None
+
+        return (self.patterns_total - self.patterns_done) / self.patterns_done * self.elapsed
+
+    @property
+    def fraction_done(self) -> float:
+        return self.patterns_done / self.patterns_total if self.patterns_total else 1.0
+
+    @property
+    def patterns_per_second(self) -> float:
+        return self.patterns_done / self.elapsed if self.elapsed else 0.0
@@ -1,83 +1,1000 @@
 from ._helpers._helper_functions import (
+    _canonical_siteswap,
+    _sort_sequence,
+    _substring_is_periodic,
     adjacency_matrix,
     divisors,
+    juggling_states,
     mobius,
+    state_rank,
 )
-from ._helpers._siteswap_cython import all_siteswaps_between
+from ._helpers._batch import batch_balls_dont_collide, batch_minimal_periods, batch_sort_sequences
+from ._helpers._counting import closed_walk_counts, closed_walk_diagonal
+from ._helpers._pool import (
+    check_pool,
+    get_events,
+    get_pool,
+    private_pool,
+    receive,
+    report,
+    subscribe,
+    unsubscribe,
+    wait,
+)
+from ._helpers._siteswap_cython import (
+    all_siteswaps_between,
+    iter_siteswaps_between,
+    state_siteswaps_between,
+)
+from ._helpers._util_functions import (
+    INVALID_SYMBOL,
+    int_to_siteswap,
+    siteswap_to_int,
+    siteswaps_to_throws,
+    throws_to_siteswaps,
+)
+from .progress import CancellationToken, ProgressEvent
 
-from siteswap.database import SiteswapDB
-from multiprocessing import Pool
-from random import randrange
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache, partial
+from itertools import accumulate, combinations, count
+from math import ceil, comb
+from random import choice, randrange, sample
 import json
 import numpy as np
+import os
+import secrets
+import threading
+import time
+
+__all__ = ['all_siteswaps', 'analyze_siteswaps', 'iter_number_of_juggling_patterns_table', 'iter_siteswaps',
+           'number_of_juggling_patterns', 'number_of_juggling_patterns_table', 'random_siteswap',
+           'random_siteswaps', 'transition_matrix', 'transitions']
+
+# searches smaller than this are not worth splitting up further
+# than one task per leading throw
+SPLIT_THRESHOLD = 100000
+
+# counting patterns for the estimates gets expensive with many states
+MAX_ESTIMATE_STATES = 5000
+
+# aim for this many tasks per worker so that the workers that finish
+# early can pick up the remaining tasks
+TASKS_PER_WORKER = 8
+
+# the search functions behind all_siteswaps. 'composition' goes through every sum of
+# throws in order and checks each one, 'state' walks the juggling state graph
+ENGINES = {
+    'composition': all_siteswaps_between,
+    'state': state_siteswaps_between,
+}
 
-__all__ = ['all_siteswaps', 'number_of_juggling_patterns', 'random_siteswap']
+# how often (in seconds) a search with progress or cancel checks on its tasks
+POLL_INTERVAL = 0.05
 
-def all_siteswaps(balls: int, period: int, max_throw: int = None) -> list[str]:
+# tells the events of different searches apart
+_search_ids = count()
+
+# the throws of a task with as_array=True go through shared memory only if they take at least
+# this many bytes. smaller tasks send them back as bytes, which is cheaper than a new block
+SHARED_MEMORY_MIN_SIZE = 1 << 16
+
+# bytes of walk tables of the random siteswap sampler kept in memory, see _walks_to
+WALK_CACHE_BYTES = 64 << 20
+
+_walk_cache = OrderedDict()
+_walk_cache_bytes = 0
+
+# number of breadth first search trees of the state graphs kept in memory, see transitions
+TRANSITION_CACHE_SIZE = 1024
+
+# progress is called with a ProgressEvent when a task starts and when it finishes.
+# if cancel is given and gets cancelled, the workers are stopped right away and
+# the siteswaps of the tasks that had already finished are returned. a search with
+# cancel runs in a pool of its own, so that stopping it leaves the shared pool alone.
+#
+# the siteswaps can be limited to the ones that don't have any of the throws in exclude,
+# have all of the throws in include (both e.g. [0, 2] or '02'), and go through the ground
+# state or the given state, e.g. 'xx-x' where x is a beat in which a ball lands, starting
+# from now. the constraints are checked inside the search, so the siteswaps that
+# don't satisfy them are never built, and the 'state' engine doesn't even look at
+# the throws that are excluded or leave no room for the included ones.
+#
+# with as_array=True the siteswaps come back as an (N, period) uint8 numpy array of throws
+# instead of a list of strings. the workers write the throws of every task into a block of
+# shared memory and only the name of the block goes through the pool, so no string per
+# siteswap is pickled, sent over and unpickled. throws_to_siteswaps turns any part of the
+# array back into strings
+def all_siteswaps(balls: int, period: int, max_throw: int = None, workers: int = None,
+                  engine: str = 'composition', progress=None, cancel: CancellationToken = None,
+                  exclude=None, include=None, ground_state: bool = False, state=None,
+                  as_array: bool = False) -> list[str] | np.ndarray:
     if (not max_throw or max_throw > balls * period):
         max_throw = balls * period
 
     _validate_siteswap(balls, period, max_throw)
 
+    if engine not in ENGINES:
+        raise ValueError(f'engine must be one of {", ".join(ENGINES)}!')
+
+    constraints = _constraints(balls, exclude, include, ground_state, state)
+
+    if not workers:
+        workers = os.cpu_count() or 1
+
+    # parallelize searching for siteswaps. the leading
+    # throw is in every siteswap of its task
+    tasks = [task for task in _partition_search(balls, period, max_throw, workers) if task[0] not in constraints[0]]
+
+    if not constraints[0] and not constraints[1] and constraints[2] is None:
+        # nothing to check, so the progress total is counted without the state graph
+        constraints = None
+
+    blocks = _SharedBlocks(len(tasks)) if as_array else None
+
+    if cancel is not None:
+        try:
+            with private_pool(workers) as (pool, events):
+                return _monitored_search(pool, events, tasks, balls, period, max_throw, engine, progress, cancel,
+                                         constraints, blocks)
+        finally:
+            # the workers are gone, remove the blocks of the tasks they were stopped in
+            if blocks is not None:
+                blocks.unlink_unfinished()
+
+    pool = get_pool(workers)
+
+    if progress is not None:
+        return _monitored_search(pool, get_events(pool), tasks, balls, period, max_throw, engine, progress, cancel,
+                                 constraints, blocks)
+
+    results = _submit_tasks(pool, tasks, balls, period, max_throw, engine, constraints=constraints, blocks=blocks)
+
+    if as_array:
+        return _gather_blocks(_block_results(pool, results, blocks), period)
+
     s = []
-    
-    # parallelize searching for siteswaps
-    with Pool() as p:
-        for i in range(balls, max_throw+1):
-            p.apply_async(
-                all_siteswaps_between,
-                (period, balls, max_throw, i, i+1),
-                callback=s.extend
-            )
-        p.close()
-        p.join()
-     
-    return sorted(s, key=lambda item: (len(item), item))
-
-def number_of_juggling_patterns(balls: int, period: int, max_throw: int = None) -> int:
+
+    # every task returns its siteswaps sorted, and the tasks
+    # are in order, so the whole list ends up sorted
+    for result in results:
+        s.extend(wait(pool, result))
+
+    return s
+
+# starts the tasks in the pool, the biggest tasks first. returns the AsyncResults in task order.
+# on_result(k, siteswaps) and on_error(k, exception) are called from the pool's result thread.
+# with blocks, the tasks return blocks of shared memory instead, see _shared_memory_task
+def _submit_tasks(pool, tasks: list[tuple], balls: int, period: int, max_throw: int, engine: str,
+                  on_result=None, on_error=None, constraints: tuple = None,
+                  blocks: '_SharedBlocks' = None) -> list:
+    results = [None] * len(tasks)
+    kwargs = _kernel_constraints(constraints)
+
+    if blocks is not None:
+        on_result = blocks.add
+
+    for k in sorted(range(len(tasks)), key=lambda k: -tasks[k][3]):
+        i, second_start, second_stop, _ = tasks[k]
+        args = (period, balls, max_throw, i, i+1, second_start, second_stop)
+        results[k] = pool.apply_async(
+            _shared_memory_task if blocks is not None else ENGINES[engine],
+            (engine, args, kwargs, blocks.name(k)) if blocks is not None else args,
+            {} if blocks is not None else kwargs,
+            callback=partial(on_result, k) if on_result else None,
+            error_callback=partial(on_error, k) if on_error else None,
+        )
+
+    return results
+
+# same as the end of all_siteswaps, but keeps an eye on the tasks while they run. events is
+# the queue the workers of the pool report to. the tasks that are left when the search is
+# cancelled or fails keep running, it's up to the caller to stop the pool if need be.
+# with blocks, the siteswaps come back as an array like with as_array=True
+def _monitored_search(pool, events, tasks: list[tuple], balls: int, period: int, max_throw: int, engine: str,
+                      progress, cancel: CancellationToken, constraints: tuple = None,
+                      blocks: '_SharedBlocks' = None) -> list[str] | np.ndarray:
+    search_id = next(_search_ids)
+    as_array = blocks is not None
+    started = time.perf_counter()
+    kwargs = _kernel_constraints(constraints)
+
+    if constraints is None:
+        patterns_total = number_of_juggling_patterns(balls, period, max_throw)
+    else:
+        patterns_total = _constrained_count(balls, period, max_throw, *constraints)
+
+    patterns_done = 0
+
+    results = [None] * len(tasks)
+    siteswaps = [None] * len(tasks)
+
+    # the other searches in the pool keep the events of this one from now on
+    subscribe(search_id)
+
+    for k in sorted(range(len(tasks)), key=lambda k: -tasks[k][3]):
+        i, second_start, second_stop, _ = tasks[k]
+        results[k] = pool.apply_async(
+            _monitored_task,
+            (engine, search_id, k, (period, balls, max_throw, i, i+1, second_start, second_stop), kwargs,
+             blocks.name(k) if as_array else None),
+            callback=partial(_add_monitored_block, blocks, k) if as_array else None,
+        )
+
+    running = set(range(len(tasks)))
+    reported = set()
+
+    def event(kind: str, k: int, **kwargs) -> ProgressEvent:
+        tasks_done = len(tasks) - len(running)
+
+        return ProgressEvent(kind, tasks[k][:3], tasks_done, len(tasks), patterns_done,
+                             patterns_total, time.perf_counter() - started, **kwargs)
+
+    def start(k: int) -> None:
+        if k not in reported:
+            reported.add(k)
+            progress(event('start', k))
+
+    try:
+        while running:
+            if cancel is not None and cancel.cancelled:
+                break
+
+            # the tasks that are left went down with the pool
+            check_pool(pool)
+
+            for k, in receive(events, search_id, POLL_INTERVAL):
+                if progress is not None:
+                    start(k)
+
+            for k in [k for k in running if results[k].ready()]:
+                if cancel is not None and cancel.cancelled:
+                    break
+
+                siteswaps[k], wall_time, cpu_time = results[k].get()
+                patterns = siteswaps[k][1] if as_array else len(siteswaps[k])
+                patterns_done += patterns
+                running.remove(k)
+
+                if progress is not None:
+                    # the start event can still be on its way from the worker
+                    start(k)
+                    progress(event('finish', k, patterns=patterns, wall_time=wall_time, cpu_time=cpu_time))
+    except BaseException:
+        # e.g. KeyboardInterrupt or an error in the callback
+        if as_array:
+            blocks.abandon()
+
+        raise
+    finally:
+        unsubscribe(search_id)
+
+    if not as_array:
+        # the siteswaps of the finished tasks, still in order
+        return [x for task in siteswaps if task is not None for x in task]
+
+    try:
+        return _gather_blocks([block for block in siteswaps if block is not None], period)
+    finally:
+        if running:
+            # the blocks of the tasks that finished after the search was cancelled
+            blocks.abandon()
+
+def _add_monitored_block(blocks: '_SharedBlocks', k: int, result: tuple) -> None:
+    blocks.add(k, result[0])
+
+# runs in a worker process
+def _monitored_task(engine: str, search_id: int, k: int, args: tuple,
+                    kwargs: dict = None, block_name: str = None) -> tuple[list[str], float, float]:
+    report(search_id, k)
+
+    wall_time = time.perf_counter()
+    cpu_time = time.process_time()
+
+    if block_name is not None:
+        siteswaps = _shared_memory_task(engine, args, kwargs, block_name)
+    else:
+        siteswaps = ENGINES[engine](*args, **(kwargs or {}))
+
+    return siteswaps, time.perf_counter() - wall_time, time.process_time() - cpu_time
+
+# runs in a worker process. writes the throws of the siteswaps of a task into a new block of
+# shared memory with the given name, one byte per throw, and returns only (name, number of
+# siteswaps). the parent unlinks the block, see _SharedBlocks. the throws of small tasks are
+# returned as bytes instead of a name, see SHARED_MEMORY_MIN_SIZE
+def _shared_memory_task(engine: str, args: tuple, kwargs: dict, name: str) -> tuple[str, int]:
+    from multiprocessing import resource_tracker, shared_memory
+
+    b = ENGINES[engine](*args, packed=True, **(kwargs or {}))
+
+    if len(b) < SHARED_MEMORY_MIN_SIZE:
+        return b, len(b) // args[0]
+
+    block = shared_memory.SharedMemory(name, create=True, size=len(b))
+
+    # the block belongs to the parent, which knows its name even if this worker is stopped
+    # before returning it. the worker's resource tracker must not remove it behind the parent
+    resource_tracker.unregister(block._name, 'shared_memory')
+
+    block.buf[:len(b)] = b
+    block.close()
+
+    return block.name, len(b) // args[0]
+
+# the (name, number of siteswaps) of every task in order. if a task fails, the blocks of the
+# other tasks are removed, the ones that are still running as soon as they finish
+def _block_results(pool, results: list, blocks: '_SharedBlocks') -> list[tuple[str, int]]:
+    try:
+        return [wait(pool, result) for result in results]
+    except BaseException:
+        blocks.abandon()
+        raise
+
+class _SharedBlocks():
+    """
+    The blocks of shared memory of the tasks of a search with as_array=True. The blocks are
+    named after the search and the task, so that the parent can remove them even if the
+    worker is stopped before it returns the name.
+
+    Once the search is abandoned, the blocks that come in later are removed right away.
+    """
+    def __init__(self, tasks: int) -> None:
+        self.prefix = f'siteswap_{secrets.token_hex(6)}_'
+        self.tasks = tasks
+
+        # the blocks that have come in and haven't been removed, by task
+        self.blocks = {}
+        self.finished = set()
+        self.abandoned = False
+
+        # add is called from the pool's result thread
+        self.lock = threading.Lock()
+
+    def name(self, k: int) -> str:
+        return f'{self.prefix}{k}'
+
+    def add(self, k: int, block: tuple) -> None:
+        with self.lock:
+            self.finished.add(k)
+
+            if not self.abandoned:
+                self.blocks[k] = block
+                return
+
+        _release_blocks([block])
+
+    # removes the blocks that have come in and every block that comes in later
+    def abandon(self) -> None:
+        with self.lock:
+            self.abandoned = True
+            blocks = list(self.blocks.values())
+            self.blocks.clear()
+
+        _release_blocks(blocks)
+
+    # removes the blocks of the tasks that never finished. only once their workers are gone
+    def unlink_unfinished(self) -> None:
+        with self.lock:
+            unfinished = [(self.name(k), 0) for k in range(self.tasks) if k not in self.finished]
+
+        _release_blocks(unfinished)
+
+# copies the throws in the blocks of shared memory into one (N, period) array, in
+# order, and removes the blocks. this is the only copy the siteswaps go through
+def _gather_blocks(blocks: list[tuple[str, int]], period: int) -> np.ndarray:
+    from multiprocessing.shared_memory import SharedMemory
+
+    try:
+        throws = np.empty((sum(n for _, n in blocks), period), dtype=np.uint8)
+        offset = 0
+
+        for name, n in blocks:
+            if isinstance(name, bytes):
+                throws[offset:offset+n] = np.frombuffer(name, dtype=np.uint8).reshape(n, period)
+            else:
+                block = SharedMemory(name)
+
+                try:
+                    throws[offset:offset+n] = np.ndarray((n, period), dtype=np.uint8, buffer=block.buf)
+                finally:
+                    block.close()
+
+            offset += n
+    finally:
+        _release_blocks(blocks)
+
+    return throws
+
+def _release_blocks(blocks: list[tuple[str, int]]) -> None:
+    from multiprocessing.shared_memory import SharedMemory
+
+    for name, _ in blocks:
+        if isinstance(name, bytes):
+            continue
+
+        try:
+            block = SharedMemory(name)
+        except FileNotFoundError:
+            continue
+
+        block.close()
+        block.unlink()
+
+# yields the same siteswaps as all_siteswaps, in the same order, as tuples of
+# (chunk, cursor) where chunk is a list of at most chunk_size siteswaps.
+#
+# cursor is a JSON serializable (leading_throw, state) pair that can be saved
+# and passed back in to resume the search right after that chunk
+def iter_siteswaps(balls: int, period: int, max_throw: int = None,
+                   chunk_size: int = 65536, cursor: tuple = None):
+    if (not max_throw or max_throw > balls * period):
+        max_throw = balls * period
+
+    _validate_siteswap(balls, period, max_throw)
+
+    leading_throw, state = (balls, None) if cursor is None else cursor
+
+    # siteswaps come out sorted when going through the leading throws in order
+    for i in range(leading_throw, max_throw+1):
+        for chunk, state in iter_siteswaps_between(period, balls, max_throw, i, i+1, chunk_size, state):
+            if chunk:
+                yield chunk, (i, state) if state is not None else (i+1, None)
+
+# validates and canonicalizes many siteswaps at once with numpy. siteswaps is either an
+# (N, period) array of throws or a list of strings of any lengths. returns a dictionary of
+#
+#   valid:     bool array, True for the valid siteswaps
+#   balls:     int array of the number of balls, -1 for the invalid siteswaps
+#   period:    int array of the minimal periods, e.g. 2 for '4040'
+#   canonical: the siteswaps as they are in all_siteswaps and the database, i.e. the shortest
+#              repeating part rotated to the biggest. for strings a list of strings
+#              (None for the invalid siteswaps), and for an array an (N, period) array of
+#              the biggest rotations of the whole rows, of which the first period throws count
+def analyze_siteswaps(siteswaps) -> dict:
+    if isinstance(siteswaps, np.ndarray):
+        return _analyze_throws(siteswaps)
+
+    siteswaps = list(siteswaps)
+    n = len(siteswaps)
+
+    result = {
+        'valid': np.zeros(n, dtype=bool),
+        'balls': np.full(n, -1, dtype=np.int64),
+        'period': np.zeros(n, dtype=np.int64),
+        'canonical': [None] * n,
+    }
+
+    # siteswaps of the same length are handled together
+    lengths = {}
+
+    for k, siteswap in enumerate(siteswaps):
+        lengths.setdefault(len(siteswap), []).append(k)
+
+    for length, indices in lengths.items():
+        if length == 0:
+            continue
+
+        group = _analyze_throws(siteswaps_to_throws([siteswaps[k] for k in indices], length))
+        canonical = throws_to_siteswaps(np.where(group['valid'][:, None], group['canonical'], 0))
+
+        for key in ('valid', 'balls', 'period'):
+            result[key][indices] = group[key]
+
+        for k, valid, period, siteswap in zip(indices, group['valid'], group['period'], canonical):
+            if valid:
+                result['canonical'][k] = siteswap[:period]
+
+    return result
+
+# with the same constraints as all_siteswaps, counts the siteswaps all_siteswaps would find
+def number_of_juggling_patterns(balls: int, period: int, max_throw: int = None, exclude=None, include=None,
+                                ground_state: bool = False, state=None) -> int:
     if balls < 1 or period < 1:
         return 0
 
+    if exclude or include or ground_state or state is not None:
+        if (not max_throw or max_throw > balls * period):
+            max_throw = balls * period
+
+        if max_throw < balls:
+            return 0
+
+        return _constrained_count(balls, period, max_throw, *_constraints(balls, exclude, include, ground_state, state))
+
     if (not max_throw or max_throw >= balls * period):
         # max_throw is infinity, but in practice it's limited to balls * period
         # in a juggling pattern of minimal period n
-        return int(sum(mobius(period // d) * ((balls+1)**d - balls**d) for d in divisors(period)) // period)
+        return sum(mobius(period // d) * ((balls+1)**d - balls**d) for d in divisors(period)) // period
 
     if max_throw < balls:
         return 0
 
-    M = adjacency_matrix(balls, max_throw)
+    traces = closed_walk_counts(balls, max_throw, period)
+
+    return sum(mobius(period // d) * traces[d-1] for d in divisors(period)) // period
+
+# counts the juggling patterns for every combination of balls, periods and max_throws.
+# the closed walks of each state graph are counted only once for all the periods,
+# in parallel when workers > 1. returns a dictionary with (balls, period, max_throw) as key
+def number_of_juggling_patterns_table(balls: list[int], periods: list[int], max_throws: list[int],
+                                      workers: int = 1) -> dict[tuple[int, int, int], int]:
+    table = {}
+
+    for _, counts in iter_number_of_juggling_patterns_table(balls, periods, max_throws, workers):
+        table.update(counts)
+
+    return table
 
-    return int(sum(mobius(period // d) * np.sum((M ** d).diagonal()) for d in divisors(period)) // period)
+# same as number_of_juggling_patterns_table, but yields (b, counts) for every number of balls
+# in the given order as soon as its counts are ready, where counts has (b, period, max_throw)
+# as key. with workers > 1 the state graphs of all the balls are counted at once, the biggest first
+def iter_number_of_juggling_patterns_table(balls: list[int], periods: list[int], max_throws: list[int],
+                                           workers: int = 1):
+    max_period = max(periods)
+
+    # state graphs that are actually needed, see number_of_juggling_patterns
+    graphs = sorted({(b, t) for b in balls for t in max_throws if b <= t < b * max_period},
+                    key=lambda graph: -comb(graph[1], graph[0]))
+
+    if workers == 1:
+        results = {}
+    else:
+        pool = get_pool(workers)
+        results = {(b, t): pool.apply_async(closed_walk_counts, (b, t, max_period)) for b, t in graphs}
+
+    for b in balls:
+        counts = {}
+
+        for t in max_throws:
+            if (b, t) in results:
+                traces = wait(pool, results[b, t])
+            elif b <= t < b * max_period:
+                traces = closed_walk_counts(b, t, max_period)
+
+            for p in periods:
+                if b <= t < b * p:
+                    counts[b, p, t] = sum(mobius(p // d) * traces[d-1] for d in divisors(p)) // p
+                else:
+                    counts[b, p, t] = number_of_juggling_patterns(b, p, t)
+
+        yield b, counts
 
 def random_siteswap(balls: int, period: int, max_throw: int = None) -> str:
-    if (not max_throw or max_throw > balls * period):
+    return random_siteswaps(balls, period, max_throw, 1)[0]
+
+# draws k siteswaps uniformly at random (with replacement) without a database.
+#
+# a random index is unranked into a closed walk of length period in the juggling
+# state graph, i.e. a siteswap in any of its rotations. siteswaps that are not of
+# minimal period are drawn again and the rest are rotated to their canonical form.
+# every siteswap of minimal period has exactly period rotations, so the draws stay uniform.
+#
+# without a max_throw the state graph would have comb(balls * period, balls) states, so
+# the siteswaps are drawn as juggling sequences instead, see _random_juggling_sequence
+def random_siteswaps(balls: int, period: int, max_throw: int = None, k: int = 1) -> list[str]:
+    unbounded = not max_throw or max_throw >= balls * period
+
+    if unbounded:
         max_throw = balls * period
 
     _validate_siteswap(balls, period, max_throw)
 
-    db = SiteswapDB()
+    if not unbounded:
+        _, _, closed_walks = _sampling_tables(balls, period, max_throw)
 
-    try:
-        b, t, patterns = db.get_header(balls)
+    siteswaps = []
+
+    while len(siteswaps) < k:
+        if unbounded:
+            throws = _random_juggling_sequence(balls, period)
+        else:
+            throws = _unrank_walk(balls, period, max_throw, randrange(0, closed_walks[-1]))
+
+        siteswap = ''.join(int_to_siteswap(x) for x in _sort_sequence(throws))
+
+        if not _substring_is_periodic(siteswap):
+            siteswaps.append(siteswap)
+
+    return siteswaps
+
+# the counting tables of the sampler are kept between calls.
+# closed_walks[i] is the number of closed walks of length period through the states 0..i.
+# the counts are exact python ints, see closed_walk_diagonal
+@lru_cache(maxsize=16)
+def _sampling_tables(balls: int, period: int, max_throw: int) -> tuple:
+    M = adjacency_matrix(balls, max_throw)
+    states = juggling_states(balls, max_throw)
+    closed_walks = list(accumulate(closed_walk_diagonal(M, period)))
+
+    return M, states, closed_walks
+
+# walks[k][u] is the number of walks of length k from state u to the given state.
+# every count is at most degree ** k, so the counts that could overflow int64
+# are python ints in arrays of dtype object. the tables take period * states
+# numbers each, so the cache is limited by bytes, see WALK_CACHE_BYTES
+def _walks_to(balls: int, period: int, max_throw: int, state: int) -> list[np.ndarray]:
+    global _walk_cache_bytes
+
+    key = (balls, period, max_throw, state)
+
+    if key in _walk_cache:
+        _walk_cache.move_to_end(key)
+        return _walk_cache[key]
+
+    walks = _count_walks_to(balls, period, max_throw, state)
+    _walk_cache[key] = walks
+    _walk_cache_bytes += sum(w.nbytes for w in walks)
+
+    # the table that was just counted is kept even if it is bigger than the whole cache
+    while _walk_cache_bytes > WALK_CACHE_BYTES and len(_walk_cache) > 1:
+        _, old = _walk_cache.popitem(last=False)
+        _walk_cache_bytes -= sum(w.nbytes for w in old)
+
+    return walks
+
+def _count_walks_to(balls: int, period: int, max_throw: int, state: int) -> list[np.ndarray]:
+    M, _, _ = _sampling_tables(balls, period, max_throw)
+    degree = max(1, int(np.diff(M.indptr).max()))
+    exact = degree ** (period - 1) >= 2**63
+
+    walks = [np.zeros(M.shape[0], dtype=object if exact else M.dtype)]
+    walks[0][state] = 1
+
+    if exact:
+        # scipy doesn't multiply arrays of dtype object
+        rows = np.repeat(np.arange(M.shape[0]), np.diff(M.indptr))
+
+    for _ in range(period - 1):
+        if exact:
+            w = np.zeros(M.shape[0], dtype=object)
+            np.add.at(w, rows, walks[-1][M.indices] * M.data)
+            walks.append(w)
+        else:
+            walks.append(M @ walks[-1])
+
+    return walks
+
+# turns the r:th closed walk of length period into a list of throws
+def _unrank_walk(balls: int, period: int, max_throw: int, r: int) -> list[int]:
+    M, states, closed_walks = _sampling_tables(balls, period, max_throw)
+
+    # the state the walk starts from and ends in
+    start = bisect_right(closed_walks, r)
+    r -= closed_walks[start-1] if start > 0 else 0
+
+    walks = _walks_to(balls, period, max_throw, start)
+    throws = []
+    u = start
+
+    for k in range(period - 1, -1, -1):
+        # go through the next states, skipping over all the walks through them
+        for v in M.indices[M.indptr[u]:M.indptr[u+1]]:
+            n = int(walks[k][v])
+
+            if r < n:
+                break
+
+            r -= n
+
+        throws.append(_throw_between(int(states[u]), int(states[v]), max_throw))
+        u = v
+
+    return throws
+
+# a juggling sequence of period n with any throws, uniformly at random. a sequence is the
+# permutation s of the beats where the balls land, s(i) = i + t_i mod n, and the number of
+# times c_i that every throw wraps around the period, t_i = s(i) - i + n * c_i. the throws
+# are all >= 0 if c_i >= 1 wherever s(i) < i, and the balls are the sum of the c_i.
+#
+# so for a permutation with d beats where s(i) < i, there are comb(balls - d + n - 1, n - 1)
+# ways to choose the c_i. d is drawn with these weights times the number of permutations
+# with d such beats, which is an eulerian number, and then the permutation and the c_i are
+# drawn uniformly. the weights sum to (balls + 1) ** n - balls ** n, the number of sequences
+def _random_juggling_sequence(balls: int, period: int) -> list[int]:
+    n = period
+    weights = _sequence_weights(balls, n)
+    r = randrange(weights[-1])
+    d = bisect_right(weights, r)
+
+    # the beats where s(i) < i are the excedances of the inverse permutation
+    s = [0] * n
+
+    for i, j in enumerate(_random_permutation(n, d)):
+        s[j] = i
+
+    # the rest of the balls are spread over the c_i with stars and bars
+    bars = sorted(sample(range(balls - d + n - 1), n - 1))
+    extra = [b - a - 1 for a, b in zip([-1] + bars, bars + [balls - d + n - 1])]
+
+    return [s[i] - i + n * (extra[i] + (s[i] < i)) for i in range(n)]
+
+# the cumulative weights of d = 0 .. n-1, see _random_juggling_sequence
+@lru_cache(maxsize=256)
+def _sequence_weights(balls: int, n: int) -> list[int]:
+    eulerian = _eulerian(n)[n]
+
+    return list(accumulate(eulerian[d] * comb(balls - d + n - 1, n - 1) if d <= balls else 0 for d in range(n)))
+
+# eulerian[m][k] is the number of permutations of m elements with k excedances, i.e. s(i) > i.
+# a permutation of m elements is a permutation of m - 1 elements with the last element
+# added as a fixed point or into a cycle, i -> m-1 -> s(i). that keeps the excedances
+# if s(i) > i and adds one otherwise
+@lru_cache(maxsize=16)
+def _eulerian(n: int) -> list[list[int]]:
+    eulerian = [[1]]
+
+    for m in range(1, n + 1):
+        previous = eulerian[-1] + [0]
+        eulerian.append([(k+1) * previous[k] + (m-k) * (previous[k-1] if k > 0 else 0) for k in range(m)])
+
+    return eulerian
+
+# a permutation of n elements with k excedances, uniformly at random. the elements are added
+# one by one, see _eulerian, and whether each one adds an excedance is decided last to first
+def _random_permutation(n: int, k: int) -> list[int]:
+    eulerian = _eulerian(n)
+    adds = []
+
+    for m in range(n, 0, -1):
+        keeps = (k+1) * (eulerian[m-1][k] if k < len(eulerian[m-1]) else 0)
+        adds.append(randrange(eulerian[m][k]) >= keeps)
+        k -= adds[-1]
+
+    s = []
+
+    for m, add in enumerate(reversed(adds)):
+        if add:
+            i = choice([i for i in range(m) if s[i] <= i])
+        else:
+            i = choice([i for i in range(m) if s[i] > i] + [m])
+
+        if i == m:
+            s.append(m)
+        else:
+            s.append(s[i])
+            s[i] = m
+
+    return s
+
+# the states are bitmasks, see juggling_states
+def _throw_between(state: int, next_state: int, max_throw: int) -> int:
+    if not state >> (max_throw - 1):
+        return 0
+
+    # the thrown ball lands where there was no ball before
+    landing = (state << 1) & ((1 << max_throw) - 1)
+
+    return max_throw - (next_state ^ landing).bit_length() + 1
+
+# the shortest throws that take a juggler from one siteswap to another, e.g. transitions('3', '51') => '4'.
+# the transition starts from the state the first siteswap ends in and ends in the state the second one
+# starts from, so the siteswaps are taken in the rotation they are given in. returns '' if the states are
+# the same and None if there is no transition with throws up to max_throw.
+#
+# max_throw defaults to the biggest throw of the two siteswaps. the state graph of every (balls, max_throw)
+# is built only once and the breadth first search from every state is kept, so asking again is fast
+def transitions(from_siteswap: str, to_siteswap: str, max_throw: int = None) -> str:
+    balls, max_throw, (u, v) = _transition_states([from_siteswap, to_siteswap], max_throw)
+    _, states = _state_graph(balls, max_throw)
+    predecessors = _bfs_tree(balls, max_throw, u)
+
+    if u != v and predecessors[v] < 0:
+        return None
+
+    # walk back from the target to the source
+    throws = []
+
+    while v != u:
+        w = int(predecessors[v])
+        throws.append(int_to_siteswap(_throw_between(int(states[w]), int(states[v]), max_throw)))
+        v = w
+
+    return ''.join(reversed(throws))
+
+# the lengths of the shortest transitions between every pair of the siteswaps, see transitions.
+# the element [i, j] is the length of transitions(siteswaps[i], siteswaps[j]), or -1 if there is none
+def transition_matrix(siteswaps: list[str], max_throw: int = None) -> np.ndarray:
+    balls, max_throw, rows = _transition_states(siteswaps, max_throw)
+    M, _ = _state_graph(balls, max_throw)
+
+    from scipy.sparse import csgraph
+
+    # one breadth first search from every different exit state
+    sources = sorted(set(rows))
+    distances = csgraph.shortest_path(M, unweighted=True, indices=sources)
+    distances = distances[np.searchsorted(sources, rows)][:, rows]
+
+    return np.where(np.isinf(distances), -1, distances).astype(np.int64)
+
+# the number of balls, max_throw and the rows in the state graph of the states the siteswaps start from
+def _transition_states(siteswaps: list[str], max_throw: int) -> tuple[int, int, list[int]]:
+    siteswaps = [_siteswap_state(siteswap.lower()) for siteswap in siteswaps]
+    balls = {b for b, _, _ in siteswaps}
+
+    if len(balls) > 1:
+        raise ValueError('siteswaps must have the same number of balls!')
+
+    balls = balls.pop()
+    biggest = max(x for _, x, _ in siteswaps)
+
+    if max_throw is None:
+        max_throw = max(biggest, balls)
+
+    if max_throw < biggest:
+        raise ValueError('maximum throw must be at least the biggest throw of the siteswaps!')
+
+    _validate_siteswap(balls, 1, max_throw)
+
+    return balls, max_throw, [_state_row(state, balls, max_throw) for _, _, state in siteswaps]
+
+# the number of balls, the biggest throw and the state a siteswap starts from. bit m of the
+# state is set if a ball thrown in an earlier repetition of the siteswap lands m beats from now
+@lru_cache(maxsize=4096)
+def _siteswap_state(siteswap: str) -> tuple[int, int, int]:
+    canonical = _canonical_siteswap(siteswap)
+
+    if canonical is None:
+        raise ValueError(f'{siteswap!r} is not a valid siteswap')
+
+    throws = [siteswap_to_int(c) for c in siteswap]
+    period = len(throws)
+    state = 0
+
+    for j, x in enumerate(throws):
+        for landing in range(j + x - period, -1, -period):
+            state |= 1 << landing
+
+    return canonical[1], max(throws), state
+
+@lru_cache(maxsize=4096)
+def _state_row(state: int, balls: int, max_throw: int) -> int:
+    return state_rank(state, balls, max_throw)
+
+@lru_cache(maxsize=16)
+def _state_graph(balls: int, max_throw: int) -> tuple:
+    return adjacency_matrix(balls, max_throw).tocsr(), juggling_states(balls, max_throw)
+
+# the predecessor of every state on a shortest path from the source, or a negative number if there is none
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def _bfs_tree(balls: int, max_throw: int, source: int) -> np.ndarray:
+    from scipy.sparse import csgraph
+
+    M, _ = _state_graph(balls, max_throw)
+    _, predecessors = csgraph.breadth_first_order(M, source, return_predecessors=True)
+
+    return predecessors
+
+# estimates how many siteswaps there are for each leading throw
+def _leading_throw_estimates(balls: int, period: int, max_throw: int) -> list[int]:
+    if comb(max_throw, balls) > MAX_ESTIMATE_STATES:
+        # fall back to treating every leading throw the same
+        return [1] * (max_throw - balls)
+
+    counts = [number_of_juggling_patterns(balls, period, t) for t in range(balls, max_throw+1)]
+
+    return [max(0, y - x) for x, y in zip(counts, counts[1:])]
+
+# splits the search into tasks of (leading_throw, second_start, second_stop, estimate).
+# the leading throws with lots of siteswaps are split further by the second throw
+def _partition_search(balls: int, period: int, max_throw: int, workers: int) -> list[tuple[int, int, int, float]]:
+    if period == 1:
+        return [(balls, 0, -1, 1)]
+
+    leading_throws = range(balls+1, max_throw+1)
+
+    if period == 2 or number_of_juggling_patterns(balls, period) < SPLIT_THRESHOLD:
+        return [(i, 0, -1, 1) for i in leading_throws]
+
+    estimates = _leading_throw_estimates(balls, period, max_throw)
+    target = max(1, sum(estimates) / (workers * TASKS_PER_WORKER))
+    tasks = []
+
+    for i, estimate in zip(leading_throws, estimates):
+        # the second throw is between 0 and the leading throw
+        pieces = min(i+1, max(1, ceil(estimate / target)))
+
+        if pieces == 1:
+            tasks.append((i, 0, -1, estimate))
+            continue
+
+        bounds = [k * (i+1) // pieces for k in range(pieces+1)]
+        tasks.extend((i, x0, x1, estimate / pieces) for x0, x1 in zip(bounds, bounds[1:]))
+
+    return tasks
+
+def _analyze_throws(throws: np.ndarray) -> dict:
+    if throws.ndim != 2:
+        raise ValueError('throws must be an (N, period) array!')
+
+    # throws that can't be written as a symbol make the siteswap invalid
+    symbols = ((throws >= 0) & (throws < 36)).all(axis=1)
+    throws = np.where(symbols[:, None], throws, INVALID_SYMBOL).astype(np.uint8)
+
+    valid = batch_balls_dont_collide(throws)
+    balls = np.where(valid, throws.sum(axis=1, dtype=np.int64) // max(1, throws.shape[1]), -1)
+
+    return {
+        'valid': valid,
+        'balls': balls,
+        'period': batch_minimal_periods(throws),
+        'canonical': batch_sort_sequences(throws),
+    }
+
+# turns the constraints of all_siteswaps into a tuple of (exclude, include, state) where exclude
+# and include are sets of throws, and state is a bitmask where bit m is set if a ball lands
+# m beats from now, or None for any state
+def _constraints(balls: int, exclude, include, ground_state: bool, state) -> tuple[frozenset, frozenset, int]:
+    exclude = _throws(exclude)
+    include = _throws(include)
+
+    if isinstance(state, str):
+        if not state or set(state) - set('x-'):
+            raise ValueError("state must be a string of 'x' and '-', e.g. 'xx-x'!")
+
+        state = sum(1 << m for m, c in enumerate(state) if c == 'x')
+
+    if state is not None and (state < 0 or bin(state).count('1') != balls):
+        raise ValueError('state must have as many balls as the siteswaps!')
+
+    if ground_state:
+        if state is not None and state != (1 << balls) - 1:
+            raise ValueError('state and ground_state can\'t both be given!')
+
+        state = (1 << balls) - 1
+
+    return exclude, include, state
+
+def _throws(throws) -> frozenset:
+    throws = frozenset(siteswap_to_int(x) if isinstance(x, str) else x for x in throws or [])
+
+    if any(not 0 <= x <= 35 for x in throws):
+        raise ValueError('throws must be between 0-35!')
+
+    return throws
+
+# the constraints as the arguments of the search functions
+def _kernel_constraints(constraints: tuple) -> dict:
+    if constraints is None:
+        return {}
+
+    exclude, include, state = constraints
+
+    return {
+        'exclude': sum(1 << x for x in exclude),
+        'required': sum(1 << x for x in include),
+        'state': -1 if state is None else state,
+    }
+
+# number_of_juggling_patterns with constraints. the closed walks in the state graph are counted
+# without the edges of the excluded throws. the walks that have all the included throws are
+# counted by inclusion-exclusion over the included throws that are left out, and the walks
+# that go through the state are all the walks minus the ones that avoid it. whether a walk
+# satisfies the constraints doesn't depend on its rotation or on how many times it is
+# repeated, so the mobius inversion of number_of_juggling_patterns still works
+def _constrained_count(balls: int, period: int, max_throw: int, exclude: frozenset,
+                       include: frozenset, state: int) -> int:
+    if state is not None:
+        avoid = state_rank(state, balls, max_throw)
+
+        if avoid is None:
+            # a ball would land later than max_throw allows
+            return 0
 
-        if patterns[period] == 0:
-            print(f"Database file 'db/{balls}.bin' has 0 patterns with period {period}")
-            return
+    walks = [0] * period
 
-        if b == balls and t >= max_throw:
-            # this might be a really expensive operation
-            N = number_of_juggling_patterns(balls, period, max_throw)
+    for r in range(len(include) + 1):
+        for left_out in combinations(sorted(include), r):
+            excluded = exclude | frozenset(left_out)
+            counts = closed_walk_counts(balls, max_throw, period, excluded)
 
-            if patterns[period] >= N:
-                random_number = randrange(0, N)
-                siteswap = db.get_siteswap(random_number, balls, period)
+            if state is not None:
+                avoiding = closed_walk_counts(balls, max_throw, period, excluded, avoid)
+                counts = [x - y for x, y in zip(counts, avoiding)]
 
-                return siteswap
+            walks = [w + (-1)**r * x for w, x in zip(walks, counts)]
 
-        print(f"Database file 'db/{balls}.bin' has patterns only up to a max_throw of {t}")
-    except (FileNotFoundError, IsADirectoryError, PermissionError, OSError) as e:
-        print(f"Could not access db file 'db/{balls}.bin'' for random siteswap lookup")
+    return sum(mobius(period // d) * walks[d-1] for d in divisors(period)) // period
 
 def _validate_siteswap(balls: int, period: int, max_throw: int) -> None:
     if balls < 1:
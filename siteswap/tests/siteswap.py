@@ -1,21 +1,1098 @@
 from siteswap import (
+    CancellationToken,
     all_siteswaps,
-    number_of_juggling_patterns
+    analyze_siteswaps,
+    iter_siteswaps,
+    number_of_juggling_patterns,
+    number_of_juggling_patterns_table,
+    random_siteswaps,
+    transition_matrix,
+    transitions,
+)
+from siteswap._helpers._counting import _chinese_remainder, _prime, _traces, closed_walk_counts
+from siteswap._helpers._helper_functions import _canonical_siteswap, adjacency_matrix, juggling_states
+from siteswap._helpers._pool import close_pool, get_events, get_pool, receive, subscribe, unsubscribe
+from siteswap._helpers._siteswap_cython import all_siteswaps_between, state_siteswaps_between
+from siteswap._helpers._util_functions import throws_to_siteswaps
+from siteswap.aio import AsyncSiteswapDB, aiter_siteswaps, all_siteswaps_async
+from siteswap.cli import main
+from siteswap.database import SiteswapDB, SiteswapFileException
+from siteswap.lite import LiteSiteswapDB
+from siteswap.siteswap import (
+    ENGINES,
+    _partition_search,
+    _sampling_tables,
+    _sequence_weights,
+    _submit_tasks,
+    _walk_cache,
 )
 
+from collections import Counter
+from contextlib import redirect_stderr, redirect_stdout
+import asyncio
+import csv
+import io
+import json
+import numpy as np
+import os
+import queue
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
+
+# the full grid of TestAllSiteswaps takes minutes, set SITESWAP_SLOW_TESTS=1 to run it
+SLOW_TESTS = bool(os.environ.get('SITESWAP_SLOW_TESTS'))
 
 class TestAllSiteswaps(unittest.TestCase):
+    def check_counts(self, periods: range, balls: range, max_throw: int) -> None:
+        for period in periods:
+            for b in balls:
+                # max_throw == balls is only valid for period 1
+                for t in range(b if period == 1 else b+1, max_throw):
+                    with self.subTest(period=period, balls=b, max_throw=t):
+                        self.assertEqual(
+                            len(all_siteswaps(b, period, t)), number_of_juggling_patterns(b, period, t)
+                        )
+
     def test_all_siteswaps(self):
-        input('\nWarning: these tests might take a few minutes to run. Press ENTER to continue\n')
-        for period in range(1, 9):
-            for balls in range(1, 9):
-                for max_throw in range(balls, 16):
-                    print(f'Testing period={period} balls={balls} max_throw={max_throw}', end=' ')
-                    self.assertTrue(
-                        len(all_siteswaps(balls, period, max_throw)) == number_of_juggling_patterns(balls, period, max_throw)
-                    )
-                    print('...OK')
+        self.check_counts(range(1, 7), range(1, 5), 10)
+
+    @unittest.skipUnless(SLOW_TESTS, 'set SITESWAP_SLOW_TESTS=1 to run')
+    def test_all_siteswaps_full(self):
+        self.check_counts(range(1, 9), range(1, 9), 16)
+
+class TestSplitSearch(unittest.TestCase):
+    def test_second_throw_split(self):
+        for balls, period, max_throw in [(2, 5, 6), (3, 6, 8), (4, 4, 7)]:
+            for i in range(balls, max_throw+1):
+                expected = all_siteswaps_between(period, balls, max_throw, i, i+1)
+                siteswaps = []
+
+                for x in range(max_throw+1):
+                    siteswaps.extend(all_siteswaps_between(period, balls, max_throw, i, i+1, x, x+1))
+
+                self.assertEqual(siteswaps, expected)
+
+    def test_leading_throw_ranges(self):
+        for balls, period, max_throw in [(2, 2, 4), (2, 5, 6), (3, 6, 8)]:
+            expected = []
+
+            for i in range(max_throw+1):
+                expected.extend(all_siteswaps_between(period, balls, max_throw, i, i+1))
+
+            self.assertEqual(all_siteswaps_between(period, balls, max_throw, 0, 100), expected)
+
+    def test_packed(self):
+        for balls, period, max_throw in [(1, 1, 1), (2, 5, 6), (3, 6, 8)]:
+            expected = all_siteswaps_between(period, balls, max_throw, 0, 100)
+            packed = all_siteswaps_between(period, balls, max_throw, 0, 100, packed=True)
+
+            self.assertEqual(len(packed), len(expected) * period)
+            self.assertEqual([bytes(int(c, 36) for c in s) for s in expected],
+                             [packed[k:k+period] for k in range(0, len(packed), period)])
+
+    def test_workers(self):
+        expected = all_siteswaps(3, 6, 8)
+
+        for workers in (1, 2):
+            self.assertEqual(all_siteswaps(3, 6, 8, workers=workers), expected)
+
+    def test_as_array(self):
+        shm = '/dev/shm'
+        blocks = set(os.listdir(shm)) if os.path.isdir(shm) else set()
+
+        for engine in ENGINES:
+            for workers in (1, 2):
+                for balls, period, max_throw in [(3, 6, 8), (3, 1, 3), (1, 5, 2)]:
+                    throws = all_siteswaps(balls, period, max_throw, workers=workers, engine=engine, as_array=True)
+
+                    self.assertEqual(throws.shape, (number_of_juggling_patterns(balls, period, max_throw), period))
+                    self.assertEqual(throws_to_siteswaps(throws),
+                                     all_siteswaps(balls, period, max_throw, workers=workers, engine=engine))
+
+        # these tasks are big enough to go through shared memory
+        throws = all_siteswaps(3, 12, 7, workers=2, engine='state', as_array=True)
+        self.assertEqual(throws_to_siteswaps(throws), all_siteswaps(3, 12, 7, workers=2, engine='state'))
+
+        # constraints and progress go through the same blocks
+        throws = all_siteswaps(3, 5, 7, workers=2, exclude=[0], include=[5], as_array=True)
+        self.assertEqual(throws_to_siteswaps(throws), all_siteswaps(3, 5, 7, workers=2, exclude=[0], include=[5]))
+
+        events = []
+        throws = all_siteswaps(3, 6, 8, workers=2, progress=events.append, as_array=True)
+        self.assertEqual(throws_to_siteswaps(throws), all_siteswaps(3, 6, 8))
+        self.assertEqual(events[-1].patterns_done, len(throws))
+
+        # the blocks of the tasks that finish after the search is cancelled, and of the
+        # tasks whose workers are stopped half way through, are removed as well
+        for _ in range(3):
+            cancel = CancellationToken()
+
+            def progress(event):
+                if event.kind == 'finish':
+                    cancel.cancel()
+
+            throws = all_siteswaps(3, 12, 7, workers=2, engine='state', progress=progress, cancel=cancel,
+                                   as_array=True)
+            self.assertTrue(set(throws_to_siteswaps(throws)) < set(all_siteswaps(3, 12, 7, engine='state')))
+
+        # the workers' blocks of shared memory are removed
+        if os.path.isdir(shm):
+            self.assertEqual(set(os.listdir(shm)) - blocks, set())
+
+class TestStateEngine(unittest.TestCase):
+    def test_same_as_composition(self):
+        for balls in range(1, 5):
+            for period in range(1, 8):
+                for max_throw in range(balls+1, min(balls * period, 12)+1):
+                    self.assertEqual(all_siteswaps(balls, period, max_throw, engine='state'),
+                                     all_siteswaps(balls, period, max_throw))
+
+    def test_ranges(self):
+        for balls, period, max_throw in [(2, 2, 4), (2, 5, 6), (3, 6, 8)]:
+            for i in range(max_throw+1):
+                for x in range(max_throw+1):
+                    args = (period, balls, max_throw, i, i+1, x, x+1)
+
+                    self.assertEqual(state_siteswaps_between(*args), all_siteswaps_between(*args))
+                    self.assertEqual(state_siteswaps_between(*args, packed=True),
+                                     all_siteswaps_between(*args, packed=True))
+
+            self.assertEqual(state_siteswaps_between(period, balls, max_throw, 0, 100),
+                             all_siteswaps_between(period, balls, max_throw, 0, 100))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            all_siteswaps(3, 3, 5, engine='unknown')
+
+# the state a siteswap starts from, bit m is set if a ball thrown before the pattern starts lands m beats from now
+def start_state(siteswap: str) -> int:
+    throws = [int(c, 36) for c in siteswap]
+    period = len(throws)
+    state = 0
+
+    for j, x in enumerate(throws):
+        for landing in range(j + x - period, -1, -period):
+            state |= 1 << landing
+
+    return state
+
+# the states a siteswap goes through, as strings of 'x' and '-' starting from now
+def juggling_states_of(siteswap: str) -> set[str]:
+    state = start_state(siteswap)
+    states = set()
+
+    for x in (int(c, 36) for c in siteswap):
+        states.add(''.join('x' if state >> m & 1 else '-' for m in range(state.bit_length())))
+        state = state >> 1 | (1 << x-1 if x else 0)
+
+    return states
+
+class TestConstraints(unittest.TestCase):
+    def test_constraints(self):
+        constraints = [
+            {'exclude': [0, 2]},
+            {'exclude': '1', 'include': '5'},
+            {'include': [0, 6]},
+            {'ground_state': True},
+            {'state': 'xx-x'},
+            {'exclude': [0], 'ground_state': True},
+            {'include': [7], 'state': 'x-xx'},
+        ]
+
+        for balls, period, max_throw in [(3, 5, 7), (3, 6, 8), (4, 4, 9), (3, 1, 3)]:
+            siteswaps = all_siteswaps(balls, period, max_throw)
+
+            for c in constraints:
+                exclude = {int(x, 36) if isinstance(x, str) else x for x in c.get('exclude', [])}
+                include = {int(x, 36) if isinstance(x, str) else x for x in c.get('include', [])}
+                state = 'x' * balls if c.get('ground_state') else c.get('state')
+
+                if state and state.count('x') != balls:
+                    continue
+
+                expected = [s for s in siteswaps
+                            if not exclude & {int(x, 36) for x in s}
+                            and include <= {int(x, 36) for x in s}
+                            and (state is None or state in juggling_states_of(s))]
+
+                with self.subTest(balls=balls, period=period, max_throw=max_throw, **c):
+                    for engine in ('composition', 'state'):
+                        self.assertEqual(all_siteswaps(balls, period, max_throw, engine=engine, **c), expected)
+
+                    self.assertEqual(number_of_juggling_patterns(balls, period, max_throw, **c), len(expected))
+
+    def test_progress(self):
+        events = []
+        siteswaps = all_siteswaps(3, 7, 8, workers=2, progress=events.append, exclude=[0])
+
+        self.assertEqual(siteswaps, [s for s in all_siteswaps(3, 7, 8) if '0' not in s])
+        self.assertEqual(events[-1].patterns_total, len(siteswaps))
+
+    def test_invalid_constraints(self):
+        for c in ({'exclude': [36]}, {'state': 'xxy'}, {'state': 'xx'}, {'ground_state': True, 'state': 'xx-x'}):
+            with self.subTest(**c), self.assertRaises(ValueError):
+                all_siteswaps(3, 3, 5, **c)
+
+class TestPool(unittest.TestCase):
+    def test_different_workers(self):
+        expected = all_siteswaps(3, 10, 9, workers=1)
+        results = {}
+
+        # asking for a pool of another size doesn't stop the searches running in the old one
+        search = threading.Thread(target=lambda: results.update(siteswaps=all_siteswaps(3, 10, 9, workers=2)))
+        search.start()
+        time.sleep(0.05)
+
+        self.assertEqual(all_siteswaps(3, 5, 7, workers=3), all_siteswaps(3, 5, 7, workers=1))
+
+        search.join(60)
+        self.assertFalse(search.is_alive())
+        self.assertEqual(results['siteswaps'], expected)
+
+    def test_closed(self):
+        started = threading.Event()
+        errors = []
+
+        def search():
+            try:
+                all_siteswaps(3, 11, 9, workers=2, progress=lambda event: started.set())
+            except RuntimeError as e:
+                errors.append(e)
+
+        # a search waiting for the tasks of a pool that is shut down fails instead of hanging
+        thread = threading.Thread(target=search)
+        thread.start()
+        started.wait(60)
+        close_pool()
+
+        thread.join(60)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+
+        errors = []
+        started.clear()
+
+        def search():
+            try:
+                all_siteswaps(3, 11, 9, workers=2)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=search)
+        thread.start()
+
+        # the tasks are submitted once the search has a pool
+        while thread.is_alive() and get_events() is None:
+            time.sleep(0.01)
+
+        time.sleep(0.2)
+        close_pool()
+
+        thread.join(60)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+
+    def test_receive(self):
+        events = queue.Queue()
+
+        for event in [(-1, 0), (-2, 1), (-3, 2), (-1, 3)]:
+            events.put(event)
+
+        subscribe(-1)
+        subscribe(-2)
+
+        try:
+            self.assertEqual(receive(events, -1, 0.01), [(0,), (3,)])
+
+            # the event of the other search is kept for it, the one of a search that isn't
+            # following its tasks is dropped
+            self.assertEqual(receive(events, -2, 0.01), [(1,)])
+            self.assertEqual(receive(events, -2, 0.01), [])
+        finally:
+            unsubscribe(-1)
+            unsubscribe(-2)
+
+class TestProgress(unittest.TestCase):
+    def test_progress(self):
+        events = []
+        siteswaps = all_siteswaps(3, 8, 9, workers=2, progress=events.append)
+
+        self.assertEqual(siteswaps, all_siteswaps(3, 8, 9, workers=2))
+
+        starts = [e for e in events if e.kind == 'start']
+        finishes = [e for e in events if e.kind == 'finish']
+
+        self.assertEqual(len(starts), events[0].tasks_total)
+        self.assertEqual(len(finishes), events[0].tasks_total)
+        self.assertEqual(sum(e.patterns for e in finishes), len(siteswaps))
+        self.assertEqual(finishes[-1].patterns_done, finishes[-1].patterns_total)
+        self.assertEqual(finishes[-1].eta, 0)
+        self.assertTrue(all(e.wall_time >= 0 and e.cpu_time >= 0 for e in finishes))
+
+    def test_unconstrained_total(self):
+        events = []
+
+        # the total of a search without constraints doesn't go through the state graph
+        with unittest.mock.patch('siteswap.siteswap._constrained_count', side_effect=AssertionError):
+            siteswaps = all_siteswaps(3, 6, 8, workers=2, progress=events.append)
+
+        self.assertEqual(events[-1].patterns_total, number_of_juggling_patterns(3, 6, 8))
+        self.assertEqual(events[-1].patterns_done, len(siteswaps))
+
+        events = []
+        siteswaps = all_siteswaps(3, 6, 8, workers=2, progress=events.append, exclude=[0])
+        self.assertEqual(events[-1].patterns_total, len(siteswaps))
+
+    def test_cancel(self):
+        expected = all_siteswaps(3, 8, 9, workers=2)
+        cancel = CancellationToken()
+
+        pending = []
+
+        def progress(event):
+            if event.kind == 'start' and not pending:
+                # a search in the shared pool, running at the same time
+                pending.extend(_submit_tasks(get_pool(2), _partition_search(3, 9, 9, 2), 3, 9, 9, 'composition'))
+
+            if event.kind == 'finish':
+                cancel.cancel()
+
+        siteswaps = all_siteswaps(3, 8, 9, workers=2, progress=progress, cancel=cancel)
+
+        # only the task that finished first is returned
+        self.assertTrue(cancel.cancelled)
+        self.assertLess(len(siteswaps), len(expected))
+        self.assertTrue(set(siteswaps) <= set(expected))
+        self.assertEqual(siteswaps, sorted(siteswaps))
+
+        # the other search wasn't stopped
+        self.assertEqual([x for result in pending for x in result.get(timeout=60)], all_siteswaps(3, 9, 9, workers=2))
+        self.assertEqual(all_siteswaps(3, 8, 9, workers=2), expected)
+
+class TestAnalyzeSiteswaps(unittest.TestCase):
+    def test_strings(self):
+        symbols = '0123456789abcdefX?'
+        siteswaps = [''.join(random.choices(symbols, k=random.randint(0, 12))) for _ in range(5000)]
+        siteswaps += ['441', '144144', '4040', 'DB', '0', '']
+
+        result = analyze_siteswaps(siteswaps)
+
+        for k, siteswap in enumerate(siteswaps):
+            expected = _canonical_siteswap(siteswap) if siteswap else None
+
+            self.assertEqual(result['valid'][k], expected is not None)
+
+            if expected is not None:
+                self.assertEqual((result['canonical'][k], result['balls'][k]), expected)
+                self.assertEqual(result['period'][k], len(expected[0]))
+            else:
+                self.assertIsNone(result['canonical'][k])
+                self.assertEqual(result['balls'][k], -1)
+
+    def test_array(self):
+        expected = all_siteswaps(3, 8, 7)
+        throws = np.array([[int(c, 36) for c in s] for s in expected])
+
+        # rotate every row by a different amount
+        shifts = np.arange(len(throws)) % 8
+        rotated = np.take_along_axis(throws, (shifts[:, None] + np.arange(8)) % 8, axis=1)
+
+        result = analyze_siteswaps(rotated)
+
+        self.assertTrue(result['valid'].all())
+        self.assertTrue((result['balls'] == 3).all())
+        self.assertTrue((result['canonical'] == throws).all())
+
+        result = analyze_siteswaps(np.array([[4, 0, 4, 0], [5, 3, 1, 4], [36, 0, 0, 0], [-1, 5, 0, 0]]))
+
+        self.assertEqual(result['valid'].tolist(), [True, False, False, False])
+        self.assertEqual(result['period'][0], 2)
+
+class TestIterSiteswaps(unittest.TestCase):
+    def test_iter_siteswaps(self):
+        for balls, period, max_throw in [(1, 1, 1), (2, 4, 5), (3, 5, 7), (4, 6, 9)]:
+            expected = all_siteswaps(balls, period, max_throw)
+
+            for chunk_size in (1, 5, 1000):
+                chunks = [chunk for chunk, _ in iter_siteswaps(balls, period, max_throw, chunk_size)]
+
+                self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+                self.assertEqual(sum(chunks, []), expected)
+
+    def test_iter_siteswaps_resume(self):
+        expected = all_siteswaps(3, 6, 8)
+
+        siteswaps = []
+        cursor = None
+
+        while True:
+            try:
+                # start over from a saved checkpoint every time
+                chunk, cursor = next(iter_siteswaps(3, 6, 8, 7, cursor))
+                cursor = json.loads(json.dumps(cursor))
+                siteswaps.extend(chunk)
+            except StopIteration:
+                break
+
+        self.assertEqual(siteswaps, expected)
+
+class TestAdjacencyMatrix(unittest.TestCase):
+    def test_adjacency_matrix(self):
+        for balls, max_throw in [(1, 1), (1, 4), (2, 5), (3, 7), (4, 9)]:
+            # bitmasks with balls bits set, from the biggest to the smallest
+            states = [x for x in range(2**max_throw - 1, -1, -1) if bin(x).count('1') == balls]
+            M = adjacency_matrix(balls, max_throw)
+
+            self.assertEqual(juggling_states(balls, max_throw).tolist(), states)
+
+            for i, state in enumerate(states):
+                shifted = (state << 1) % 2**max_throw
+
+                if state >> (max_throw - 1):
+                    expected = [shifted | 1 << k for k in range(max_throw) if not shifted >> k & 1]
+                else:
+                    expected = [shifted]
+
+                self.assertEqual(sorted(states[j] for j in M[i].indices), sorted(expected))
+
+class TestNumberOfJugglingPatterns(unittest.TestCase):
+    def test_stats(self):
+        # from stats/patterns.csv
+        self.assertEqual(number_of_juggling_patterns(3, 20, 15), 44025066776)
+        self.assertEqual(number_of_juggling_patterns(2, 20, 10), 135073251)
+
+    def test_table(self):
+        table = number_of_juggling_patterns_table(range(1, 5), range(1, 9), range(1, 12))
+
+        for (balls, period, max_throw), n in table.items():
+            self.assertEqual(n, number_of_juggling_patterns(balls, period, max_throw))
+
+            if max_throw >= balls and period <= 6 and (period == 1 or max_throw > balls):
+                self.assertEqual(n, len(all_siteswaps(balls, period, max_throw)))
+
+    def test_modular_counting(self):
+        # these counts don't fit into int64
+        M = adjacency_matrix(3, 9).astype(np.int64)
+        moduli = [_prime(0), _prime(1)]
+
+        self.assertIsNone(_traces(M, 40))
+
+        traces = _chinese_remainder([_traces(M, 40, m) for m in moduli], moduli)
+
+        # count with python ints instead
+        A = M.toarray().astype(object)
+        P = A.copy()
+        expected = []
+
+        for _ in range(40):
+            expected.append(sum(P.diagonal()))
+            P = P.dot(A)
+
+        self.assertEqual(traces, expected)
+        self.assertGreater(traces[-1], 2**63)
+
+    def test_block_traces(self):
+        # 210 states, so the diagonal of a block has more than 128 entries. every entry
+        # fits into int64 but their sum doesn't
+        M = adjacency_matrix(4, 10).astype(np.int64)
+        n = M.shape[0]
+
+        # the rows of M ** d as python ints
+        P = [np.eye(n, dtype=np.int64)[i].astype(object) for i in range(n)]
+        expected = []
+
+        for _ in range(30):
+            P = [sum((P[j] * int(x) for j, x in zip(M.indices[M.indptr[i]:M.indptr[i+1]],
+                                                    M.data[M.indptr[i]:M.indptr[i+1]])),
+                     np.zeros(n, dtype=object)) for i in range(n)]
+            expected.append(sum(P[i][i] for i in range(n)))
+
+        self.assertGreater(expected[-1], 2**63)
+        self.assertEqual(closed_walk_counts(4, 10, 30), expected)
+        self.assertEqual(number_of_juggling_patterns(4, 30, 10), 420403474938057709)
+
+class TestRandomSiteswaps(unittest.TestCase):
+    def test_random_siteswaps(self):
+        random.seed(0)
+
+        for balls, period, max_throw in [(3, 1, 3), (1, 2, 2), (3, 3, 5), (2, 4, 6), (3, 6, 8)]:
+            expected = all_siteswaps(balls, period, max_throw)
+            counts = Counter(random_siteswaps(balls, period, max_throw, 200 * len(expected)))
+
+            # every pattern is drawn about 200 times
+            self.assertEqual(set(counts), set(expected))
+            self.assertTrue(all(120 < n < 280 for n in counts.values()))
+
+    def test_unbounded(self):
+        random.seed(0)
+
+        # without a max_throw the siteswaps are drawn without a state graph
+        for balls, period in [(2, 4), (3, 3), (1, 5)]:
+            expected = all_siteswaps(balls, period)
+            counts = Counter(random_siteswaps(balls, period, k=200 * len(expected)))
+
+            self.assertEqual(set(counts), set(expected))
+            self.assertTrue(all(120 < n < 280 for n in counts.values()))
+
+        for balls in range(1, 6):
+            for n in range(1, 9):
+                self.assertEqual(_sequence_weights(balls, n)[-1], (balls + 1) ** n - balls ** n)
+
+        started = time.perf_counter()
+
+        for siteswap in random_siteswaps(4, 8, k=100):
+            self.assertEqual(_canonical_siteswap(siteswap), (siteswap, 4))
+
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_walk_cache(self):
+        with unittest.mock.patch('siteswap.siteswap.WALK_CACHE_BYTES', 1 << 16):
+            random_siteswaps(3, 10, 7, 200)
+
+            # a table per start state, but not all of them
+            self.assertLessEqual(sum(w.nbytes for walks in _walk_cache.values() for w in walks), 1 << 16)
+            self.assertGreater(len(_walk_cache), 1)
+
+    def test_big_counts(self):
+        # the numbers of walks through a single state don't fit into int64
+        _, _, closed_walks = _sampling_tables(3, 40, 9)
+        self.assertEqual(closed_walks[-1], closed_walk_counts(3, 9, 40)[-1])
+        self.assertGreater(closed_walks[0], 2**64)
+
+        random.seed(0)
+
+        for siteswap in random_siteswaps(3, 40, 9, 20):
+            self.assertEqual(_canonical_siteswap(siteswap), (siteswap, 3))
+            self.assertEqual(len(siteswap), 40)
+            self.assertLessEqual(max(siteswap), '9')
+
+class TestTransitions(unittest.TestCase):
+    def test_transitions(self):
+        self.assertEqual(transitions('3', '51'), '4')
+        self.assertEqual(transitions('51', '3'), '2')
+        self.assertEqual(transitions('3', '441'), '')
+        self.assertEqual(transitions('441', '144'), '44')
+
+        for args in (('3', '4'), ('3', '43'), ('3', '51', 3)):
+            with self.assertRaises(ValueError):
+                transitions(*args)
+
+    def test_transition_matrix(self):
+        siteswaps = all_siteswaps(3, 4, 6)
+        lengths = transition_matrix(siteswaps)
+
+        self.assertTrue((lengths.diagonal() == 0).all())
+
+        for i, a in enumerate(siteswaps):
+            for j, b in enumerate(siteswaps):
+                throws = transitions(a, b)
+                state = start_state(a)
+
+                # the transition throws go from where a ends to where b starts without collisions
+                for x in (int(c, 36) for c in throws):
+                    self.assertEqual(state & 1, x > 0)
+                    self.assertFalse(x and state >> x & 1)
+                    state = state >> 1 | (1 << x-1 if x else 0)
+
+                self.assertEqual(state, start_state(b))
+                self.assertEqual(len(throws), lengths[i, j])
+
+class TestSiteswapDB(unittest.TestCase):
+    def test_build(self):
+        with tempfile.TemporaryDirectory() as path:
+            db = SiteswapDB(path)
+            db.build(3, 7, periods=range(1, 7), workers=2)
+
+            _, max_throw, patterns = db.get_header(3)
+
+            self.assertEqual(max_throw, 7)
+
+            for period in range(1, 7):
+                self.assertEqual(patterns[period], number_of_juggling_patterns(3, period, 7))
+                self.assertEqual(db.get_siteswaps(3, period), all_siteswaps(3, period, 7))
+
+    def test_build_resume(self):
+        with tempfile.TemporaryDirectory() as path:
+            db = SiteswapDB(path)
+            filename = os.path.join(path, '3balls.bin')
+
+            # an interrupted build that wrote some garbage after its last checkpoint
+            with open(f'{filename}.part', 'wb') as f:
+                f.write(db._create_header(3, 7) + b'garbage!')
+
+            db._write_json(f'{filename}.part.json', {
+                'balls': 3,
+                'max_throw': 7,
+                'periods': [4, 5],
+                'patterns': {},
+                'period': 4,
+                'tasks': None,
+                'task': 0,
+                'offset': 160,
+            })
+
+            db.build(3, 7, periods=[4, 5], workers=2)
+
+            self.assertFalse(os.path.exists(f'{filename}.part.json'))
+            self.assertEqual(db.get_siteswaps(3, 4), all_siteswaps(3, 4, 7))
+            self.assertEqual(db.get_siteswaps(3, 5), all_siteswaps(3, 5, 7))
+
+    def test_patterns(self):
+        with tempfile.TemporaryDirectory() as path:
+            with SiteswapDB(path) as db:
+                db.build(3, 7, periods=range(1, 6), workers=2)
+
+                for period in range(1, 6):
+                    expected = all_siteswaps(3, period, 7)
+                    siteswaps = db.patterns[3][period]
+
+                    self.assertEqual(len(siteswaps), len(expected))
+                    self.assertEqual(list(siteswaps), expected)
+                    self.assertEqual(list(siteswaps[1::3]), expected[1::3])
+                    self.assertEqual(siteswaps[-1], expected[-1])
+                    self.assertEqual(db.get_siteswap(len(expected) - 1, 3, period), expected[-1])
+
+                self.assertEqual(len(db[3][6]), 0)
+                self.assertEqual(db.get_sequence(3, 2).array.tolist(), [int(s, 16) for s in all_siteswaps(3, 2, 7)])
+
+                with self.assertRaises(IndexError):
+                    db.get_siteswap(10, 3, 3)
+
+    def test_build_v2(self):
+        with tempfile.TemporaryDirectory() as path:
+            with SiteswapDB(path) as db:
+                db.build(3, 7, periods=range(1, 6), workers=2, version=2)
+                db.build(2, 20, periods=[4], workers=2, version=2)
+                db.build(1, 2, periods=[17], workers=2, version=2)
+
+                self.assertEqual(db._open(3).version, 2)
+
+                for period in range(1, 6):
+                    expected = all_siteswaps(3, period, 7)
+
+                    self.assertEqual(db.get_siteswaps(3, period), expected)
+                    self.assertEqual(db.get_siteswap(len(expected) // 2, 3, period), expected[len(expected) // 2])
+                    self.assertEqual(list(db.patterns[3][period][::-2]), expected[::-2])
+
+                # throws above 15
+                self.assertEqual(db.get_header(2)[1], 20)
+                self.assertEqual(db.get_siteswaps(2, 4), all_siteswaps(2, 4, 20))
+
+                # periods above 16
+                self.assertEqual(len(db.get_header(1)[2]), 17)
+                self.assertEqual(db.read_file(os.path.join(path, '1balls.bin'))[17], all_siteswaps(1, 17, 2))
+
+                with self.assertRaises(ValueError):
+                    db.build(3, 16, version=1)
+
+    def test_max_throw_index(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                with SiteswapDB(path) as db:
+                    db.build(3, 7, periods=range(1, 6), workers=2, version=version)
+
+                    for period in range(2, 6):
+                        for max_throw in range(4, 8):
+                            expected = all_siteswaps(3, period, max_throw)
+
+                            self.assertEqual(db.get_siteswaps(3, period, max_throw), expected)
+                            self.assertEqual(db.count(3, period, max_throw), number_of_juggling_patterns(3, period, max_throw))
+
+                        self.assertEqual(db.count(3, period, 3), 0)
+
+                    # periods that are not in the file
+                    for period in (6, 20):
+                        self.assertEqual(db.count(3, period), 0)
+                        self.assertEqual(db.count(3, period, 5), 0)
+
+                # the index is rebuilt from the file if it is missing
+                os.remove(os.path.join(path, '3balls.idx.json'))
+
+                with SiteswapDB(path) as db:
+                    self.assertEqual(db.get_siteswaps(3, 5, 6), all_siteswaps(3, 5, 6))
+                    self.assertTrue(os.path.exists(os.path.join(path, '3balls.idx.json')))
+
+                # an index left from a file with another max throw or format version is not trusted
+                index_filename = os.path.join(path, '3balls.idx.json')
+
+                with open(index_filename, 'r') as g:
+                    saved = json.load(g)
+
+                for key, value in (('max_throw', 8), ('version', 3 - version)):
+                    stale = dict(saved, **{key: value})
+                    stale['offsets'] = {k: [0] * len(v) for k, v in saved['offsets'].items()}
+
+                    with open(index_filename, 'w') as g:
+                        json.dump(stale, g)
+
+                    with SiteswapDB(path) as db:
+                        self.assertEqual(db.get_siteswaps(3, 5, 6), all_siteswaps(3, 5, 6))
+                        self.assertEqual(db.count(3, 4, 5), number_of_juggling_patterns(3, 4, 5))
+
+    def test_get_siteswaps_by_index(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                with SiteswapDB(path) as db:
+                    db.build(3, 8, periods=range(1, 7), workers=2, version=version)
+
+                    expected = db.get_siteswaps(3, 6)
+                    indices = [random.randrange(len(expected)) for _ in range(200)] + [0, len(expected) - 1]
+
+                    siteswaps = db.get_siteswaps_by_index(3, 6, indices)
+                    throws = db.get_siteswaps_by_index(3, 6, indices, as_array=True)
+
+                    self.assertEqual(siteswaps, [expected[i] for i in indices])
+                    self.assertEqual(throws.shape, (len(indices), 6))
+                    self.assertEqual([''.join(f'{x:x}' for x in row) for row in throws], siteswaps)
+                    self.assertEqual(db.get_siteswaps_by_index(3, 6, []), [])
+
+                    with self.assertRaises(IndexError):
+                        db.get_siteswaps_by_index(3, 6, [0, len(expected)])
+
+    def test_index_of(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                with SiteswapDB(path) as db:
+                    db.build(3, 8, periods=range(1, 7), workers=2, version=version)
+
+                    for period in range(1, 7):
+                        for i, siteswap in enumerate(db.get_siteswaps(3, period)):
+                            self.assertEqual(db.index_of(siteswap), i)
+                            self.assertIn(siteswap, db)
+
+                    # any rotation and repetition is found
+                    self.assertEqual(db.index_of('414414'), db.index_of('441'))
+                    self.assertIn('51', db)
+                    self.assertIn('3333333', db)
+
+                    for siteswap in ('43', '', '3x', '9', '900', '4233333'):
+                        self.assertNotIn(siteswap, db)
+
+                    for siteswap in ('43', '90', '900'):
+                        with self.assertRaises(ValueError):
+                            db.index_of(siteswap)
+
+    def test_extend(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                with SiteswapDB(path) as db:
+                    db.build(3, 6, periods=range(1, 7), workers=2, version=version)
+
+                    # 7 takes more bits per throw than 6 in version 2
+                    for max_throw in (7, 9):
+                        db.extend(3, max_throw, workers=2)
+
+                        self.assertEqual(db.get_header(3)[1], max_throw)
+
+                        for period in range(1, 7):
+                            self.assertEqual(db.get_siteswaps(3, period), all_siteswaps(3, period, max_throw))
+                            self.assertEqual(db.count(3, period, 6), number_of_juggling_patterns(3, period, 6))
+
+                    with self.assertRaises(ValueError):
+                        db.extend(3, 8)
+
+                    # periods that have no siteswaps yet are extended only when asked for
+                    db.build(2, 2, periods=range(1, 5), workers=2, version=version)
+                    db.extend(2, 4, periods=range(1, 5), workers=2)
+
+                    for period in range(1, 5):
+                        self.assertEqual(db.get_siteswaps(2, period), all_siteswaps(2, period, 4))
+
+    def test_compress(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                for codec in ('zlib', 'lzma'):
+                    with SiteswapDB(path, cache_blocks=2) as db:
+                        db.build(3, 8, periods=range(1, 7), workers=2, version=version)
+                        expected = {period: db.get_siteswaps(3, period) for period in range(1, 7)}
+
+                        db.compress(3, codec, block_size=20)
+                        os.remove(os.path.join(path, '3balls.bin'))
+                        db.close()
+
+                        for period in range(1, 7):
+                            siteswaps = expected[period]
+                            indices = [len(siteswaps) - 1, 0, len(siteswaps) // 2]
+
+                            self.assertEqual(list(db.get_siteswaps(3, period)), siteswaps)
+                            self.assertEqual(list(db.get_siteswaps(3, period, 6)), all_siteswaps(3, period, 6))
+                            self.assertEqual(list(db.get_sequence(3, period)[19:41]), siteswaps[19:41])
+                            self.assertEqual(db.get_siteswaps_by_index(3, period, indices),
+                                             [siteswaps[i] for i in indices])
+
+                            for i, siteswap in enumerate(siteswaps):
+                                self.assertEqual(db.get_siteswap(i, 3, period), siteswap)
+                                self.assertEqual(db.index_of(siteswap), i)
+
+                        self.assertNotIn('a00', db)
+                        self.assertLessEqual(len(db._cache), 2)
+
+                        # a single read decompresses only the block it is in
+                        db.close()
+                        db.get_siteswap(25, 3, 6)
+                        self.assertEqual(len(db._cache), 1)
+
+                    os.remove(os.path.join(path, '3balls.binz'))
+                    os.remove(os.path.join(path, '3balls.idx.json'))
+
+    def test_shards(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                # two builders splitting the leading throws between them
+                with SiteswapDB(path) as a, SiteswapDB(path) as b:
+                    for period in range(1, 7):
+                        a.build_shard(3, 8, period, stop=6, workers=2, version=version)
+
+                        if period > 1:
+                            b.build_shard(3, 8, period, start=6, workers=2, version=version)
+
+                with SiteswapDB(path) as db:
+                    manifest = db.register_shards(3)
+
+                    self.assertTrue(all(p['complete'] for p in manifest['periods'].values()))
+                    self.assertEqual(db.get_header(3)[1], 8)
+
+                    for period in range(1, 7):
+                        expected = all_siteswaps(3, period, 8)
+                        indices = [len(expected) - 1, 0, len(expected) // 2]
+
+                        self.assertEqual(list(db.get_siteswaps(3, period)), expected)
+                        self.assertEqual(list(db.get_siteswaps(3, period, 6)), all_siteswaps(3, period, 6))
+                        self.assertEqual(db.count(3, period, 7), number_of_juggling_patterns(3, period, 7))
+                        self.assertEqual(list(db.get_sequence(3, period)[1:-1]), expected[1:-1])
+                        self.assertEqual(db.get_siteswaps_by_index(3, period, indices), [expected[i] for i in indices])
+
+                        for i, siteswap in enumerate(expected):
+                            self.assertEqual(db.index_of(siteswap), i)
+
+                    self.assertNotIn('900', db)
+
+                shutil.rmtree(os.path.join(path, '3balls'))
+
+    def test_shards_checksum(self):
+        with tempfile.TemporaryDirectory() as path:
+            db = SiteswapDB(path)
+            entry = db.build_shard(3, 7, 5, workers=2)
+
+            with open(os.path.join(path, '3balls', entry['file']), 'r+b') as f:
+                f.seek(-1, os.SEEK_END)
+                f.write(b'\xff')
+
+            with self.assertRaises(SiteswapFileException):
+                db.register_shards(3)
+
+    def test_missing_period(self):
+        for version in (1, 2, 3):
+            with tempfile.TemporaryDirectory() as path:
+                with SiteswapDB(path) as db:
+                    db.build(3, 7, periods=range(1, 5), workers=2, version=min(version, 2))
+
+                    if version == 3:
+                        db.compress(3)
+
+                dbs = [SiteswapDB(path)] + ([LiteSiteswapDB(path)] if version < 3 else [])
+
+                # periods that are not in the file have no siteswaps
+                for db in dbs:
+                    with db, self.subTest(version=version, db=type(db).__name__):
+                        for period in (5, 20):
+                            self.assertEqual(db.count(3, period), 0)
+                            self.assertEqual(db.get_siteswaps(3, period), [])
+                            self.assertEqual(db.get_siteswaps(3, period, 5), [])
+
+                            with self.assertRaises(IndexError):
+                                db.get_siteswap(0, 3, period)
+
+                        if isinstance(db, SiteswapDB):
+                            self.assertEqual(len(db.get_sequence(3, 20)), 0)
+                            self.assertEqual(db.get_siteswaps_by_index(3, 20, []), [])
+
+class TestLiteSiteswapDB(unittest.TestCase):
+    def test_same_as_siteswapdb(self):
+        with tempfile.TemporaryDirectory() as path:
+            for version in (1, 2):
+                with SiteswapDB(path) as db, LiteSiteswapDB(path) as lite:
+                    db.build(3, 8, periods=range(1, 7), workers=2, version=version)
+
+                    self.assertEqual(lite.get_header(3), db.get_header(3))
+
+                    for period in range(1, 7):
+                        for max_throw in (None, -1, 3, 5, 7, 8):
+                            with self.subTest(version=version, period=period, max_throw=max_throw):
+                                self.assertEqual(lite.count(3, period, max_throw), db.count(3, period, max_throw))
+                                self.assertEqual(lite.get_siteswaps(3, period, max_throw),
+                                                 db.get_siteswaps(3, period, max_throw))
+
+                        for i, siteswap in enumerate(db.get_siteswaps(3, period)):
+                            self.assertEqual(lite.get_siteswap(i, 3, period), siteswap)
+                            self.assertEqual(lite.index_of(siteswap[1:] + siteswap[0]), i)
+
+                    with self.assertRaises(IndexError):
+                        lite.get_siteswap(db.count(3, 6), 3, 6)
+
+                    for period in (7, 20):
+                        self.assertEqual(lite.count(3, period), 0)
+                        self.assertEqual(lite.count(3, period, 5), 0)
+
+                    for siteswap in ('43', '', '3x', '9', '900', '4233333'):
+                        self.assertNotIn(siteswap, lite)
+
+                    with self.assertRaises(ValueError):
+                        lite.index_of('900')
+
+    def test_compressed(self):
+        with tempfile.TemporaryDirectory() as path:
+            with SiteswapDB(path) as db:
+                db.build(3, 7, periods=range(1, 5), workers=2, version=2)
+                db.compress(3)
+
+            os.replace(os.path.join(path, '3balls.binz'), os.path.join(path, '3balls.bin'))
+
+            with LiteSiteswapDB(path) as lite, self.assertRaises(SiteswapFileException):
+                lite.count(3, 3)
+
+    def test_imports(self):
+        # the queries of siteswap.lite don't need numpy, scipy, multiprocessing or the compiled search
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        with tempfile.TemporaryDirectory() as path:
+            with SiteswapDB(path) as db:
+                db.build(3, 7, periods=range(1, 5), workers=2, version=2)
+
+            code = ('import siteswap, sys\n'
+                    'from siteswap.lite import LiteSiteswapDB\n'
+                    f'LiteSiteswapDB({path!r}).index_of("441")\n'
+                    'heavy = ("numpy", "scipy", "multiprocessing", "siteswap._helpers._siteswap_cython")\n'
+                    'print(" ".join(m for m in heavy if m in sys.modules))\n'
+                    'siteswap.all_siteswaps\n'
+                    'print("scipy" in sys.modules)\n')
+
+            out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                 cwd=root, env={**os.environ, 'PYTHONPATH': root}).stdout
+
+            self.assertEqual(out.splitlines(), ['', 'False'])
+
+class TestCLI(unittest.TestCase):
+    def run_cli(self, *argv: str) -> tuple[int, str]:
+        out = io.StringIO()
+
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            code = main(list(argv))
+
+        return code, out.getvalue()
+
+    def test_generate(self):
+        expected = all_siteswaps(3, 6, 7)
+
+        for workers in ('1', '2'):
+            code, out = self.run_cli('generate', '3', '6', '-t', '7', '-w', workers, '--chunk-size', '100')
+            self.assertEqual(code, 0)
+            self.assertEqual(out.splitlines(), expected)
+
+            _, out = self.run_cli('generate', '3', '6', '-t', '7', '-w', workers, '-f', 'json')
+            self.assertEqual(json.loads(out), expected)
+
+            _, out = self.run_cli('generate', '3', '6', '-t', '7', '-w', workers, '-f', 'csv')
+            self.assertEqual(out.splitlines(), ['siteswap'] + expected)
+
+        self.assertEqual(self.run_cli('generate', '3', '2', '-t', '40', '-w', '1')[0], 0)
+        self.assertEqual(self.run_cli('generate', '3', '2', '-t', '2')[0], 1)
+
+    def test_build_db(self):
+        with tempfile.TemporaryDirectory() as path:
+            code, out = self.run_cli('build-db', '3', '-t', '7', '-p', '1-5', '-w', '2',
+                                     '--version', '2', '--path', path, '-f', 'json')
+            self.assertEqual(code, 0)
+            self.assertEqual(json.loads(out), [{'period': p, 'patterns': number_of_juggling_patterns(3, p, 7)}
+                                               for p in range(1, 6)])
+
+            _, out = self.run_cli('info', '3', '-t', '5', '--path', path, '-f', 'csv')
+            self.assertEqual(list(csv.reader(io.StringIO(out)))[1:],
+                             [[str(p), str(number_of_juggling_patterns(3, p, 5))] for p in range(1, 6)])
+
+            _, out = self.run_cli('info', '3', '--path', path)
+            self.assertIn('Total: 129 patterns', out)
+
+            self.assertEqual(self.run_cli('info', '4', '--path', path)[0], 1)
+
+    def test_stats(self):
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, 'patterns.csv')
+            code, _ = self.run_cli('stats', '-b', '1-3', '-p', '1,3-4', '-t', '6', '-f', 'csv', '-o', filename)
+            self.assertEqual(code, 0)
+
+            with open(filename) as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0], ['balls', 'period'] + [f't={t}' for t in range(1, 7)])
+        self.assertEqual(rows[1:], [[f'b={b}', f'p={p}'] + [str(number_of_juggling_patterns(b, p, t))
+                                                            for t in range(1, 7)]
+                                    for b in range(1, 4) for p in (1, 3, 4)])
+
+        _, out = self.run_cli('stats', '-b', '2', '-p', '2', '-t', '3', '-w', '1', '-f', 'json', '--table', 'disk-usage')
+        self.assertEqual(json.loads(out), [{'balls': 2, 'period': 2, 't=1': 0, 't=2': 0, 't=3': 8}])
+
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_all_siteswaps_async(self):
+        expected = all_siteswaps(3, 8, 9)
+
+        # searches running at the same time share the pool
+        results = await asyncio.gather(all_siteswaps_async(3, 8, 9), all_siteswaps_async(3, 8, 9, engine='state'))
+
+        self.assertEqual(results, [expected, expected])
+
+    async def test_aiter_siteswaps(self):
+        chunks = [chunk async for chunk in aiter_siteswaps(3, 6, 8)]
+
+        self.assertTrue(all(chunks))
+        self.assertEqual(sum(chunks, []), all_siteswaps(3, 6, 8))
+
+    async def test_pool_closed(self):
+        siteswaps = aiter_siteswaps(3, 11, 9)
+        first = asyncio.ensure_future(anext(siteswaps))
+        await asyncio.sleep(0)
+
+        # the search doesn't wait forever for the tasks that went down with the pool
+        close_pool()
+
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(first, 60)
+
+        await siteswaps.aclose()
+        self.assertEqual(await all_siteswaps_async(3, 6, 8), all_siteswaps(3, 6, 8))
+
+    async def test_db(self):
+        with tempfile.TemporaryDirectory() as path:
+            SiteswapDB(path).build(3, 8, periods=range(1, 6), workers=1)
+
+            async with AsyncSiteswapDB(path, max_workers=2) as db:
+                expected = db.db.get_siteswaps(3, 5)
+
+                siteswaps = await asyncio.gather(*[db.get_siteswap(i, 3, 5) for i in range(len(expected))])
+                self.assertEqual(siteswaps, expected)
+
+                with self.assertRaises(IndexError):
+                    await db.get_siteswap(len(expected), 3, 5)
+
+                # a bad index in a batch fails only its own call
+                siteswaps = await asyncio.gather(db.get_siteswap(1, 3, 5), db.get_siteswap(-1, 3, 5),
+                                                 db.get_siteswap(0, 3, 5), return_exceptions=True)
+                self.assertEqual(siteswaps[::2], [expected[1], expected[0]])
+                self.assertIsInstance(siteswaps[1], IndexError)
+
+                first, second = await asyncio.gather(db.get_siteswaps(3, 5), db.get_siteswaps(3, 5))
+                self.assertEqual(first, expected)
+                self.assertIsNot(first, second)
+
+                self.assertEqual(await db.get_siteswaps(3, 5, 6), db.db.get_siteswaps(3, 5, 6))
+                self.assertEqual(await db.get_header(3), db.db.get_header(3))
 
 if __name__ == '__main__':
     unittest.main()